@@ -10,6 +10,8 @@ def create_mcp_server():
         "ALB MCP",
         instructions="火山引擎 应用型负载均衡 官方推出的 MCP Server，支持自然语言查询信息和分析数据。",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
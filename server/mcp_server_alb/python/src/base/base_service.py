@@ -1,8 +1,8 @@
 # coding:utf-8
-from .base_trait import BaseTrait  # Modify it if necessary
+from .async_trait import AsyncBaseTrait  # Modify it if necessary
 
 
-class BaseService(BaseTrait):
+class BaseService(AsyncBaseTrait):
     def __init__(self, region='cn-beijing', ak=None, sk=None, service_info_map=None,):
         super().__init__({
             'ak': ak,
@@ -2,6 +2,7 @@ from dataclasses import asdict
 import json
 import aiohttp
 from ..model import *
+from ..transport import get_async_session
 
 Host = "open.feedcoopapi.com"
 ContentType = "application/json"
@@ -14,15 +15,15 @@ async def chat_completion_api_key_auth_api(api_key: str, req: OriginChatCompleti
         "X-Traffic-Tag": f"ark_mcp_server_{tool_name}",
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            url=f"https://{Host}/agent_api/agent/chat/completion",
-            headers=header,
-            timeout=aiohttp.ClientTimeout(total=600),
-            data=json.dumps(asdict(req))
-        ) as response:
-            response.raise_for_status()
-            data = await response.json()
-            return data
-        return None
+    # 复用当前事件循环共享的连接池
+    session = get_async_session()
+    async with session.post(
+        url=f"https://{Host}/agent_api/agent/chat/completion",
+        headers=header,
+        timeout=aiohttp.ClientTimeout(total=600),
+        data=json.dumps(asdict(req))
+    ) as response:
+        response.raise_for_status()
+        data = await response.json()
+        return data
     return None
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from .metrics import Metrics, metrics as default_metrics
+
+
+class UpstreamExecutor:
+    """
+    在有界线程池中执行同步的上游 OpenAPI 调用，避免阻塞事件循环
+
+    超过 max_workers 的调用在队列中等待；每次调用受 timeout 秒限制，
+    并通过 mcp_upstream_in_flight / mcp_upstream_queue_depth 仪表盘暴露执行中与排队中的调用数。
+    """
+
+    def __init__(self, max_workers: int = 32, timeout: Optional[float] = 30,
+                 registry: Metrics = default_metrics):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='upstream')
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queued = 0
+        self._metrics = registry
+        registry.gauge('mcp_upstream_in_flight', lambda: self._in_flight)
+        registry.gauge('mcp_upstream_queue_depth', lambda: self._queued)
+        registry.gauge('mcp_upstream_concurrency_limit', lambda: self.max_workers)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queued
+
+    def _invoke(self, func: Callable[..., Any], args, kwargs) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._in_flight += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _on_done(self, future) -> None:
+        if future.cancelled():
+            # 尚未开始执行即被取消（超时或调用方取消），从队列计数中移除
+            with self._lock:
+                self._queued -= 1
+
+    async def run(self, func: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        在线程池中执行 func(*args, **kwargs) 并等待结果
+
+        Raises:
+            TimeoutError: 调用在 timeout 秒内未完成（未开始执行的调用会被取消）
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            self._queued += 1
+        future = self._pool.submit(self._invoke, func, args, kwargs)
+        future.add_done_callback(self._on_done)
+        self._metrics.inc('mcp_upstream_calls_total')
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self._metrics.inc('mcp_upstream_timeouts_total')
+            raise TimeoutError(f"upstream call timed out after {timeout}s")
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,133 @@
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from mcp.types import Tool
+
+from .local_tool import LocalContext, LocalTool
+from .warehouse import BillWarehouse, DEFAULT_METRIC, DIMENSIONS, METRICS, period_range, shift_period
+
+_warehouses: Dict[Path, BillWarehouse] = {}
+
+_PERIOD_SCHEMA = {"type": "string", "pattern": r"^\d{4}-\d{2}$"}
+_GROUP_BY_SCHEMA = {
+    "type": "array",
+    "items": {"type": "string", "enum": DIMENSIONS},
+    "description": "分组维度，如 [\"Product\"]、[\"BillPeriod\", \"Product\"]、[\"InstanceNo\"]",
+}
+_METRIC_SCHEMA = {
+    "type": "string",
+    "enum": METRICS,
+    "description": f"汇总字段，默认 {DEFAULT_METRIC}（应付金额）",
+}
+_FILTERS_SCHEMA = {
+    "type": "object",
+    "description": "过滤条件，维度名 -> 取值列表，如 {\"Product\": [\"ECS\"], \"Region\": [\"华北2（北京）\"]}",
+}
+
+
+def get_warehouse(context: LocalContext) -> BillWarehouse:
+    path = context.data_dir / 'billing' / 'bills.sqlite'
+    if path not in _warehouses:
+        _warehouses[path] = BillWarehouse(path)
+    return _warehouses[path]
+
+
+def _periods(arguments: Dict[str, Any]) -> List[str]:
+    return period_range(arguments['StartPeriod'], arguments.get('EndPeriod') or arguments['StartPeriod'])
+
+
+async def sync_local_bill(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    warehouse = get_warehouse(context)
+    start = time.perf_counter()
+    periods = await warehouse.sync(context.invoke, context.identity, _periods(arguments),
+                                   force=bool(arguments.get('Force')))
+    return {"Periods": periods, "ElapsedMs": round((time.perf_counter() - start) * 1000, 2)}
+
+
+async def query_local_bill_cost(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    warehouse = get_warehouse(context)
+    periods = _periods(arguments)
+    await warehouse.sync(context.invoke, context.identity, periods)
+    metric = arguments.get('Metric') or DEFAULT_METRIC
+    start = time.perf_counter()
+    rows = warehouse.aggregate(context.identity, periods, arguments.get('GroupBy') or [], metric,
+                               arguments.get('Filters'), arguments.get('Limit') or 100,
+                               ascending=arguments.get('Order') == 'asc')
+    return {"Periods": periods, "Metric": metric, "Rows": rows,
+            "QueryMs": round((time.perf_counter() - start) * 1000, 2)}
+
+
+async def compare_local_bill_cost(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    warehouse = get_warehouse(context)
+    period = arguments['BillPeriod']
+    base_period = arguments.get('BasePeriod') or shift_period(period, -1)
+    await warehouse.sync(context.invoke, context.identity, sorted({period, base_period}))
+    metric = arguments.get('Metric') or DEFAULT_METRIC
+    start = time.perf_counter()
+    rows = warehouse.compare(context.identity, period, base_period, arguments.get('GroupBy') or ['Product'],
+                             metric, arguments.get('Filters'), arguments.get('Limit') or 100)
+    return {"BillPeriod": period, "BasePeriod": base_period, "Metric": metric, "Rows": rows,
+            "QueryMs": round((time.perf_counter() - start) * 1000, 2)}
+
+
+LOCAL_TOOLS = [
+    LocalTool(
+        tool=Tool(
+            name='SyncLocalBill',
+            description="将账期内的账单明细（按天、按计费项）同步到本地账单仓库。已关闭的账期只拉取一次并永久缓存，"
+                        "进行中的账期仅增量拉取上次同步之后的日期。Force 为 true 时重新拉取整个账期。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "StartPeriod": {**_PERIOD_SCHEMA, "description": "起始账期，格式 YYYY-MM"},
+                    "EndPeriod": {**_PERIOD_SCHEMA, "description": "结束账期，格式 YYYY-MM，默认与起始账期相同"},
+                    "Force": {"type": "boolean", "description": "是否强制重新拉取，默认 false"},
+                },
+                "required": ["StartPeriod"],
+            },
+        ),
+        handler=sync_local_bill,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='QueryLocalBillCost',
+            description="基于本地账单仓库按维度分组汇总费用并排序，可用于按产品/实例/账期统计费用、费用 Top N 等。"
+                        "缺失的账期会先自动同步。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "StartPeriod": {**_PERIOD_SCHEMA, "description": "起始账期，格式 YYYY-MM"},
+                    "EndPeriod": {**_PERIOD_SCHEMA, "description": "结束账期，格式 YYYY-MM，默认与起始账期相同"},
+                    "GroupBy": _GROUP_BY_SCHEMA,
+                    "Metric": _METRIC_SCHEMA,
+                    "Filters": _FILTERS_SCHEMA,
+                    "Limit": {"type": "integer", "minimum": 1, "description": "返回的分组数（Top N），默认 100"},
+                    "Order": {"type": "string", "enum": ["desc", "asc"], "description": "按汇总值排序方向，默认 desc"},
+                },
+                "required": ["StartPeriod"],
+            },
+        ),
+        handler=query_local_bill_cost,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='CompareLocalBillCost',
+            description="基于本地账单仓库对比两个账期（默认与上一账期环比）的分组费用，按变化量绝对值排序。"
+                        "缺失的账期会先自动同步。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "BillPeriod": {**_PERIOD_SCHEMA, "description": "账期，格式 YYYY-MM"},
+                    "BasePeriod": {**_PERIOD_SCHEMA, "description": "对比账期，格式 YYYY-MM，默认为上一账期"},
+                    "GroupBy": {**_GROUP_BY_SCHEMA, "description": "分组维度，默认 [\"Product\"]"},
+                    "Metric": _METRIC_SCHEMA,
+                    "Filters": _FILTERS_SCHEMA,
+                    "Limit": {"type": "integer", "minimum": 1, "description": "返回的分组数，默认 100"},
+                },
+                "required": ["BillPeriod"],
+            },
+        ),
+        handler=compare_local_bill_cost,
+    ),
+]
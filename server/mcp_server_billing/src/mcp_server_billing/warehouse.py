@@ -0,0 +1,273 @@
+import asyncio
+import calendar
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .local_tool import ActionInvoker
+
+# 账单明细按天、按计费项拉取，是可聚合出其他维度的最细粒度
+DETAIL_ACTION = 'ListBillDetail'
+DETAIL_PAGE_SIZE = 300
+# 单个账期拉取的条目数上限
+DETAIL_MAX_ITEMS = 10_000_000
+# 新版账单最早账期，所查账期至多距今 24 个月
+EARLIEST_PERIOD = '2022-01'
+MAX_MONTHS_BACK = 24
+# 账期结束后的出账天数，超过后账期视为关闭，数据不再变化
+DEFAULT_CLOSE_DAYS = 3
+# 进行中账期按天增量拉取时的并发天数
+DAY_CONCURRENCY = 4
+
+# 可分组/过滤的维度，列名与 ListBillDetail 返回字段一致
+DIMENSIONS = [
+    'BillPeriod', 'ExpenseDate', 'Product', 'ProductZh', 'BillingMode', 'BillCategory',
+    'InstanceNo', 'InstanceName', 'Region', 'Zone', 'Project', 'OwnerID', 'PayerID',
+    'Element', 'ConfigName', 'Currency',
+]
+# 可聚合的金额/用量字段，入库时转换为数值
+METRICS = [
+    'PayableAmount', 'DiscountBillAmount', 'OriginalBillAmount', 'PreferentialBillAmount',
+    'PaidAmount', 'CouponAmount', 'Count',
+]
+DEFAULT_METRIC = 'PayableAmount'
+
+_COLUMNS = ['Account'] + DIMENSIONS + METRICS
+
+
+def parse_period(period: str) -> Tuple[int, int]:
+    try:
+        year, month = period.split('-')
+        year, month = int(year), int(month)
+    except (AttributeError, ValueError):
+        raise ValueError(f"账期格式错误，应为 YYYY-MM: {period}")
+    if not 1 <= month <= 12:
+        raise ValueError(f"账期格式错误，应为 YYYY-MM: {period}")
+    return year, month
+
+
+def format_period(year: int, month: int) -> str:
+    return f'{year:04d}-{month:02d}'
+
+
+def shift_period(period: str, months: int) -> str:
+    year, month = parse_period(period)
+    index = year * 12 + month - 1 + months
+    return format_period(index // 12, index % 12 + 1)
+
+
+def period_range(start: str, end: str) -> List[str]:
+    """[start, end] 之间的所有账期，start 晚于 end 时报错"""
+    if parse_period(start) > parse_period(end):
+        raise ValueError(f"起始账期 {start} 晚于结束账期 {end}")
+    periods = [start]
+    while periods[-1] != end:
+        periods.append(shift_period(periods[-1], 1))
+    return periods
+
+
+def period_days(period: str) -> List[str]:
+    year, month = parse_period(period)
+    return [date(year, month, day).isoformat() for day in range(1, calendar.monthrange(year, month)[1] + 1)]
+
+
+def is_closed(period: str, today: date, close_days: int = DEFAULT_CLOSE_DAYS) -> bool:
+    """账期结束且已过出账天数后，账单不再变化"""
+    year, month = parse_period(shift_period(period, 1))
+    return today >= date(year, month, 1) + timedelta(days=close_days)
+
+
+def check_period(period: str, today: date) -> None:
+    current = format_period(today.year, today.month)
+    if parse_period(period) > parse_period(current):
+        raise ValueError(f"账期 {period} 尚未开始")
+    if parse_period(period) < parse_period(max(EARLIEST_PERIOD, shift_period(current, -MAX_MONTHS_BACK))):
+        raise ValueError(f"账期 {period} 超出可查询范围（最早 {EARLIEST_PERIOD}，至多距今 {MAX_MONTHS_BACK} 个月）")
+
+
+def _to_number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _to_row(account: str, item: Dict[str, Any]) -> Tuple:
+    return (account,
+            *(None if item.get(name) is None else str(item.get(name)) for name in DIMENSIONS),
+            *(_to_number(item.get(name)) for name in METRICS))
+
+
+class BillWarehouse:
+    """
+    本地账单仓库（SQLite）
+
+    已关闭账期的账单明细只拉取一次并永久保存；进行中的账期记录已同步到的日期，
+    后续只按天增量拉取该日期（可能尚未出全）之后的明细。聚合查询全部在本地执行。
+    """
+
+    def __init__(self, path: Union[str, Path], close_days: int = DEFAULT_CLOSE_DAYS):
+        self.path = str(path)
+        self.close_days = close_days
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 同一账号、账期的同步串行执行
+        self._sync_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        columns = ', '.join([f'{name} TEXT' for name in ['Account'] + DIMENSIONS] +
+                            [f'{name} REAL' for name in METRICS])
+        self._conn.execute(f'CREATE TABLE IF NOT EXISTS bill_detail ({columns})')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS bill_detail_period ON bill_detail (Account, BillPeriod)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS bill_detail_date ON bill_detail (Account, ExpenseDate)')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS bill_period ('
+                           'Account TEXT NOT NULL, BillPeriod TEXT NOT NULL, Closed INTEGER NOT NULL, '
+                           'SyncedThrough TEXT, SyncedAt REAL NOT NULL, Rows INTEGER NOT NULL, '
+                           'PRIMARY KEY (Account, BillPeriod))')
+
+    def period_state(self, account: str, period: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute('SELECT Closed, SyncedThrough, SyncedAt, Rows FROM bill_period '
+                                     'WHERE Account = ? AND BillPeriod = ?', (account, period)).fetchone()
+        if row is None:
+            return None
+        return {'BillPeriod': period, 'Closed': bool(row[0]), 'SyncedThrough': row[1],
+                'SyncedAt': row[2], 'Rows': row[3]}
+
+    def store(self, account: str, period: str, items: Iterable[Dict[str, Any]], closed: bool,
+              synced_through: str, dates: Optional[Sequence[str]] = None) -> None:
+        """
+        在一个事务中写入账单明细
+
+        dates 为空时替换整个账期的数据，否则只替换这些日期的数据（增量同步）。
+        """
+        rows = [_to_row(account, item) for item in items]
+        placeholders = ', '.join('?' for _ in _COLUMNS)
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                if dates is None:
+                    self._conn.execute('DELETE FROM bill_detail WHERE Account = ? AND BillPeriod = ?',
+                                       (account, period))
+                else:
+                    self._conn.executemany('DELETE FROM bill_detail WHERE Account = ? AND ExpenseDate = ?',
+                                           [(account, day) for day in dates])
+                self._conn.executemany(f'INSERT INTO bill_detail VALUES ({placeholders})', rows)
+                total = self._conn.execute('SELECT COUNT(*) FROM bill_detail WHERE Account = ? AND BillPeriod = ?',
+                                           (account, period)).fetchone()[0]
+                self._conn.execute('INSERT OR REPLACE INTO bill_period VALUES (?, ?, ?, ?, ?, ?)',
+                                   (account, period, int(closed), synced_through, time.time(), total))
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    async def _fetch(self, invoke: ActionInvoker, period: str, expense_date: Optional[str] = None
+                     ) -> List[Dict[str, Any]]:
+        arguments = {
+            'BillPeriod': period, 'GroupPeriod': 1, 'GroupTerm': 0, 'NeedRecordNum': 1,
+            'Limit': DETAIL_PAGE_SIZE, 'auto_paginate': True, 'max_items': DETAIL_MAX_ITEMS,
+        }
+        if expense_date:
+            arguments['ExpenseDate'] = expense_date
+        resp = await invoke(DETAIL_ACTION, arguments)
+        return resp.get('List') or []
+
+    async def sync_period(self, invoke: ActionInvoker, account: str, period: str, today: date,
+                          force: bool = False) -> Dict[str, Any]:
+        """
+        同步单个账期
+
+        - 已关闭且已同步的账期直接返回
+        - 未同步过或刚关闭的账期整月拉取
+        - 进行中的账期从上次同步到的日期起按天拉取
+        """
+        lock = self._sync_locks.setdefault((account, period), asyncio.Lock())
+        async with lock:
+            closed = is_closed(period, today, self.close_days)
+            state = self.period_state(account, period)
+            if state is not None and state['Closed'] and not force:
+                return dict(state, Fetched=0)
+
+            days = period_days(period)
+            synced_through = days[-1] if closed else min(today.isoformat(), days[-1])
+            if state is None or closed or force:
+                items = await self._fetch(invoke, period)
+                await asyncio.to_thread(self.store, account, period, items, closed, synced_through)
+            else:
+                # 上次同步到的日期可能尚未出全，需要重新拉取
+                dates = [day for day in days if state['SyncedThrough'] <= day <= synced_through]
+                semaphore = asyncio.Semaphore(DAY_CONCURRENCY)
+
+                async def fetch_day(day: str) -> List[Dict[str, Any]]:
+                    async with semaphore:
+                        return await self._fetch(invoke, period, day)
+
+                pages = await asyncio.gather(*(fetch_day(day) for day in dates))
+                items = [item for page in pages for item in page]
+                await asyncio.to_thread(self.store, account, period, items, closed, synced_through, dates)
+            return dict(self.period_state(account, period), Fetched=len(items))
+
+    async def sync(self, invoke: ActionInvoker, account: str, periods: Sequence[str],
+                   today: Optional[date] = None, force: bool = False) -> List[Dict[str, Any]]:
+        today = today or date.today()
+        for period in periods:
+            check_period(period, today)
+        return [await self.sync_period(invoke, account, period, today, force) for period in periods]
+
+    @staticmethod
+    def _where(account: str, periods: Sequence[str], filters: Optional[Dict[str, Any]]
+               ) -> Tuple[str, List[Any]]:
+        clauses = ['Account = ?', f'BillPeriod IN ({", ".join("?" for _ in periods)})']
+        params: List[Any] = [account, *periods]
+        for name, values in (filters or {}).items():
+            if name not in DIMENSIONS:
+                raise ValueError(f"不支持的过滤维度: {name}，可选: {DIMENSIONS}")
+            values = values if isinstance(values, list) else [values]
+            if values:
+                clauses.append(f'{name} IN ({", ".join("?" for _ in values)})')
+                params += [str(value) for value in values]
+        return ' AND '.join(clauses), params
+
+    def aggregate(self, account: str, periods: Sequence[str], group_by: Sequence[str],
+                  metric: str = DEFAULT_METRIC, filters: Optional[Dict[str, Any]] = None,
+                  limit: Optional[int] = None, ascending: bool = False) -> List[Dict[str, Any]]:
+        """按维度分组汇总，按汇总值排序并返回前 limit 组"""
+        for name in group_by:
+            if name not in DIMENSIONS:
+                raise ValueError(f"不支持的分组维度: {name}，可选: {DIMENSIONS}")
+        if metric not in METRICS:
+            raise ValueError(f"不支持的汇总字段: {metric}，可选: {METRICS}")
+        where, params = self._where(account, periods, filters)
+        select = ', '.join(list(group_by) + [f'SUM({metric})', 'COUNT(*)'])
+        sql = f'SELECT {select} FROM bill_detail WHERE {where}'
+        if group_by:
+            sql += f' GROUP BY {", ".join(group_by)}'
+        sql += f' ORDER BY SUM({metric}) {"ASC" if ascending else "DESC"}'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        width = len(group_by)
+        return [dict(zip(group_by, row[:width]), **{metric: round(row[width] or 0.0, 6), 'Records': row[width + 1]})
+                for row in rows if row[width + 1]]
+
+    def compare(self, account: str, period: str, base_period: str, group_by: Sequence[str],
+                metric: str = DEFAULT_METRIC, filters: Optional[Dict[str, Any]] = None,
+                limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """对比两个账期的分组汇总值，按变化量绝对值排序"""
+        current = {tuple(row[name] for name in group_by): row[metric]
+                   for row in self.aggregate(account, [period], group_by, metric, filters)}
+        previous = {tuple(row[name] for name in group_by): row[metric]
+                    for row in self.aggregate(account, [base_period], group_by, metric, filters)}
+        rows = []
+        for key in current.keys() | previous.keys():
+            value, base = current.get(key, 0.0), previous.get(key, 0.0)
+            rows.append(dict(zip(group_by, key), Current=value, Previous=base, Change=round(value - base, 6),
+                             ChangeRate=round((value - base) / base, 6) if base else None))
+        rows.sort(key=lambda row: abs(row['Change']), reverse=True)
+        return rows[:limit] if limit else rows
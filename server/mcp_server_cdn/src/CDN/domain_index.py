@@ -0,0 +1,260 @@
+"""
+CDN 域名与配置的本地索引
+
+刷新时通过 ListCdnDomains 翻页拉取全部加速域名（首页确定总数后其余页并发拉取），按 UpdateTime 找出新增、删除与变更的域名，
+先用列表信息在内存中按源站、特性开关、状态、项目与业务类型建立倒排索引，立即可以查询；
+再在后台任务中调用 DescribeCdnConfig 为新增与变更的域名拉取配置，配置到达后补充索引中的源站与配置开关。
+拉取配置使用独立的速率限制，域名较多时全部配置到达需要 域名数 / MCP_DOMAIN_INDEX_CONFIG_QPS 秒，
+期间查询结果中的 PendingConfigs 为尚未拉取到配置的域名数。查询只读内存中的索引，不访问 OpenAPI。
+
+环境变量：
+- MCP_DOMAIN_INDEX_TTL: 索引的有效期（秒），查询时超过有效期先增量刷新，默认 600
+- MCP_DOMAIN_INDEX_CONFIG_QPS: 拉取 DescribeCdnConfig 的速率上限（次/秒），默认 20
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from .fanout import RateLimiter, gather_limited
+
+DEFAULT_TTL = int(os.getenv("MCP_DOMAIN_INDEX_TTL", "600"))
+CONFIG_QPS = float(os.getenv("MCP_DOMAIN_INDEX_CONFIG_QPS", "20"))
+PAGE_SIZE = 100
+
+Post = Callable[[str, Dict[str, Any], Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def _result(response: Dict[str, Any]) -> Dict[str, Any]:
+    return response.get("Result") or {}
+
+
+def _addresses(value: Any) -> Iterable[str]:
+    """配置中 Address 字段的全部取值（源站地址）"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "Address" and isinstance(item, str):
+                yield item
+            else:
+                yield from _addresses(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _addresses(item)
+
+
+def origins(summary: Dict[str, Any], config: Optional[Dict[str, Any]]) -> Set[str]:
+    hosts = set()
+    for key in ("PrimaryOrigin", "BackupOrigin"):
+        value = summary.get(key) or []
+        for item in value if isinstance(value, list) else str(value).split(","):
+            if item:
+                hosts.add(str(item).strip().lower())
+    if config:
+        hosts.update(address.lower() for address in _addresses(config.get("Origin")))
+    return hosts
+
+
+def features(summary: Dict[str, Any], config: Optional[Dict[str, Any]]) -> Dict[str, bool]:
+    """特性开关：列表中的布尔字段，以及配置中带 Switch 字段的顶层配置项"""
+    flags = {key: value for key, value in summary.items() if isinstance(value, bool)}
+    for key, value in (config or {}).items():
+        if isinstance(value, dict) and isinstance(value.get("Switch"), bool):
+            flags[key] = value["Switch"]
+    return flags
+
+
+class DomainIndex:
+    """
+    域名索引
+
+    domains 保存每个域名的列表信息与配置；倒排索引把源站、特性、状态、项目与业务类型映射到域名集合，
+    查询时对各条件的域名集合求交集。pending 为等待后台拉取配置的域名。
+    """
+
+    def __init__(self, ttl: int = DEFAULT_TTL, config_qps: float = CONFIG_QPS):
+        self.ttl = ttl
+        self.config_limiter = RateLimiter(config_qps)
+        self.pending: Set[str] = set()
+        self.domains: Dict[str, Dict[str, Any]] = {}
+        self.by_origin: Dict[str, Set[str]] = {}
+        self.by_feature: Dict[tuple, Set[str]] = {}
+        self.by_field: Dict[tuple, Set[str]] = {}
+        self.built_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._crawl: Optional[asyncio.Task] = None
+
+    def expired(self) -> bool:
+        return time.time() >= self.built_at + self.ttl
+
+    def _unindex(self, domain: str) -> None:
+        entry = self.domains.pop(domain, None)
+        if entry is None:
+            return
+        for index, keys in ((self.by_origin, entry["origins"]), (self.by_feature, entry["features"].items()),
+                            (self.by_field, entry["fields"].items())):
+            for key in keys:
+                members = index.get(key)
+                if members is not None:
+                    members.discard(domain)
+                    if not members:
+                        del index[key]
+
+    def put(self, summary: Dict[str, Any], config: Optional[Dict[str, Any]]) -> None:
+        domain = summary["Domain"]
+        self._unindex(domain)
+        entry = {
+            "summary": summary,
+            "config": config,
+            "origins": origins(summary, config),
+            "features": features(summary, config),
+            "fields": {name: str(summary.get(name)) for name in ("Status", "Project", "ServiceType", "ServiceRegion")
+                       if summary.get(name) is not None},
+        }
+        self.domains[domain] = entry
+        for origin in entry["origins"]:
+            self.by_origin.setdefault(origin, set()).add(domain)
+        for flag in entry["features"].items():
+            self.by_feature.setdefault(flag, set()).add(domain)
+        for field in entry["fields"].items():
+            self.by_field.setdefault(field, set()).add(domain)
+
+    async def _list(self, post: Post) -> List[Dict[str, Any]]:
+        first = _result(await post("McpListCdnDomains", {}, {"PageNum": 1, "PageSize": PAGE_SIZE}))
+        pages = -(-int(first.get("Total") or 0) // PAGE_SIZE)
+        rest = await gather_limited([lambda page=page: post("McpListCdnDomains", {}, {"PageNum": page, "PageSize": PAGE_SIZE})
+                                     for page in range(2, pages + 1)])
+        domains: Dict[str, Dict[str, Any]] = {}
+        for result in [first] + [_result(response) for response in rest]:
+            for item in result.get("Data") or []:
+                domains[item["Domain"]] = item
+        return list(domains.values())
+
+    async def _configs(self, post: Post, domains: List[str]) -> List[Optional[Dict[str, Any]]]:
+        async def describe(domain):
+            try:
+                return _result(await post("McpDescribeCdnConfig", {}, {"Domain": domain})).get("DomainConfig")
+            except Exception:
+                # 单个域名配置拉取失败时只保留列表信息，下次刷新重试
+                return None
+
+        return await gather_limited([lambda domain=domain: describe(domain) for domain in domains],
+                                    rate_limiter=self.config_limiter)
+
+    async def _crawl_configs(self, post: Post) -> None:
+        """拉取 pending 中域名的配置，刷新期间新加入 pending 的域名在下一轮拉取"""
+        while self.pending:
+            batch = sorted(self.pending)
+            versions = {domain: self.domains[domain]["summary"].get("UpdateTime") for domain in batch
+                        if domain in self.domains}
+            for domain, config in zip(batch, await self._configs(post, batch)):
+                entry = self.domains.get(domain)
+                # 拉取期间被删除的域名不再写回
+                if entry is not None:
+                    self.put(entry["summary"], config if config is not None else entry["config"])
+            # 拉取期间 UpdateTime 又发生变化的域名留在 pending 中，下一轮重新拉取
+            self.pending.difference_update(domain for domain in batch if domain not in self.domains
+                                           or self.domains[domain]["summary"].get("UpdateTime") == versions.get(domain))
+
+    def _start_crawl(self, post: Post) -> Optional[asyncio.Task]:
+        if self.pending and (self._crawl is None or self._crawl.done()):
+            self._crawl = asyncio.create_task(self._crawl_configs(post))
+        return self._crawl
+
+    async def wait_configs(self) -> None:
+        """等待后台的配置拉取完成"""
+        while self._crawl is not None and not self._crawl.done():
+            await asyncio.shield(self._crawl)
+
+    async def refresh(self, post: Post, full: bool = False, wait: bool = False) -> Dict[str, Any]:
+        """
+        刷新索引，返回新增、删除与变更的域名
+
+        域名列表在返回前更新，配置在后台任务中拉取；wait 为 True 时等待全部配置拉取完成再返回。
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            begin = time.perf_counter()
+            listed = await self._list(post)
+            current = {item["Domain"]: item for item in listed}
+            changes: Dict[str, List[str]] = {"Added": [], "Removed": [], "Updated": []}
+            if full:
+                stale = list(current)
+                changes["Added"] = [domain for domain in current if domain not in self.domains]
+                changes["Updated"] = [domain for domain in current if domain in self.domains]
+            else:
+                stale = []
+                for domain, item in current.items():
+                    entry = self.domains.get(domain)
+                    if domain in self.pending and entry is not None:
+                        # 已在等待拉取配置，只更新列表信息
+                        if entry["summary"].get("UpdateTime") != item.get("UpdateTime"):
+                            changes["Updated"].append(domain)
+                        self.put(item, entry["config"])
+                        continue
+                    if entry is None:
+                        changes["Added"].append(domain)
+                    elif entry["summary"].get("UpdateTime") != item.get("UpdateTime") or entry["config"] is None:
+                        changes["Updated"].append(domain)
+                    else:
+                        continue
+                    stale.append(domain)
+            for domain in [domain for domain in self.domains if domain not in current]:
+                self._unindex(domain)
+                self.pending.discard(domain)
+                changes["Removed"].append(domain)
+            for domain in stale:
+                # 先按列表信息建立索引，保留已有的配置直到新的配置到达
+                entry = self.domains.get(domain)
+                self.put(current[domain], entry["config"] if entry is not None else None)
+            self.pending.update(stale)
+            self.built_at = time.time()
+            self._start_crawl(post)
+        if wait:
+            await self.wait_configs()
+        return dict(changes, Domains=len(self.domains), ConfigRequests=len(stale), PendingConfigs=len(self.pending),
+                    ElapsedMs=round((time.perf_counter() - begin) * 1000, 1))
+
+    async def ensure(self, post: Post) -> Optional[Dict[str, Any]]:
+        """索引为空时构建，过期时增量刷新；只等待域名列表，配置在后台拉取"""
+        if not self.built_at or self.expired():
+            return await self.refresh(post)
+        return None
+
+    def query(self, origin: Optional[str] = None, feature: Optional[str] = None, enabled: bool = True,
+              status: Optional[str] = None, project: Optional[str] = None, service_type: Optional[str] = None,
+              domain: Optional[str] = None) -> List[str]:
+        """各条件取交集，origin 精确匹配源站地址，也可以是以 * 开头的后缀（如 *.example.com）"""
+        candidates: List[Set[str]] = []
+        if origin:
+            origin = origin.lower()
+            if origin.startswith("*"):
+                suffix = origin[1:]
+                candidates.append(set().union(*(members for host, members in self.by_origin.items()
+                                                if host.endswith(suffix))))
+            else:
+                candidates.append(self.by_origin.get(origin, set()))
+        if feature:
+            candidates.append(self.by_feature.get((feature, enabled), set()))
+        for name, value in (("Status", status), ("Project", project), ("ServiceType", service_type)):
+            if value:
+                candidates.append(self.by_field.get((name, value), set()))
+        result = set.intersection(*candidates) if candidates else set(self.domains)
+        if domain:
+            result = {name for name in result if domain in name}
+        return sorted(result)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "Domains": len(self.domains),
+            "WithConfig": sum(1 for entry in self.domains.values() if entry["config"] is not None),
+            "PendingConfigs": len(self.pending),
+            "Origins": len(self.by_origin),
+            "Features": sorted({name for name, _ in self.by_feature}),
+            "BuiltAt": int(self.built_at),
+            "ExpiresAt": int(self.built_at + self.ttl),
+        }
+
+
+index = DomainIndex()
@@ -0,0 +1,194 @@
+"""
+CDN 数据统计请求扇出
+
+DescribeEdgeData / DescribeOriginData 单次请求的统计时间段与加速域名数量受限（时间粒度为 1min 时不超过 1 天、
+5min 时不超过 3 天、hour/day 时不超过 31 天；每次最多 50 个域名）。超出限制的请求按允许的时间窗口与域名批次拆分，
+在速率限制下并发请求，再把同一条曲线的数据点按时间戳合并为一个响应：
+- 不同时间窗口的数据点按时间戳去重拼接；
+- 不同域名批次的同一时间点的数据累加，只对可以累加的指标拆分域名批次（流量、请求数、状态码数量，
+  以及 1min/5min 粒度的带宽与 QPS），命中率、响应时间等指标超过 50 个域名时直接报错。
+
+环境变量：
+- MCP_FANOUT_QPS: 扇出请求的速率上限（次/秒），默认 10
+- MCP_FANOUT_CONCURRENCY: 扇出请求的并发数，默认 8
+
+运行 `python -m src.CDN.fanout` 在模拟的上游延迟下对比逐个请求与并发扇出的耗时。
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+QPS = float(os.getenv("MCP_FANOUT_QPS", "10"))
+CONCURRENCY = int(os.getenv("MCP_FANOUT_CONCURRENCY", "8"))
+MAX_DOMAINS = 50
+
+INTERVAL_SECONDS = {"1min": 60, "5min": 300, "hour": 3600, "day": 86400}
+# 各时间粒度下单次请求允许的最大统计时间段（秒）
+MAX_SPAN = {"1min": 86400, "5min": 3 * 86400, "hour": 31 * 86400, "day": 31 * 86400}
+ADDITIVE_METRICS = {"traffic", "requests", "status_all", "status_2xx", "status_3xx", "status_4xx", "status_5xx"}
+# 带宽与 QPS 在 hour/day 粒度下是区间内的峰值，不同域名的峰值不能直接相加
+PEAK_METRICS = {"bandwidth", "qps"}
+
+
+class RateLimiter:
+    """按固定间隔发放请求配额，允许 burst 个请求立即发出"""
+
+    def __init__(self, rate: float = QPS, burst: int = 1):
+        self.interval = 1 / rate
+        self.burst = burst
+        self.next_at = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self.next_at = max(self.next_at, now - (self.burst - 1) * self.interval)
+        wait = self.next_at - now
+        self.next_at += self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+limiter = RateLimiter()
+
+
+async def gather_limited(calls: Sequence[Callable[[], Awaitable[Any]]], concurrency: int = CONCURRENCY,
+                         rate_limiter: Optional[RateLimiter] = None) -> List[Any]:
+    """在并发数与速率限制下执行 calls，结果与 calls 顺序一致"""
+    semaphore = asyncio.Semaphore(concurrency)
+    rate_limiter = rate_limiter or limiter
+
+    async def run(call):
+        async with semaphore:
+            await rate_limiter.acquire()
+            return await call()
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
+def time_windows(start: int, end: int, span: int) -> List[Tuple[int, int]]:
+    """把 [start, end] 拆成不超过 span 秒的首尾相接的窗口"""
+    windows = []
+    while start <= end:
+        windows.append((start, min(start + span - 1, end)))
+        start += span
+    return windows
+
+
+def plan(body: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """拆分请求，返回子请求列表与拆分情况"""
+    start, end = int(body["StartTime"]), int(body["EndTime"])
+    interval = body.get("Interval") or ("5min" if end - start <= MAX_SPAN["5min"] else "hour")
+    if interval not in INTERVAL_SECONDS:
+        raise ValueError(f"不支持的时间粒度: {interval}")
+    domains = [domain.strip() for domain in (body.get("Domain") or "").split(",") if domain.strip()]
+    batches = [domains[i:i + MAX_DOMAINS] for i in range(0, len(domains), MAX_DOMAINS)] or [[]]
+    if len(batches) > 1:
+        metric = body.get("Metric")
+        additive = metric in ADDITIVE_METRICS or (metric in PEAK_METRICS and INTERVAL_SECONDS[interval] <= 300)
+        if not additive:
+            raise ValueError(f"指标 {metric} 在时间粒度 {interval} 下不能跨域名批次合并，请一次最多指定 {MAX_DOMAINS} 个域名")
+    windows = time_windows(start, end, MAX_SPAN[interval])
+    bodies = []
+    for batch in batches:
+        for window_start, window_end in windows:
+            sub = dict(body, StartTime=window_start, EndTime=window_end, Interval=interval)
+            if batch:
+                sub["Domain"] = ",".join(batch)
+            bodies.append(sub)
+    return bodies, {"Requests": len(bodies), "TimeWindows": len(windows), "DomainBatches": len(batches)}
+
+
+def _series_key(series: Dict[str, Any]) -> Tuple:
+    return tuple(sorted((key, str(value)) for key, value in series.items() if key != "Values"))
+
+
+def merge(responses: List[Dict[str, Any]], windows: int) -> Dict[str, Any]:
+    """
+    合并子请求的响应
+
+    responses 按域名批次、时间窗口的顺序排列；同一批次内按时间戳去重，不同批次同一时间点的值相加。
+    """
+    merged: Dict[Tuple, Dict[str, Any]] = {}
+    points: Dict[Tuple, Dict[Any, float]] = {}
+    for index, response in enumerate(responses):
+        batch = index // windows
+        batch_points: Dict[Tuple, Dict[Any, float]] = {}
+        for series in (response.get("Result") or {}).get("MetricDataList") or []:
+            key = _series_key(series)
+            merged.setdefault(key, {name: value for name, value in series.items() if name != "Values"})
+            values = batch_points.setdefault(key, {})
+            for point in series.get("Values") or []:
+                values[point["TimeStamp"]] = point["Value"]
+        for key, values in batch_points.items():
+            target = points.setdefault((key, batch), {})
+            target.update(values)
+    totals: Dict[Tuple, Dict[Any, float]] = {}
+    for (key, _), values in points.items():
+        total = totals.setdefault(key, {})
+        for timestamp, value in values.items():
+            total[timestamp] = total[timestamp] + value if timestamp in total else value
+    metric_data = []
+    for key, series in merged.items():
+        values = totals.get(key, {})
+        metric_data.append(dict(series, Values=[{"TimeStamp": timestamp, "Value": values[timestamp]}
+                                                for timestamp in sorted(values)]))
+    return {"ResponseMetadata": responses[0].get("ResponseMetadata"), "Result": {"MetricDataList": metric_data}}
+
+
+async def fan_out(post: Callable[[str, Dict[str, Any], Dict[str, Any]], Awaitable[Dict[str, Any]]], action: str,
+                  body: Dict[str, Any], rate_limiter: Optional[RateLimiter] = None) -> Dict[str, Any]:
+    """
+    拆分、并发请求并合并，不需要拆分时原样发送一次请求
+
+    Args:
+        post: 异步请求函数，如 service.async_post
+    """
+    if body.get("StartTime") in (None, "") or body.get("EndTime") in (None, ""):
+        return await post(action, {}, body)
+    bodies, stats = plan(body)
+    if len(bodies) == 1:
+        return await post(action, {}, body)
+    begin = time.perf_counter()
+    responses = await gather_limited([lambda sub=sub: post(action, {}, sub) for sub in bodies],
+                                     rate_limiter=rate_limiter)
+    result = merge(responses, stats["TimeWindows"])
+    result["FanOut"] = dict(stats, ElapsedMs=round((time.perf_counter() - begin) * 1000, 1))
+    return result
+
+
+def benchmark(latency: float = 0.2, days: int = 30, domains: int = 200, interval: str = "5min",
+              qps: float = QPS) -> Dict[str, Any]:
+    """模拟每次请求耗时 latency 秒的上游，对比逐个请求与速率上限为 qps 的并发扇出的耗时"""
+    end = 1_700_000_000
+    body = {"Metric": "traffic", "StartTime": end - days * 86400, "EndTime": end - 1, "Interval": interval,
+            "Domain": ",".join(f"d{i}.example.com" for i in range(domains))}
+    step = INTERVAL_SECONDS[interval]
+
+    async def post(_action, _params, sub):
+        await asyncio.sleep(latency)
+        return {"ResponseMetadata": {}, "Result": {"MetricDataList": [{"Metric": "traffic", "Values": [
+            {"TimeStamp": t, "Value": 1.0} for t in range(sub["StartTime"], sub["EndTime"] + 1, step)]}]}}
+
+    async def sequential():
+        bodies, stats = plan(body)
+        return merge([await post(None, None, sub) for sub in bodies], stats["TimeWindows"])
+
+    async def run():
+        begin = time.perf_counter()
+        serial = await sequential()
+        serial_seconds = time.perf_counter() - begin
+        begin = time.perf_counter()
+        parallel = await fan_out(post, "McpDescribeEdgeData", body, RateLimiter(qps))
+        parallel_seconds = time.perf_counter() - begin
+        assert parallel["Result"] == serial["Result"]
+        return {"requests": parallel["FanOut"]["Requests"], "points": len(parallel["Result"]["MetricDataList"][0]["Values"]),
+                "sequential_seconds": round(serial_seconds, 2), "fan_out_seconds": round(parallel_seconds, 2),
+                "speedup": round(serial_seconds / parallel_seconds, 1)}
+
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    for name, value in benchmark().items():
+        print(f"{name}: {value}")
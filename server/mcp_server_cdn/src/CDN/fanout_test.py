@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+
+from src.CDN.fanout import MAX_DOMAINS, MAX_SPAN, RateLimiter, fan_out, merge, plan, time_windows
+
+
+def response(*series):
+    return {"ResponseMetadata": {"RequestId": "r"}, "Result": {"MetricDataList": list(series)}}
+
+
+def series(metric, points, **labels):
+    return {"Metric": metric, **labels, "Values": [{"TimeStamp": t, "Value": v} for t, v in points]}
+
+
+def values(merged, metric="traffic"):
+    for item in merged["Result"]["MetricDataList"]:
+        if item["Metric"] == metric:
+            return [(point["TimeStamp"], point["Value"]) for point in item["Values"]]
+    return None
+
+
+class TestMerge(unittest.TestCase):
+
+    def test_time_windows_are_concatenated_and_deduplicated(self):
+        merged = merge([response(series("traffic", [(0, 1), (60, 2)])),
+                        response(series("traffic", [(60, 2), (120, 3)]))], windows=2)
+        self.assertEqual(values(merged), [(0, 1), (60, 2), (120, 3)])
+
+    def test_domain_batches_are_summed(self):
+        merged = merge([response(series("traffic", [(0, 1), (60, 2)])),
+                        response(series("traffic", [(120, 3)])),
+                        response(series("traffic", [(0, 10), (60, 20)])),
+                        response(series("traffic", [(120, 30)]))], windows=2)
+        self.assertEqual(values(merged), [(0, 11), (60, 22), (120, 33)])
+
+    def test_point_missing_from_one_batch(self):
+        merged = merge([response(series("traffic", [(0, 1)])),
+                        response(series("traffic", [(0, 10), (60, 20)]))], windows=1)
+        self.assertEqual(values(merged), [(0, 11), (60, 20)])
+
+    def test_series_are_kept_apart_by_labels(self):
+        merged = merge([response(series("traffic", [(0, 1)], Isp="a"), series("traffic", [(0, 2)], Isp="b")),
+                        response(series("traffic", [(60, 3)], Isp="a"))], windows=2)
+        data = {item["Isp"]: item["Values"] for item in merged["Result"]["MetricDataList"]}
+        self.assertEqual(data["a"], [{"TimeStamp": 0, "Value": 1}, {"TimeStamp": 60, "Value": 3}])
+        self.assertEqual(data["b"], [{"TimeStamp": 0, "Value": 2}])
+
+    def test_response_metadata_comes_from_the_first_response(self):
+        merged = merge([response(series("traffic", [(0, 1)])), {"Result": {}}], windows=2)
+        self.assertEqual(merged["ResponseMetadata"], {"RequestId": "r"})
+        self.assertEqual(values(merged), [(0, 1)])
+
+
+class TestPlan(unittest.TestCase):
+
+    def test_time_windows_are_contiguous(self):
+        self.assertEqual(time_windows(0, 249, 100), [(0, 99), (100, 199), (200, 249)])
+
+    def test_split_by_time_and_domains(self):
+        domains = ",".join(f"d{i}.example.com" for i in range(MAX_DOMAINS + 1))
+        bodies, stats = plan({"Metric": "traffic", "StartTime": 0, "EndTime": MAX_SPAN["1min"] * 2 - 1,
+                              "Interval": "1min", "Domain": domains})
+        self.assertEqual(stats, {"Requests": 4, "TimeWindows": 2, "DomainBatches": 2})
+        self.assertEqual(bodies[1]["StartTime"], MAX_SPAN["1min"])
+        self.assertEqual(len(bodies[2]["Domain"].split(",")), 1)
+
+    def test_non_additive_metric_cannot_be_split_by_domain(self):
+        domains = ",".join(f"d{i}.example.com" for i in range(MAX_DOMAINS + 1))
+        with self.assertRaises(ValueError):
+            plan({"Metric": "hitrate", "StartTime": 0, "EndTime": 3600, "Interval": "5min", "Domain": domains})
+        with self.assertRaises(ValueError):
+            plan({"Metric": "bandwidth", "StartTime": 0, "EndTime": 3600, "Interval": "hour", "Domain": domains})
+
+
+class TestFanOut(unittest.TestCase):
+
+    def test_fan_out_matches_sequential_merge(self):
+        domains = ",".join(f"d{i}.example.com" for i in range(MAX_DOMAINS * 2))
+        body = {"Metric": "traffic", "StartTime": 0, "EndTime": MAX_SPAN["1min"] * 2 - 1, "Interval": "1min",
+                "Domain": domains}
+        sent = []
+
+        async def post(action, params, sub):
+            sent.append(sub)
+            return response(series("traffic", [(sub["StartTime"], 1), (sub["EndTime"], 1)]))
+
+        result = asyncio.run(fan_out(post, "McpDescribeEdgeData", body, RateLimiter(1000, burst=10)))
+        self.assertEqual(len(sent), 4)
+        self.assertEqual(result["FanOut"]["Requests"], 4)
+        self.assertEqual(values(result), [(0, 2), (MAX_SPAN["1min"] - 1, 2), (MAX_SPAN["1min"], 2),
+                                          (MAX_SPAN["1min"] * 2 - 1, 2)])
+
+    def test_single_request_is_sent_unchanged(self):
+        body = {"Metric": "traffic", "StartTime": 0, "EndTime": 3600, "Interval": "5min"}
+
+        async def post(action, params, sub):
+            return {"sent": sub}
+
+        self.assertEqual(asyncio.run(fan_out(post, "McpDescribeEdgeData", body)), {"sent": body})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,25 @@
 from src.CDN.api.api import CdnAPI
 from mcp.server.fastmcp import FastMCP
 from .note import note
+from .fanout import INTERVAL_SECONDS, fan_out
+from .metric_cache import MetricSpec, cache
+from .domain_index import index
 from src.utils.response import HandlerVolcResponse
 import json
+import time
 
 
 def create_mcp_server():
     service = CdnAPI()
+    account = service.service_info.credentials.ak
+    # 已结算的时序数据缓存在本地，只请求未缓存的尾部
+    series = MetricSpec(intervals=INTERVAL_SECONDS)
     mcp = FastMCP(
         "CDN MCP",
         instructions="Volcengine(火山引擎) 内容分发网络(CDN)MCP 服务",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
@@ -114,8 +123,10 @@ def create_mcp_server():
         Call steps:
         1. Pass "describe_district_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_district_data
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_post("McpDescribeDistrictData", {}, json.dumps(body))
+        reqs = cache.fetch(account, "McpDescribeDistrictData", body, series,
+                           lambda sub: json.loads(service.mcp_post("McpDescribeDistrictData", {}, json.dumps(sub))))
 
         return HandlerVolcResponse(reqs)
 
@@ -178,7 +189,7 @@ def create_mcp_server():
         return HandlerVolcResponse(reqs)
 
     @mcp.tool()
-    def describe_origin_data(body: dict) -> str:
+    async def describe_origin_data(body: dict) -> str:
         """
         API 说明
         基于火山引擎内容分发网络（CDN）向源站发送的请求（回源请求），该 API 对一个指标统计各时间点的指标细分数据。
@@ -191,8 +202,11 @@ def create_mcp_server():
         Call steps:
         1. Pass "describe_origin_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_origin_data
+        统计时间段超过所选时间粒度允许的范围或 Domain 超过 50 个时，自动按时间窗口与域名批次拆分并发请求，合并为一个响应。
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_post("McpDescribeOriginData", {}, json.dumps(body))
+        reqs = await cache.afetch(account, "McpDescribeOriginData", body, series,
+                                  lambda sub: fan_out(service.async_post, "McpDescribeOriginData", sub))
 
         return HandlerVolcResponse(reqs)
 
@@ -216,7 +230,7 @@ def create_mcp_server():
         return HandlerVolcResponse(reqs)
 
     @mcp.tool()
-    def describe_edge_data(body: dict) -> str:
+    async def describe_edge_data(body: dict) -> str:
         """
         API 说明
         基于火山引擎内容分发网络（CDN）收到的用户请求，该 API 对一个指标统计各时间点的指标细分数据。
@@ -229,8 +243,11 @@ def create_mcp_server():
         Call steps:
         1. Pass "describe_edge_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_edge_data
+        统计时间段超过所选时间粒度允许的范围或 Domain 超过 50 个时，自动按时间窗口与域名批次拆分并发请求，合并为一个响应。
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_post("McpDescribeEdgeData", {}, json.dumps(body))
+        reqs = await cache.afetch(account, "McpDescribeEdgeData", body, series,
+                                  lambda sub: fan_out(service.async_post, "McpDescribeEdgeData", sub))
 
         return HandlerVolcResponse(reqs)
 
@@ -339,4 +356,57 @@ def create_mcp_server():
 
         return HandlerVolcResponse(reqs)
 
+
+    @mcp.tool()
+    async def refresh_cdn_domain_index(full: bool = False, wait: bool = False) -> str:
+        """
+        刷新本地的加速域名索引。
+        通过 ListCdnDomains 拉取全部加速域名，并在后台为新增及 UpdateTime 变化的域名调用 DescribeCdnConfig 拉取配置；
+        full 为 true 时重新拉取全部域名的配置。返回新增（Added）、删除（Removed）与变更（Updated）的域名，
+        以及尚未拉取到配置的域名数（PendingConfigs）。wait 为 true 时等待全部配置拉取完成再返回，域名较多时耗时较长。
+        query_cdn_domains 在索引为空或过期时会自动刷新，通常不需要手动调用。
+        """
+        changes = await index.refresh(service.async_post, full=full, wait=wait)
+        # 首次构建时全部域名都是新增，每类最多列出 100 个
+        result = {name: {"Count": len(value), "Domains": value[:100]} if isinstance(value, list) else value
+                  for name, value in changes.items()}
+
+        return HandlerVolcResponse({"Result": dict(result, Index=index.status())})
+
+    @mcp.tool()
+    async def query_cdn_domains(body: dict) -> str:
+        """
+        在本地的加速域名索引中查询域名，不调用 OpenAPI，适合按源站、配置开关等 ListCdnDomains 不支持的条件反查域名。
+        索引首次构建时只等待域名列表，配置在后台拉取：返回结果中的 PendingConfigs 不为 0 时，
+        按 Feature 或配置中的源站查询的结果可能不完整，可稍后重试。
+        body 字段均为可选，多个条件同时满足：
+        - Origin: 源站地址，精确匹配；以 * 开头时按后缀匹配，如 "*.example.com"
+        - Feature: 配置项名称，如 HTTPS、IPv6、Compression、Referer 等带 Switch 开关的 DescribeCdnConfig 配置项
+        - Enabled: Feature 的开关状态，默认 true
+        - Status: 域名状态，online、configuring、offline
+        - Project: 所属项目
+        - ServiceType: 业务类型，web、download、video
+        - Domain: 域名包含的字符串
+        - Detail: 是否返回每个域名的 DescribeCdnConfig 配置，默认只返回 ListCdnDomains 中的信息
+        - PageNum: 页码，默认 1
+        - PageSize: 每页数量，默认 100
+        """
+        await index.ensure(service.async_post)
+        begin = time.perf_counter()
+        domains = index.query(
+            origin=body.get("Origin"), feature=body.get("Feature"), enabled=body.get("Enabled", True),
+            status=body.get("Status"), project=body.get("Project"), service_type=body.get("ServiceType"),
+            domain=body.get("Domain"),
+        )
+        page_num, page_size = int(body.get("PageNum") or 1), int(body.get("PageSize") or 100)
+        page = domains[(page_num - 1) * page_size:page_num * page_size]
+        key = "config" if body.get("Detail") else "summary"
+        data = [index.domains[domain][key] or index.domains[domain]["summary"] for domain in page]
+        query_ms = round((time.perf_counter() - begin) * 1000, 3)
+
+        return HandlerVolcResponse({"Result": {"PageNum": page_num, "PageSize": page_size, "Total": len(domains),
+                                               "Data": data, "IndexedAt": int(index.built_at),
+                                               "PendingConfigs": len(index.pending),
+                                               "QueryMs": query_ms}})
+
     return mcp
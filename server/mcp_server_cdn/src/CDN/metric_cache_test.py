@@ -0,0 +1,122 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from src.CDN.metric_cache import MetricCache, MetricSpec, align, parse_time
+
+SPEC = MetricSpec(intervals={"5min": 300, "day": 86400}, aggregates={"Total": ("sum", "Value")})
+# 2023-11-14 22:13:20 UTC，不在 5 分钟边界上
+START = 1700000000
+
+
+class FakeUpstream:
+    """按请求的时间段与粒度返回每个对齐时间桶一个数据点"""
+
+    def __init__(self, granularity: int = 300, offset: int = 8 * 3600):
+        self.granularity = granularity
+        self.offset = offset
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(dict(request))
+        start, end = parse_time(request["StartTime"])[0], parse_time(request["EndTime"])[0]
+        first = -align(-start, self.granularity, -self.offset)
+        points = [{"TimeStamp": bucket, "Value": 1} for bucket in range(first, end + 1, self.granularity)]
+        return {"Result": {"StartTime": request["StartTime"], "EndTime": request["EndTime"],
+                           "Resources": [{"Name": "example.com", "Metrics": [{"Metric": "traffic", "Total": 0,
+                                                                             "Values": points}]}]}}
+
+
+def values(response):
+    return response["Result"]["Resources"][0]["Metrics"][0]["Values"]
+
+
+class TestAlign(unittest.TestCase):
+
+    def test_align_to_provider_midnight(self):
+        bucket = align(START, 86400, 8 * 3600)
+        self.assertEqual(datetime.datetime.fromtimestamp(bucket, datetime.timezone(datetime.timedelta(hours=8))).time(),
+                         datetime.time(0, 0))
+        self.assertLessEqual(bucket, START)
+        self.assertLess(START - bucket, 86400)
+
+    def test_align_is_independent_of_offset_for_small_granularity(self):
+        self.assertEqual(align(START, 300, 8 * 3600), align(START, 300, 0))
+        self.assertEqual(align(START, 300, 0) % 300, 0)
+
+
+class TestMetricCachePlan(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = MetricCache(path=os.path.join(directory.name, "metrics.sqlite3"), settle=0, enabled=True)
+
+    def request(self, start, end, interval="5min", **dimensions):
+        return {"StartTime": start, "EndTime": end, "Interval": interval, **dimensions}
+
+    def test_first_bucket_is_rounded_up_to_the_granularity(self):
+        plan = self.cache.plan("acc", "Action", self.request(START, START + 3600), SPEC)
+        self.assertEqual(plan.first_missing, START + 100)
+        self.assertEqual(plan.first_missing % 300, 0)
+        self.assertEqual(plan.closed, align(START + 3600, 300, plan.offset) + 300)
+        self.assertEqual(plan.cached, {})
+
+    def test_day_buckets_follow_the_request_time_zone(self):
+        utc = self.cache.plan("acc", "Action", self.request("2023-11-14T00:00:00Z", "2023-11-20T00:00:00Z", "day"),
+                              SPEC)
+        self.assertEqual(utc.offset, 0)
+        self.assertEqual(utc.first_missing % 86400, 0)
+        local = self.cache.plan("acc", "Action",
+                                self.request("2023-11-14T00:00:00+08:00", "2023-11-20T00:00:00+08:00", "day"), SPEC)
+        self.assertEqual(local.offset, 8 * 3600)
+        self.assertEqual((local.first_missing + local.offset) % 86400, 0)
+        self.assertNotEqual(utc.key, local.key)
+
+    def test_uncacheable_requests(self):
+        self.assertIsNone(self.cache.plan("acc", "Action", self.request(START, START + 600, interval=""), SPEC))
+        self.assertIsNone(self.cache.plan("acc", "Action", self.request(START, START + 600, interval="week"), SPEC))
+        self.assertIsNone(self.cache.plan("acc", "Action", {"StartTime": START}, SPEC))
+
+    def test_shifted_window_reuses_aligned_buckets(self):
+        upstream = FakeUpstream()
+        first = self.cache.fetch("acc", "Action", self.request(START, START + 3600), SPEC, upstream)
+        self.assertEqual(len(values(first)), 12)
+
+        # 开始时间后移且不在边界上，仍命中之前缓存的时间桶，整段已缓存时不请求上游
+        shifted = self.cache.fetch("acc", "Action", self.request(START + 1050, START + 3600), SPEC, upstream)
+        self.assertEqual(len(upstream.requests), 1)
+        self.assertEqual([point["TimeStamp"] for point in values(shifted)],
+                         list(range(START + 1300, START + 3600, 300)))
+        self.assertEqual(shifted["Result"]["Resources"][0]["Metrics"][0]["Total"], 8)
+        self.assertEqual(shifted["Result"]["StartTime"], START + 1050)
+        self.assertEqual(shifted["MetricCache"], {"CachedBuckets": 8, "UpstreamStartTime": None})
+
+    def test_only_the_uncached_tail_is_requested(self):
+        upstream = FakeUpstream()
+        self.cache.fetch("acc", "Action", self.request(START, START + 3600), SPEC, upstream)
+        extended = self.cache.fetch("acc", "Action", self.request(START, START + 7200), SPEC, upstream)
+        first_missing = align(START + 3600, 300, 0) + 300
+        self.assertEqual(upstream.requests[-1]["StartTime"], first_missing)
+        self.assertEqual(len(values(extended)), 24)
+        self.assertEqual(extended["MetricCache"]["CachedBuckets"], 12)
+
+    def test_unsettled_buckets_are_not_cached(self):
+        self.cache.settle = 10 ** 10
+        upstream = FakeUpstream()
+        self.cache.fetch("acc", "Action", self.request(START, START + 3600), SPEC, upstream)
+        self.cache.fetch("acc", "Action", self.request(START, START + 3600), SPEC, upstream)
+        self.assertEqual(len(upstream.requests), 2)
+        self.assertEqual(upstream.requests[-1]["StartTime"], START)
+
+    def test_dimensions_and_accounts_are_part_of_the_key(self):
+        base = self.cache.plan("acc", "Action", self.request(START, START + 600), SPEC)
+        self.assertNotEqual(base.key, self.cache.plan("other", "Action", self.request(START, START + 600), SPEC).key)
+        self.assertNotEqual(base.key, self.cache.plan("acc", "Action",
+                                                      self.request(START, START + 600, Domain="a.com"), SPEC).key)
+        self.assertEqual(base.key, self.cache.plan("acc", "Action", self.request(START + 300, START + 900), SPEC).key)
+
+
+if __name__ == "__main__":
+    unittest.main()
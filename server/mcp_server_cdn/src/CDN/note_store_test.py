@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.CDN.note import note
+from src.CDN.note_store import NoteStore, index_path, scan, write
+
+NOTES = {
+    "describe_cdn_config": "查询域名配置\n\nArgs:\n    Domain: 加速域名",
+    "list_cdn_domains": "查询域名列表",
+    "empty": "",
+    "last": "结尾没有多余的换行",
+}
+
+
+class TestNoteStore(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "note.txt")
+        write(NOTES, self.path)
+
+    def test_round_trip(self):
+        store = NoteStore(self.path)
+        self.assertEqual(dict(store), NOTES)
+        self.assertEqual(list(store), list(NOTES))
+        self.assertEqual(len(store), len(NOTES))
+        self.assertIn("empty", store)
+        self.assertNotIn("missing", store)
+        with self.assertRaises(KeyError):
+            store["missing"]
+
+    def test_index_matches_scan(self):
+        with open(index_path(self.path), encoding="utf-8") as f:
+            stored = json.load(f)
+        self.assertEqual(stored["size"], os.path.getsize(self.path))
+        self.assertEqual(stored["notes"], scan(self.path))
+
+    def test_notes_are_read_once(self):
+        store = NoteStore(self.path)
+        first = store["list_cdn_domains"]
+        self.assertIs(store["list_cdn_domains"], first)
+
+    def test_stale_or_missing_index_is_rebuilt(self):
+        with open(self.path, "ab") as f:
+            f.write("@@ added\n新增的说明\n".encode("utf-8"))
+        self.assertEqual(NoteStore(self.path)["added"], "新增的说明")
+        self.assertEqual(NoteStore(self.path)["last"], NOTES["last"])
+        os.remove(index_path(self.path))
+        self.assertEqual(dict(NoteStore(self.path)), dict(NOTES, added="新增的说明"))
+
+    def test_shipped_index_is_current(self):
+        self.assertEqual(dict(note.index), {name: tuple(span) for name, span in scan(note.data_path).items()})
+        with open(index_path(note.data_path), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["size"], os.path.getsize(note.data_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
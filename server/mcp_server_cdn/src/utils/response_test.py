@@ -0,0 +1,63 @@
+import json
+import unittest
+
+from src.utils.response import encode_response
+
+
+def decode(response, **options):
+    return json.loads(encode_response(response, **options))
+
+
+class TestEncodeResponse(unittest.TestCase):
+
+    def test_same_shape_records_become_columnar(self):
+        value = decode({'Data': [{'T': 1, 'V': 1.5}, {'T': 2, 'V': 1.7}]})
+        self.assertEqual(value, {'Data': {'columns': ['T', 'V'], 'rows': [[1, 1.5], [2, 1.7]]}})
+
+    def test_mixed_records_are_kept(self):
+        records = [{'T': 1}, {'T': 2, 'V': 1}]
+        self.assertEqual(decode({'Data': records}), {'Data': records})
+
+    def test_float_digits(self):
+        self.assertEqual(decode({'V': 1.23456}, float_digits=2), {'V': 1.23})
+
+    def test_within_max_bytes_is_unchanged(self):
+        response = {'Result': {'Data': [{'T': i, 'V': 1.5} for i in range(3)]}}
+        self.assertEqual(decode(response, max_bytes=10_000), decode(response))
+
+
+class TestMaxBytes(unittest.TestCase):
+
+    def test_truncates_rows_but_never_columns_or_fields(self):
+        value = decode({'Result': {'Data': [{'T': i, 'V': 1.5, 'X': 'a'} for i in range(3)]}}, max_bytes=60)
+        self.assertEqual(value['Result']['Data'], {'columns': ['T', 'V', 'X'], 'rows': [[0, 1.5, 'a']]})
+        self.assertEqual(value['truncated'], {'Result.Data.rows': 3})
+
+    def test_truncates_until_it_fits(self):
+        response = {'Result': {'Data': [{'T': i, 'V': 1.5} for i in range(100)]}}
+        encoded = encode_response(response, max_bytes=300)
+        self.assertLessEqual(len(encoded.encode('utf-8')), 300)
+        value = json.loads(encoded)
+        rows = value['Result']['Data']['rows']
+        self.assertEqual(rows, [[i, 1.5] for i in range(len(rows))])
+        self.assertEqual(value['truncated'], {'Result.Data.rows': 100})
+
+    def test_rows_of_a_plain_array_of_arrays_keep_all_fields(self):
+        value = decode({'Points': [[i, i * 10] for i in range(50)]}, max_bytes=60)
+        self.assertTrue(value['Points'])
+        self.assertTrue(all(len(point) == 2 for point in value['Points']))
+        self.assertEqual(value['truncated'], {'Points': 50})
+
+    def test_arrays_nested_in_a_row_are_not_truncated(self):
+        response = {'Data': [{'T': i, 'Tags': ['a', 'b', 'c', 'd']} for i in range(8)]}
+        value = decode(response, columnar=True, max_bytes=80)
+        self.assertTrue(all(row[1] == ['a', 'b', 'c', 'd'] for row in value['Data']['rows']))
+
+    def test_top_level_array_is_wrapped(self):
+        value = decode([{'T': i} for i in range(40)], columnar=False, max_bytes=60)
+        self.assertEqual(value['truncated'], {'$': 40})
+        self.assertEqual(value['data'][0], {'T': 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+# coding:utf-8
+"""
+BaseTrait 的异步版本
+
+- async_get / async_post：签名一次后通过每个事件循环共享的 httpx.AsyncClient（keep-alive 连接池）发送，
+  响应只解析一次，直接返回 dict，不再经过 json.dumps / json.loads 往返。
+- 每个 Action 可以通过 set_action_policy 单独设置超时与重试次数；连接失败与 429 按指数退避重试，
+  重试复用同一份签名。5xx 与读取超时时请求可能已经执行，只对幂等请求重试：GET 请求与 Get/List/Describe 等
+  查询类 Action 默认视为幂等，其他 Action 需要通过 set_action_policy(action, idempotent=True) 显式开启。
+- 已有的同步工具不需要改写：在注册工具前调用 service.offload_sync_tools(mcp)，同步工具会在线程池中执行，
+  不再阻塞 FastMCP 的事件循环，其中的 mcp_get / mcp_post 调用转交给事件循环上的异步客户端完成，
+  返回值与之前相同（响应 JSON 文本）。
+
+环境变量：
+- MCP_HTTP_POOL_SIZE: 连接池大小，默认 10
+- MCP_HTTP_KEEPALIVE: 空闲连接保活时间（秒），默认 60
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import os
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+from volcengine.auth.SignerV4 import SignerV4
+
+from .base_trait import BaseTrait
+
+POOL_SIZE = int(os.getenv("MCP_HTTP_POOL_SIZE", "10"))
+KEEPALIVE = float(os.getenv("MCP_HTTP_KEEPALIVE", "60"))
+# 请求被限流，服务端未执行，任何请求都可以重试
+THROTTLED_STATUS = (429,)
+# 服务端出错，请求可能已经执行，只重试幂等请求
+RETRY_STATUS = (500, 502, 503, 504)
+READ_ACTION_PREFIXES = ('Get', 'List', 'Describe', 'Query', 'Search', 'Lookup')
+
+# 以事件循环对象为键（不用 id(loop)，避免已关闭循环的 id 被新循环复用），已关闭循环的客户端在下次获取时清理
+_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+# 运行 FastMCP 的事件循环，由 offload 包装的工具在调用时记录，线程池中的同步调用提交到该循环
+_offload_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+@dataclass(frozen=True)
+class ActionPolicy:
+    """
+    单个 Action 的超时与重试策略，timeout 为 None 时使用 service_info 的连接与读取超时；
+    idempotent 为 None 时按请求方法与 Action 名判断是否幂等
+    """
+    timeout: Optional[float] = None
+    retries: int = 2
+    backoff: float = 0.5
+    idempotent: Optional[bool] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """当前事件循环共享的异步客户端（连接池不能跨事件循环使用）"""
+    loop = asyncio.get_running_loop()
+    for stale in [key for key in _clients if key.is_closed()]:
+        # 事件循环已关闭，客户端无法再关闭，只丢弃引用
+        del _clients[stale]
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=httpx.Limits(
+            max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE, keepalive_expiry=KEEPALIVE))
+        _clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """关闭当前事件循环的异步客户端"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _in_worker_thread(loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+    """loop 正在其他线程中运行，当前线程可以阻塞等待提交到 loop 的协程"""
+    if loop is None or not loop.is_running():
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
+
+
+class AsyncTraitMixin:
+    """
+    为 volcengine.base.Service 的子类提供异步调用，复用其 api_info、service_info 与 SignerV4 签名
+    """
+
+    default_policy = ActionPolicy()
+
+    def set_action_policy(self, action: str, timeout: Optional[float] = None, retries: Optional[int] = None,
+                          backoff: Optional[float] = None, idempotent: Optional[bool] = None) -> None:
+        changes = {name: value for name, value in (("timeout", timeout), ("retries", retries), ("backoff", backoff),
+                                                   ("idempotent", idempotent))
+                   if value is not None}
+        policies = self.__dict__.setdefault("_action_policies", {})
+        policies[action] = replace(self.action_policy(action), **changes)
+
+    def action_policy(self, action: str) -> ActionPolicy:
+        return self.__dict__.get("_action_policies", {}).get(action, self.default_policy)
+
+    def is_idempotent(self, action: str, method: str) -> bool:
+        """服务端出错或读取超时后能否重发：策略显式指定时以策略为准，否则 GET 请求与查询类 Action 视为幂等"""
+        idempotent = self.action_policy(action).idempotent
+        if idempotent is not None:
+            return idempotent
+        name = action[3:] if action.startswith("Mcp") else action
+        return method == "GET" or name.startswith(READ_ACTION_PREFIXES)
+
+    def _signed_request(self, action: str, params: Optional[dict], doseq: int, body: Any):
+        if action not in self.api_info:
+            raise Exception("no such api")
+        r = self.prepare_request(self.api_info[action], dict(params or {}), doseq)
+        if body is not None:
+            r.headers['Content-Type'] = 'application/json'
+            r.body = body if isinstance(body, str) else json.dumps(body)
+        SignerV4.sign(r, self.service_info.credentials)
+        return r
+
+    async def _send(self, action: str, params: Optional[dict], doseq: int = 0, body: Any = None) -> httpx.Response:
+        r = self._signed_request(action, params, doseq, body)
+        policy = self.action_policy(action)
+        if policy.timeout is None:
+            timeout = httpx.Timeout(self.service_info.socket_timeout, connect=self.service_info.connection_timeout)
+        else:
+            timeout = httpx.Timeout(policy.timeout, connect=min(policy.timeout, self.service_info.connection_timeout))
+        url = r.build(doseq)
+        content = r.body.encode("utf-8") if r.body else None
+        client = get_async_client()
+        idempotent = self.is_idempotent(action, r.method)
+        attempt = 0
+        while True:
+            try:
+                resp = await client.request(r.method, url, headers=dict(r.headers), content=content, timeout=timeout)
+                retryable = resp.status_code in THROTTLED_STATUS or (idempotent and resp.status_code in RETRY_STATUS)
+                if not retryable or attempt >= policy.retries:
+                    break
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                # 请求未发出，重试不会重复执行
+                if attempt >= policy.retries:
+                    raise
+            except httpx.ReadTimeout:
+                if not idempotent or attempt >= policy.retries:
+                    raise
+            await asyncio.sleep(policy.backoff * 2 ** attempt)
+            attempt += 1
+        if resp.status_code != 200:
+            raise Exception(resp.text)
+        if not resp.content:
+            raise Exception("%s: empty response" % action)
+        return resp
+
+    async def async_get(self, action: str, params: Optional[dict] = None, doseq: int = 0) -> Dict[str, Any]:
+        return (await self._send(action, params, doseq)).json()
+
+    async def async_post(self, action: str, params: Optional[dict] = None, body: Any = None) -> Dict[str, Any]:
+        """body 可以是 dict（序列化一次）或已序列化的 JSON 文本"""
+        return (await self._send(action, params, body="" if body is None else body)).json()
+
+    def mcp_get(self, action, params={}, doseq=0):
+        loop = _offload_loop
+        if _in_worker_thread(loop):
+            coro = self._send(action, params, doseq)
+            return asyncio.run_coroutine_threadsafe(coro, loop).result().text
+        res = self.get(action, params, doseq)
+        if res == '':
+            raise Exception("%s: empty response" % action)
+        return res
+
+    def mcp_post(self, action, params={}, body={}):
+        loop = _offload_loop
+        if _in_worker_thread(loop):
+            coro = self._send(action, params, body=body)
+            return asyncio.run_coroutine_threadsafe(coro, loop).result().text
+        res = self.json(action, params, body)
+        if res == '':
+            raise Exception("%s: empty response" % action)
+        return res
+
+    def offload(self, fn: Callable) -> Callable:
+        """把同步工具包装为在线程池中执行的异步工具，保留原函数的签名与文档"""
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            global _offload_loop
+            _offload_loop = asyncio.get_running_loop()
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+        return wrapper
+
+    def offload_sync_tools(self, mcp):
+        """此后在 mcp 上注册的同步工具都通过 offload 包装"""
+        add_tool = mcp.add_tool
+
+        @functools.wraps(add_tool)
+        def add(fn, *args, **kwargs):
+            if not inspect.iscoroutinefunction(fn):
+                fn = self.offload(fn)
+            return add_tool(fn, *args, **kwargs)
+
+        mcp.add_tool = add
+        return mcp
+
+
+class AsyncBaseTrait(AsyncTraitMixin, BaseTrait):
+    pass
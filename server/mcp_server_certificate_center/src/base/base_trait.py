@@ -1,5 +1,4 @@
 # coding:utf-8
-import json
 from volcengine.base.Service import Service
 from volcengine.const.Const import *
 from volcengine.Policy import *
@@ -43,13 +42,11 @@ class BaseTrait(Service):
         res = self.get(action, params, doseq)
         if res == '':
             raise Exception("%s: empty response" % action)
-        res_json = json.loads(json.dumps(res))
-        return res_json
+        return res
 
     def mcp_post(self, action, params={}, body={}):
         res = self.json(action, params, body)
         if res == '':
             raise Exception("%s: empty response" % action)
-        res_json = json.loads(json.dumps(res))
-        return res_json
+        return res
         
\ No newline at end of file
@@ -11,6 +11,8 @@ def create_mcp_server():
         "证书中心 MCP",
         instructions="Volcengine(火山引擎) 证书中心 MCP, 提供证书相关的服务",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
@@ -1,14 +1,129 @@
+"""
+OpenAPI 响应编码
+
+HandlerVolcResponse 把响应编码为紧凑 JSON（无多余空白、不转义中文），
+并把字段完全相同的记录数组（如时序数据的数据点）转为列式：字段名只出现一次，之后每条记录是一个值数组，
+{"columns": ["TimeStamp", "Value"], "rows": [[1700000000, 1.5], [1700000300, 1.7]]}。
+
+环境变量：
+- MCP_RESPONSE_COLUMNAR: 是否转为列式，默认 true
+- MCP_RESPONSE_FLOAT_DIGITS: 浮点数保留的小数位数，默认不处理
+- MCP_RESPONSE_MAX_BYTES: 响应的字节上限，超出时从最长的数组尾部截断，并在 "truncated" 中记录各数组的原始长度
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+COLUMNAR = os.getenv("MCP_RESPONSE_COLUMNAR", "true").lower() not in ("0", "false", "no")
+FLOAT_DIGITS = int(os.environ["MCP_RESPONSE_FLOAT_DIGITS"]) if os.getenv("MCP_RESPONSE_FLOAT_DIGITS") else None
+MAX_BYTES = int(os.environ["MCP_RESPONSE_MAX_BYTES"]) if os.getenv("MCP_RESPONSE_MAX_BYTES") else None
+# 记录数不少于该值的数组才转为列式
+MIN_COLUMNAR_ROWS = 2
+
+
 def Error(message: str):
     return "API Error: " + message
 
 
-def HandlerVolcResponse(response: dict):
-    if (
-        response
-        and hasattr(response, "ResponseMetadata")
-        and response.ResponseMetadata
-        and hasattr(response.ResponseMetadata, "Error")
-        and response.ResponseMetadata.Error
-    ):
-        return Error(response.ResponseMetadata.Error.Message)
-    return str(response)
+def _compact(value: Any, columnar: bool, float_digits: Optional[int]) -> Any:
+    if isinstance(value, float):
+        return round(value, float_digits) if float_digits is not None else value
+    if isinstance(value, dict):
+        return {key: _compact(item, columnar, float_digits) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [_compact(item, columnar, float_digits) for item in value]
+        if columnar and len(items) >= MIN_COLUMNAR_ROWS and isinstance(items[0], dict) and items[0]:
+            columns = list(items[0])
+            keys = set(columns)
+            if all(isinstance(item, dict) and item.keys() == keys for item in items):
+                return {"columns": columns, "rows": [[item[column] for column in columns] for item in items]}
+        return items
+    return value
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _is_columnar(value: Any) -> bool:
+    return isinstance(value, dict) and value.keys() == {"columns", "rows"} \
+        and isinstance(value["columns"], list) and isinstance(value["rows"], list)
+
+
+def _lists(value: Any, path: str = "", in_row: bool = False) -> Iterator[Tuple[List[Any], str]]:
+    """
+    结构中可以截断的记录数组及其路径
+
+    截断只能去掉整条记录：列式结构只截断 rows，不截断 columns；数组中的数组（如列式的一行）
+    是一条记录的各个字段，本身不截断，只继续查找其中嵌套的记录数组。
+    """
+    if _is_columnar(value):
+        rows_path = f"{path}.rows" if path else "rows"
+        yield value["rows"], rows_path
+        for index, row in enumerate(value["rows"]):
+            yield from _lists(row, f"{rows_path}[{index}]", in_row=True)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _lists(item, f"{path}.{key}" if path else str(key))
+    elif isinstance(value, list):
+        if not in_row:
+            yield value, path
+        for index, item in enumerate(value):
+            yield from _lists(item, f"{path}[{index}]", in_row=isinstance(item, list))
+
+
+def _annotate(value: Any, truncated: Dict[str, int]) -> Any:
+    if not truncated:
+        return value
+    return dict(value, truncated=truncated) if isinstance(value, dict) else {"data": value, "truncated": truncated}
+
+
+def _fit(value: Any, max_bytes: int) -> Any:
+    """
+    反复将记录最多的数组（长度相同的一并处理）减半，直到编码后（含 truncated 标记）不超过 max_bytes
+    或没有可截断的数组
+    """
+    truncated: Dict[str, int] = {}
+    while len(_dumps(_annotate(value, truncated)).encode("utf-8")) > max_bytes:
+        lists = list(_lists(value))
+        longest = max((len(items) for items, _ in lists), default=0)
+        if longest <= 1:
+            break
+        for items, path in lists:
+            if len(items) == longest:
+                truncated.setdefault(path or "$", len(items))
+                del items[(len(items) + 1) // 2:]
+    return _annotate(value, truncated)
+
+
+def encode_response(response: Any, columnar: bool = COLUMNAR, float_digits: Optional[int] = FLOAT_DIGITS,
+                    max_bytes: Optional[int] = MAX_BYTES) -> str:
+    """
+    将响应编码为紧凑 JSON
+
+    Args:
+        response: 解析后的响应
+        columnar: 是否把字段相同的记录数组转为列式
+        float_digits: 浮点数保留的小数位数，None 表示不处理
+        max_bytes: 编码结果的字节上限，None 表示不限制
+    """
+    value = _compact(response, columnar, float_digits)
+    if max_bytes is not None:
+        value = _fit(value, max_bytes)
+    return _dumps(value)
+
+
+def HandlerVolcResponse(response: dict, **options):
+    if not response:
+        return Error("Empty response")
+    if isinstance(response, (str, bytes)):
+        try:
+            response = json.loads(response)
+        except ValueError:
+            return response if isinstance(response, str) else response.decode("utf-8", "replace")
+    if isinstance(response, dict):
+        error = (response.get("ResponseMetadata") or {}).get("Error")
+        if error and isinstance(error, dict):
+            return Error(error.get("Message", "Unknown error"))
+    return encode_response(response, **options)
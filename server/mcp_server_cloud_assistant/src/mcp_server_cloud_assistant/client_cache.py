@@ -0,0 +1,116 @@
+import datetime
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+import volcenginesdkcore
+
+T = TypeVar("T")
+
+DEFAULT_MAX_SIZE = 256
+# 没有过期时间的凭证（长期 AK/SK）对应客户端的最长缓存时间（秒）
+DEFAULT_TTL = 3600
+# 临时凭证在过期前这段时间（秒）内不再复用，避免请求发出时凭证恰好过期
+EXPIRY_MARGIN = 60
+
+
+def parse_expired_time(value: Any) -> Optional[float]:
+    """解析 STS 凭证的 ExpiredTime（Unix 秒/毫秒时间戳或 ISO 8601 时间），无法解析时返回 None"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value.strip())
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e12 else float(value)
+    try:
+        parsed = datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def credential_key(ak: Optional[str], sk: Optional[str], session_token: Optional[str], region: Optional[str],
+                   *extra: Any) -> str:
+    """
+    缓存键：凭证与地域的摘要，不在内存中以明文作为键保存凭证
+
+    SK 与 SessionToken 都参与摘要：仅凭 AK 命中缓存会把以真实 SK 签名的客户端交给持有错误 SK 的调用方
+    """
+    raw = "\x00".join(str(part or "") for part in (ak, sk, session_token, region, *extra))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ClientCache:
+    """
+    按凭证缓存 SDK 客户端
+
+    每个 (AK, SK, SessionToken, Region) 使用独立的 Configuration 与 ApiClient，不写入进程全局的
+    Configuration 默认值，不同凭证的并发请求互不影响；客户端按 LRU 淘汰，临时凭证的客户端随凭证过期。
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL,
+                 expiry_margin: float = EXPIRY_MARGIN):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.expiry_margin = expiry_margin
+        self._clients: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, factory: Callable[[volcenginesdkcore.ApiClient], T], ak: str, sk: str,
+            session_token: Optional[str] = None, region: Optional[str] = None, host: Optional[str] = None,
+            expired_time: Any = None, **config: Any) -> T:
+        """
+        返回凭证对应的客户端，不存在或已过期时以 factory(ApiClient) 创建
+
+        Args:
+            factory: 由 ApiClient 构造服务客户端，如 ``lambda api_client: ECSApi(api_client)``
+            expired_time: 临时凭证的过期时间，客户端在过期前 expiry_margin 秒失效
+            config: 额外设置到 Configuration 上的属性
+        """
+        key = credential_key(ak, sk, session_token, region, host, getattr(factory, "__qualname__", factory),
+                             *sorted(config.items()))
+        now = time.time()
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and entry[1] > now:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        configuration = volcenginesdkcore.Configuration()
+        configuration.ak = ak
+        configuration.sk = sk
+        # Configuration() 复制全局默认值，显式覆盖，避免沿用其他凭证的 SessionToken
+        configuration.session_token = session_token or ""
+        if region:
+            configuration.region = region
+        if host:
+            configuration.host = host
+        for name, value in config.items():
+            setattr(configuration, name, value)
+        client = factory(volcenginesdkcore.ApiClient(configuration))
+
+        expires_at = now + self.ttl
+        expired = parse_expired_time(expired_time)
+        if expired is not None:
+            expires_at = min(expires_at, expired - self.expiry_margin)
+        with self._lock:
+            self._clients[key] = (client, expires_at)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
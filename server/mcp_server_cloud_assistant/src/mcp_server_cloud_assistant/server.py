@@ -17,8 +17,10 @@ from pathlib import Path
 # 检测是否以脚本模式运行（非包模式）
 if __package__ is None:
     sys.path.insert(0, str(Path(__file__).parent))
+    from client_cache import ClientCache
 else:
     from mcp_server_cloud_assistant.config import load_config, get_auth_config
+    from mcp_server_cloud_assistant.client_cache import ClientCache
 
 # Configure logging
 logging.basicConfig(
@@ -51,8 +53,8 @@ STATUS_PARTIAL_FAILED = "PartialFailed"
 # Initialize FastMCP server
 mcp = FastMCP(MCP_SERVER_NAME, port=int(os.getenv("PORT", "8000")))
 
-# Global variables
-client = None
+# 按 (AK, SessionToken, Region, Endpoint) 缓存客户端，并发请求各自使用自己凭证的客户端
+clients = ClientCache()
 
 @mcp.tool(name="run_command",description="""send commands to be executed on the specified instance.
 Region is the region where the instance exists, default is cn-beijing. It accepts `ap-southeast-1`, `cn-beijing`, 
@@ -74,7 +76,7 @@ async def run_command(instance: str, region: str, command_content: str) -> str:
         The execution result of the passed-in command on the target instance
 
     """
-    init_client_config(region)
+    client = init_client_config(region)
     # run command
     command_content = command_content.encode(API_CHARSET)
     command_content = base64.b64encode(command_content).decode(API_CHARSET)
@@ -82,15 +84,15 @@ async def run_command(instance: str, region: str, command_content: str) -> str:
            "CommandContent": command_content,
            "Type": "Shell",
            "InvocationName": "mcp-server-cloud-assistant-demo"}
-    res = send_cloud_assist_request(req, API_RUN_COMMAND)
+    res = send_cloud_assist_request(client, req, API_RUN_COMMAND)
     invocation_id = res["InvocationId"]
 
     # wait done
-    wait_invocation_done(invocation_id)
+    wait_invocation_done(client, invocation_id)
 
     # get result
     req = {"InvocationId": invocation_id}
-    res = send_cloud_assist_request(req, API_DESCRIBE_INVOCATION_RESULTS)
+    res = send_cloud_assist_request(client, req, API_DESCRIBE_INVOCATION_RESULTS)
     output = res["InvocationResults"][0]["Output"]
     output = base64.b64decode(output).decode(API_CHARSET)
     return output
@@ -100,7 +102,6 @@ def init_client_config(region: str) -> any:
     ctx: Context[ServerSession, object] = mcp.get_context()
     raw_request: Request = ctx.request_context.request
 
-    global client
     auth = None
     if raw_request:
         # 从 header 的 authorization 字段读取 base64 编码后的 sts json
@@ -128,50 +129,37 @@ def init_client_config(region: str) -> any:
             sk = data.get('SecretAccessKey')
             session_token = data.get('SessionToken')
             conf = get_auth_config(ak, sk, session_token)
-            client = init_client(ak, sk, conf.volcengine_endpoint, region, session_token)
+            client = init_client(ak, sk, conf.volcengine_endpoint, region, session_token, data.get('ExpiredTime'))
         except Exception as e:
             raise ValueError("Decode authorization info error", e)
 
     if client is None:
         raise ValueError("Init client error")
+    return client
 
 
-def init_client(ak, sk, endpoint, region, token) -> any:
-    configuration = volcenginesdkcore.Configuration()
-    configuration.ak = ak
-    configuration.sk = sk
-    configuration.host = endpoint
-    configuration.region = region
-    configuration.session_token = token
-
-    config = volcenginesdkcore.Configuration.set_default(configuration)
-    return volcenginesdkcore.UniversalApi(volcenginesdkcore.ApiClient(config))
+def init_client(ak, sk, endpoint, region, token, expired_time=None) -> any:
+    return clients.get(volcenginesdkcore.UniversalApi, ak, sk, token, region, endpoint, expired_time=expired_time)
 
 def init_local_client(conf: any, region: str) -> any:
-    configuration = volcenginesdkcore.Configuration()
-    configuration.ak = conf.volcengine_ak
-    configuration.sk = conf.volcengine_sk
-    configuration.host = conf.volcengine_endpoint
-    configuration.region = region
-
-    config = volcenginesdkcore.Configuration.set_default(configuration)
-    return volcenginesdkcore.UniversalApi(volcenginesdkcore.ApiClient(config))
+    return clients.get(volcenginesdkcore.UniversalApi, conf.volcengine_ak, conf.volcengine_sk, None, region,
+                       conf.volcengine_endpoint)
 
 
-def send_cloud_assist_request(req: dict, action: str) -> dict[str, Any] | None:
+def send_cloud_assist_request(client: any, req: dict, action: str) -> dict[str, Any] | None:
     res = client.do_call(
         volcenginesdkcore.UniversalInfo(method=API_METHOD, action=action, service=API_SERVICE, version=API_VERSION),
         volcenginesdkcore.Flatten(req).flat())
     return res
 
 
-def wait_invocation_done(invocation_id: str):
+def wait_invocation_done(client: any, invocation_id: str):
     for i in range(0, MAX_WAIT_COUNT):
         time.sleep(WAIT_PERIOD)
         req = {
             "InvocationId": invocation_id
         }
-        res = send_cloud_assist_request(req, API_DESCRIBE_INVOCATIONS)
+        res = send_cloud_assist_request(client, req, API_DESCRIBE_INVOCATIONS)
         status = res["Invocations"][0]["InvocationStatus"]
 
         if status == STATUS_SUCCESS or status == STATUS_FAILED or status == STATUS_PARTIAL_FAILED:
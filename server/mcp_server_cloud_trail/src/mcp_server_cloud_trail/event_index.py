@@ -0,0 +1,238 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from fastmcp.utilities.logging import configure_logging, get_logger
+
+from .local_tool import ActionInvoker
+from .sdk_tool import parse_expired_time
+
+# 定义logger
+logger = get_logger(__name__)
+configure_logging("INFO")
+
+LOOKUP_ACTION = 'LookupEvents'
+LOOKUP_PAGE_SIZE = 50
+LOOKUP_MAX_ITEMS = 10_000_000
+# 单个拉取窗口的时长(秒)，不重叠的窗口并发拉取
+DEFAULT_WINDOW = 6 * 3600
+DEFAULT_CONCURRENCY = 4
+# 事件写入审计日志存在延迟，最近这段时间内的事件每次都重新拉取，不计入已覆盖范围
+DEFAULT_SETTLE_DELAY = 600
+
+# 可过滤/分组的事件字段
+EVENT_FIELDS = ['EventName', 'EventSource', 'UserName', 'AccessKeyID', 'Region', 'SourceIPAddress', 'ErrorCode']
+RESOURCE_FIELDS = ['ResourceID', 'ResourceType', 'ServiceCode']
+# 按时间分桶的分组项
+TIME_BUCKETS = {'Hour': 3600, 'Day': 86400}
+
+Range = Tuple[int, int]
+
+
+def subtract_ranges(start: int, end: int, covered: Sequence[Range]) -> List[Range]:
+    """[start, end) 中未被 covered（已按起点排序且不重叠）覆盖的区间"""
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def split_windows(ranges: Sequence[Range], window: int) -> List[Range]:
+    return [(begin, min(begin + window, end)) for start, end in ranges for begin in range(start, end, window)]
+
+
+def event_time(event: Dict[str, Any]) -> int:
+    value = event.get('EventTime')
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value.strip())
+    timestamp = parse_expired_time(value)
+    if timestamp is None:
+        return 0
+    # 兼容毫秒时间戳
+    return int(timestamp / 1000) if timestamp > 1e12 else int(timestamp)
+
+
+class EventIndex:
+    """
+    CloudTrail 事件本地索引（SQLite）
+
+    事件按 (账号, EventID) 去重保存，并按事件时间、事件名、用户与关联资源建立索引；
+    已拉取的时间范围记录在 coverage 表中，查询时只向上游拉取未覆盖的时间范围。
+    历史审计事件不会变化，已覆盖范围内的数据永久有效。
+    """
+
+    def __init__(self, path: Union[str, Path], window: int = DEFAULT_WINDOW, concurrency: int = DEFAULT_CONCURRENCY,
+                 settle_delay: int = DEFAULT_SETTLE_DELAY):
+        self.path = str(path)
+        self.window = window
+        self.concurrency = concurrency
+        self.settle_delay = settle_delay
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 同一账号的拉取串行执行，避免重复拉取相同的时间范围
+        self._ingest_locks: Dict[str, asyncio.Lock] = {}
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        columns = ', '.join(f'{name} TEXT' for name in EVENT_FIELDS)
+        self._conn.execute(f'CREATE TABLE IF NOT EXISTS events (Account TEXT NOT NULL, EventID TEXT NOT NULL, '
+                           f'EventTime INTEGER NOT NULL, {columns}, Raw TEXT NOT NULL, '
+                           f'PRIMARY KEY (Account, EventID))')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS event_resources (Account TEXT NOT NULL, '
+                           'EventID TEXT NOT NULL, ResourceID TEXT, ResourceType TEXT, ServiceCode TEXT, '
+                           'UNIQUE (Account, EventID, ResourceID, ResourceType))')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS coverage (Account TEXT NOT NULL, '
+                           'StartTime INTEGER NOT NULL, EndTime INTEGER NOT NULL)')
+        for name, table, columns in [
+            ('events_time', 'events', 'Account, EventTime'),
+            ('events_name', 'events', 'Account, EventName, EventTime'),
+            ('events_user', 'events', 'Account, UserName, EventTime'),
+            ('event_resources_id', 'event_resources', 'Account, ResourceID'),
+            ('coverage_account', 'coverage', 'Account, StartTime'),
+        ]:
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})')
+
+    def covered(self, account: str) -> List[Range]:
+        with self._lock:
+            return self._conn.execute('SELECT StartTime, EndTime FROM coverage WHERE Account = ? '
+                                      'ORDER BY StartTime', (account,)).fetchall()
+
+    def store(self, account: str, events: Sequence[Dict[str, Any]], covered: Optional[Range]) -> int:
+        """写入事件，并将 covered 合并到已覆盖范围（相邻或重叠的区间合并为一个）"""
+        rows, resources = [], []
+        for event in events:
+            event_id = event.get('EventID')
+            if not event_id:
+                continue
+            rows.append((account, event_id, event_time(event), *(event.get(name) for name in EVENT_FIELDS),
+                         json.dumps(event, ensure_ascii=False)))
+            for resource in event.get('RelatedResources') or []:
+                resources.append((account, event_id, *(resource.get(name) for name in RESOURCE_FIELDS)))
+        placeholders = ', '.join('?' for _ in range(len(EVENT_FIELDS) + 4))
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                before = self._conn.total_changes
+                self._conn.executemany(f'INSERT OR IGNORE INTO events VALUES ({placeholders})', rows)
+                inserted = self._conn.total_changes - before
+                self._conn.executemany('INSERT OR IGNORE INTO event_resources VALUES (?, ?, ?, ?, ?)', resources)
+                if covered is not None:
+                    start, end = covered
+                    merged = self._conn.execute(
+                        'SELECT MIN(StartTime), MAX(EndTime) FROM coverage '
+                        'WHERE Account = ? AND StartTime <= ? AND EndTime >= ?', (account, end, start)).fetchone()
+                    if merged[0] is not None:
+                        start, end = min(start, merged[0]), max(end, merged[1])
+                    self._conn.execute('DELETE FROM coverage WHERE Account = ? AND StartTime <= ? AND EndTime >= ?',
+                                       (account, end, start))
+                    self._conn.execute('INSERT INTO coverage VALUES (?, ?, ?)', (account, start, end))
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return inserted
+
+    async def _fetch(self, invoke: ActionInvoker, start: int, end: int) -> List[Dict[str, Any]]:
+        resp = await invoke(LOOKUP_ACTION, {
+            'StartTime': start, 'EndTime': end, 'MaxResults': LOOKUP_PAGE_SIZE,
+            'auto_paginate': True, 'max_items': LOOKUP_MAX_ITEMS,
+        })
+        return resp.get('Trails') or []
+
+    async def ingest(self, invoke: ActionInvoker, account: str, start: int, end: int,
+                     now: Optional[int] = None) -> Dict[str, Any]:
+        """
+        拉取 [start, end) 中尚未覆盖的时间范围
+
+        未覆盖的范围按 window 切分为不重叠的窗口并发拉取，每个窗口拉取完成后单独提交；
+        晚于 now - settle_delay 的部分不计入已覆盖范围，下次查询时重新拉取。
+        """
+        now = int(now or time.time())
+        settled = now - self.settle_delay
+        lock = self._ingest_locks.setdefault(account, asyncio.Lock())
+        async with lock:
+            gaps = subtract_ranges(start, min(end, now), self.covered(account))
+            windows = split_windows(gaps, self.window)
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def ingest_window(window: Range) -> int:
+                async with semaphore:
+                    events = await self._fetch(invoke, *window)
+                covered = (window[0], min(window[1], settled)) if window[0] < settled else None
+                return await asyncio.to_thread(self.store, account, events, covered)
+
+            results = await asyncio.gather(*(ingest_window(window) for window in windows), return_exceptions=True)
+        errors = [str(result) for result in results if isinstance(result, BaseException)]
+        for error in errors:
+            logger.error(f"警告：审计事件窗口拉取失败，该窗口将在下次查询时重新拉取: {error}")
+        return {
+            "FetchedRanges": [list(window) for window in windows],
+            "NewEvents": sum(result for result in results if isinstance(result, int)),
+            "Errors": errors,
+        }
+
+    @staticmethod
+    def _where(account: str, start: int, end: int, filters: Optional[Dict[str, Any]]
+               ) -> Tuple[str, List[Any]]:
+        clauses = ['e.Account = ?', 'e.EventTime >= ?', 'e.EventTime < ?']
+        params: List[Any] = [account, start, end]
+        for name, values in (filters or {}).items():
+            values = values if isinstance(values, list) else [values]
+            if not values:
+                continue
+            marks = ', '.join('?' for _ in values)
+            if name in EVENT_FIELDS:
+                clauses.append(f'e.{name} IN ({marks})')
+            elif name in RESOURCE_FIELDS:
+                clauses.append(f'EXISTS (SELECT 1 FROM event_resources r WHERE r.Account = e.Account '
+                               f'AND r.EventID = e.EventID AND r.{name} IN ({marks}))')
+            else:
+                raise ValueError(f"不支持的过滤字段: {name}，可选: {EVENT_FIELDS + RESOURCE_FIELDS}")
+            params += [str(value) for value in values]
+        return ' AND '.join(clauses), params
+
+    def query(self, account: str, start: int, end: int, filters: Optional[Dict[str, Any]] = None,
+              limit: int = 100, ascending: bool = False) -> List[Dict[str, Any]]:
+        where, params = self._where(account, start, end, filters)
+        sql = (f'SELECT e.Raw FROM events e WHERE {where} '
+               f'ORDER BY e.EventTime {"ASC" if ascending else "DESC"} LIMIT ?')
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit]).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def aggregate(self, account: str, start: int, end: int, group_by: Sequence[str],
+                  filters: Optional[Dict[str, Any]] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """按事件字段、关联资源字段或时间桶（Hour/Day）分组计数"""
+        where, params = self._where(account, start, end, filters)
+        join, columns = '', []
+        for name in group_by:
+            if name in EVENT_FIELDS:
+                columns.append(f'e.{name}')
+            elif name in RESOURCE_FIELDS:
+                join = 'JOIN event_resources r ON r.Account = e.Account AND r.EventID = e.EventID'
+                columns.append(f'r.{name}')
+            elif name in TIME_BUCKETS:
+                columns.append(f'(e.EventTime / {TIME_BUCKETS[name]}) * {TIME_BUCKETS[name]}')
+            else:
+                raise ValueError(f"不支持的分组字段: {name}，可选: {EVENT_FIELDS + RESOURCE_FIELDS + list(TIME_BUCKETS)}")
+        select = ', '.join(columns + ['COUNT(DISTINCT e.EventID)'])
+        sql = f'SELECT {select} FROM events e {join} WHERE {where}'
+        if columns:
+            sql += f' GROUP BY {", ".join(columns)}'
+        sql += ' ORDER BY COUNT(DISTINCT e.EventID) DESC LIMIT ?'
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit]).fetchall()
+        width = len(group_by)
+        return [dict(zip(group_by, row[:width]), Count=row[width]) for row in rows if row[width]]
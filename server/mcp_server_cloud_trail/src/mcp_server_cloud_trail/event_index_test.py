@@ -0,0 +1,89 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from mcp_server_cloud_trail.event_index import EventIndex, split_windows, subtract_ranges
+
+
+def event(event_id: str, timestamp: int, **fields) -> dict:
+    return {'EventID': event_id, 'EventTime': timestamp, **fields}
+
+
+class TestRanges(unittest.TestCase):
+
+    def test_subtract_nothing_covered(self):
+        self.assertEqual(subtract_ranges(0, 100, []), [(0, 100)])
+
+    def test_subtract_gaps_between_covered(self):
+        self.assertEqual(subtract_ranges(0, 100, [(10, 20), (30, 40)]), [(0, 10), (20, 30), (40, 100)])
+
+    def test_subtract_ignores_ranges_outside(self):
+        self.assertEqual(subtract_ranges(50, 60, [(0, 10), (55, 58), (70, 80)]), [(50, 55), (58, 60)])
+
+    def test_subtract_fully_covered(self):
+        self.assertEqual(subtract_ranges(10, 20, [(0, 15), (15, 30)]), [])
+
+    def test_split_windows(self):
+        self.assertEqual(split_windows([(0, 25), (40, 45)], 10), [(0, 10), (10, 20), (20, 25), (40, 45)])
+
+
+class TestEventIndexStore(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.index = EventIndex(Path(directory.name) / 'events.db')
+        self.addCleanup(self.index._conn.close)
+
+    def test_overlapping_and_adjacent_coverage_merges(self):
+        self.index.store('a', [], (10, 20))
+        self.index.store('a', [], (30, 40))
+        self.index.store('a', [], (20, 30))
+        self.assertEqual(self.index.covered('a'), [(10, 40)])
+        self.index.store('a', [], (35, 50))
+        self.assertEqual(self.index.covered('a'), [(10, 50)])
+
+    def test_disjoint_coverage_is_kept_apart(self):
+        self.index.store('a', [], (30, 40))
+        self.index.store('a', [], (0, 10))
+        self.assertEqual(self.index.covered('a'), [(0, 10), (30, 40)])
+        self.index.store('a', [], (5, 35))
+        self.assertEqual(self.index.covered('a'), [(0, 40)])
+
+    def test_coverage_and_events_are_per_account(self):
+        self.index.store('a', [event('1', 15)], (10, 20))
+        self.assertEqual(self.index.covered('b'), [])
+        self.assertEqual(self.index.query('b', 0, 100), [])
+
+    def test_events_are_deduplicated(self):
+        self.assertEqual(self.index.store('a', [event('1', 15), event('2', 16)], None), 2)
+        self.assertEqual(self.index.store('a', [event('1', 15), event('3', 17)], None), 1)
+        self.assertEqual([e['EventID'] for e in self.index.query('a', 0, 100)], ['3', '2', '1'])
+
+    def test_ingest_fetches_only_uncovered_ranges(self):
+        fetched = []
+
+        async def invoke(action, body):
+            fetched.append((body['StartTime'], body['EndTime']))
+            return {'Trails': [event(f"{body['StartTime']}", body['StartTime'], EventName='RunInstances')]}
+
+        self.index.store('a', [], (100, 200))
+        now = 10_000
+        result = asyncio.run(self.index.ingest(invoke, 'a', 0, 300, now=now))
+        self.assertEqual(sorted(fetched), [(0, 100), (200, 300)])
+        self.assertEqual(result['NewEvents'], 2)
+        self.assertEqual(self.index.covered('a'), [(0, 300)])
+        self.assertEqual(self.index.aggregate('a', 0, 300, ['EventName']), [{'EventName': 'RunInstances', 'Count': 2}])
+
+    def test_unsettled_range_is_not_covered(self):
+        async def invoke(action, body):
+            return {'Trails': []}
+
+        now = 10_000
+        asyncio.run(self.index.ingest(invoke, 'a', now - 1000, now, now=now))
+        self.assertEqual(self.index.covered('a'), [(now - 1000, now - self.index.settle_delay)])
+
+
+if __name__ == "__main__":
+    unittest.main()
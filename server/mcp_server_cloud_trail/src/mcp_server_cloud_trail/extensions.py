@@ -0,0 +1,117 @@
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from mcp.types import Tool
+
+from .event_index import EVENT_FIELDS, RESOURCE_FIELDS, TIME_BUCKETS, EventIndex
+from .local_tool import LocalContext, LocalTool
+
+_indexes: Dict[Path, EventIndex] = {}
+
+_TIME_PROPERTIES = {
+    "StartTime": {"type": "integer", "description": "查询起始时间戳（秒）"},
+    "EndTime": {"type": "integer", "description": "查询截止时间戳（秒），默认为当前时间"},
+}
+_FILTERS_SCHEMA = {
+    "type": "object",
+    "description": f"过滤条件，字段名 -> 取值列表，可选字段: {', '.join(EVENT_FIELDS + RESOURCE_FIELDS)}。"
+                   "如 {\"EventName\": [\"DeleteUser\"], \"ResourceID\": [\"i-xxx\"]}",
+}
+
+
+def get_index(context: LocalContext) -> EventIndex:
+    path = context.data_dir / 'cloud_trail' / 'events.sqlite'
+    if path not in _indexes:
+        _indexes[path] = EventIndex(path)
+    return _indexes[path]
+
+
+def _time_range(arguments: Dict[str, Any]) -> Tuple[int, int]:
+    start = arguments['StartTime']
+    end = arguments.get('EndTime') or int(time.time())
+    if start >= end:
+        raise ValueError(f"StartTime {start} 必须早于 EndTime {end}")
+    return start, end
+
+
+async def sync_event_index(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    start, end = _time_range(arguments)
+    begin = time.perf_counter()
+    result = await get_index(context).ingest(context.invoke, context.identity, start, end)
+    return dict(result, ElapsedMs=round((time.perf_counter() - begin) * 1000, 2))
+
+
+async def query_local_events(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    index = get_index(context)
+    start, end = _time_range(arguments)
+    ingest = await index.ingest(context.invoke, context.identity, start, end)
+    begin = time.perf_counter()
+    events = index.query(context.identity, start, end, arguments.get('Filters'), arguments.get('Limit') or 100,
+                         ascending=arguments.get('Order') == 'asc')
+    return {"Trails": events, "FetchedRanges": ingest['FetchedRanges'], "Errors": ingest['Errors'],
+            "QueryMs": round((time.perf_counter() - begin) * 1000, 2)}
+
+
+async def aggregate_local_events(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    index = get_index(context)
+    start, end = _time_range(arguments)
+    ingest = await index.ingest(context.invoke, context.identity, start, end)
+    begin = time.perf_counter()
+    rows = index.aggregate(context.identity, start, end, arguments.get('GroupBy') or ['EventName'],
+                           arguments.get('Filters'), arguments.get('Limit') or 100)
+    return {"Rows": rows, "FetchedRanges": ingest['FetchedRanges'], "Errors": ingest['Errors'],
+            "QueryMs": round((time.perf_counter() - begin) * 1000, 2)}
+
+
+LOCAL_TOOLS = [
+    LocalTool(
+        tool=Tool(
+            name='SyncEventIndex',
+            description="将时间范围内的审计事件拉取到本地事件索引。只拉取尚未覆盖的时间范围，"
+                        "按时间窗口并发拉取；历史事件不会变化，已拉取的范围永久有效。",
+            inputSchema={"type": "object", "properties": dict(_TIME_PROPERTIES), "required": ["StartTime"]},
+        ),
+        handler=sync_event_index,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='QueryLocalEvents',
+            description="基于本地事件索引按事件名、用户、资源等条件查询审计事件（如\"谁在上周删除了某资源\"），"
+                        "未覆盖的时间范围会先自动拉取。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **_TIME_PROPERTIES,
+                    "Filters": _FILTERS_SCHEMA,
+                    "Limit": {"type": "integer", "minimum": 1, "description": "返回的事件数，默认 100"},
+                    "Order": {"type": "string", "enum": ["desc", "asc"], "description": "按事件时间排序方向，默认 desc"},
+                },
+                "required": ["StartTime"],
+            },
+        ),
+        handler=query_local_events,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='AggregateLocalEvents',
+            description="基于本地事件索引按字段分组统计审计事件数量，可按 Hour/Day 时间分桶，"
+                        "未覆盖的时间范围会先自动拉取。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **_TIME_PROPERTIES,
+                    "GroupBy": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": EVENT_FIELDS + RESOURCE_FIELDS + list(TIME_BUCKETS)},
+                        "description": "分组字段，默认 [\"EventName\"]",
+                    },
+                    "Filters": _FILTERS_SCHEMA,
+                    "Limit": {"type": "integer", "minimum": 1, "description": "返回的分组数，默认 100"},
+                },
+                "required": ["StartTime"],
+            },
+        ),
+        handler=aggregate_local_events,
+    ),
+]
@@ -4,6 +4,7 @@ import os
 import time
 import urllib.parse
 from contextvars import ContextVar
+from pathlib import Path
 from typing import Dict, Optional, Any, Sequence, Callable
 import aiohttp
 import uvicorn
@@ -20,15 +21,23 @@ from starlette.datastructures import Headers
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, RedirectResponse
+from starlette.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from starlette.routing import Mount, Route
 #  STDIO
 from mcp.server.stdio import stdio_server
 
+from .catalog import ActionMeta, ToolCatalog, load_catalog
+from .executor import UpstreamExecutor
+from .local_tool import DEFAULT_DATA_DIR, LocalContext, credential_identity, load_action_interceptors, \
+    load_local_tools
+from .metrics import metrics
 from .model import OAuthClientRegistration, TopResponseModel
-from .openapi import openapi_to_mcp_tools
-from .sdk_tool import create_api_client, create_universal_info
-from .utils import load_config, validate_auth_header, filter_params, load_swagger
+from .paginator import AUTO_PAGINATE_ARG, MAX_ITEMS_ARG, paginate
+from .response_cache import ResponseCache, is_read_action
+from .sdk_tool import ApiClientPool, create_universal_info
+from .token_store import create_token_store
+from .utils import load_config, validate_auth_header, filter_params
+from .validator import ArgumentValidationError
 from .variable import *
 
 # 定义auth_context
@@ -44,13 +53,26 @@ server = Server("mcp-server")
 # 获取全局配置
 server_config = load_config('cfg.yaml')
 
+# 按凭证复用的客户端池
+client_pool = ApiClientPool(max_size=server_config.client_pool_size, ttl=server_config.client_pool_ttl)
+
+# 上游调用在有界线程池中执行，避免阻塞事件循环
+upstream_executor = UpstreamExecutor(max_workers=server_config.upstream_concurrency,
+                                     timeout=server_config.upstream_timeout)
+
+# 只读 Action 的响应缓存，需在配置中开启
+response_cache = ResponseCache(max_bytes=server_config.response_cache_size,
+                               default_ttl=server_config.response_cache_ttl,
+                               action_ttls=server_config.response_cache_ttls) \
+    if server_config.response_cache else None
+
 
 class SSEMiddleware:
     def __init__(self, app: Callable):
         self.app = app
 
     async def __call__(self, scope: Dict, receive: Callable, send: Callable):
-        if scope.get("path") in OAUTH_HANDLED_PATHS:
+        if scope.get("path") in OAUTH_HANDLED_PATHS or scope.get("path") == METRICS_PATH:
             await self.app(scope, receive, send)
             return
         if scope["type"] != "http":
@@ -97,15 +119,195 @@ class SSEMiddleware:
         })
 
 
+def validate_arguments(catalog: ToolCatalog, name: str, service_code: str, arguments: dict) -> dict:
+    validator = catalog.validators.get(name)
+    if validator is None:
+        return arguments
+    try:
+        return validator.validate(arguments)
+    except ArgumentValidationError:
+        # 本地拒绝非法参数，节省一次上游调用
+        metrics.inc('mcp_validation_rejected_total', labels={'service': service_code})
+        raise
+
+
+async def invoke_action(catalog: ToolCatalog, client: Any, identity: str, name: str, arguments: dict) -> dict:
+    """校验参数并调用上游 Action（支持自动翻页与响应缓存），返回响应 Result"""
+    arguments = filter_params(arguments)
+    action = catalog.actions.get(name)
+    if action is None:
+        raise ValueError(f"Unknown tool: {name}")
+    metrics.inc('mcp_tool_calls_total', labels={'service': action.service_code})
+    arguments = validate_arguments(catalog, name, action.service_code, arguments)
+    if response_cache is None:
+        return await dispatch_action(client, action, name, arguments)
+    if not is_read_action(name):
+        try:
+            return await dispatch_action(client, action, name, arguments)
+        finally:
+            # 写操作可能改变同一服务中任意只读 Action 的结果
+            response_cache.invalidate(action.service_code)
+
+    # 参数经过校验与类型转换，相同语义的调用得到相同的缓存键
+    key = response_cache.key(identity, action.service_code, name, arguments)
+    resp = response_cache.get(key, action.service_code, name)
+    if resp is None:
+        resp = await dispatch_action(client, action, name, arguments)
+        response_cache.set(key, action.service_code, name, resp)
+    return resp
+
+
+async def dispatch_action(client: Any, action: ActionMeta, name: str, arguments: dict) -> dict:
+    """调用上游 Action，auto_paginate 为 true 时自动翻页"""
+    arguments = dict(arguments)
+    # 分页控制参数只在本地使用，不发送到上游
+    auto_paginate = arguments.pop(AUTO_PAGINATE_ARG, False)
+    max_items = arguments.pop(MAX_ITEMS_ARG, None) or server_config.paginate_max_items
+    info = create_universal_info(service=action.service_code, action=name, version=action.version,
+                                 method=action.method, content_type=action.content_type)
+
+    async def fetch(body: dict) -> dict:
+        page, status_code, resp_header = await upstream_executor.run(
+            client.do_call_with_http_info, info=info, body=body,
+            _request_timeout=server_config.upstream_timeout)
+        return page or {}
+
+    if auto_paginate and action.pagination is not None:
+        resp = await paginate(action.pagination, fetch, arguments, max_items,
+                              concurrency=server_config.paginate_concurrency)
+        metrics.inc('mcp_paginated_pages_total', resp['AutoPaginated']['Pages'],
+                    labels={'service': action.service_code})
+        return resp
+    return await fetch(arguments)
+
+
+async def call_action(catalog: ToolCatalog, name: str, arguments: dict
+                      ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    """使用当前凭证调用工具目录中的 Action 或本地工具"""
+    result: TopResponseModel
+    if server_config.credential == CREDENTIAL_TYPE_ENV:
+        ak = server_config.ak
+        sk = server_config.sk
+        session_token = server_config.sts_token
+        if ak is None and sk is None:
+            resp = {"Code": "Credential Not Set"}
+            result = TopResponseModel(**resp)
+            return [
+                TextContent(type="text", text=json.dumps(result.model_dump(), indent=2))
+            ]
+        client = client_pool.get(ak=ak, sk=sk, session_token=session_token)
+    else:
+        # 获取 Context
+        current_auth_info = auth_context.get()
+        if current_auth_info is None:
+            resp = {"Code": "Authorization Failed"}
+            result = TopResponseModel(**resp)
+            return [
+                TextContent(type="text", text=json.dumps(result.model_dump()))
+            ]
+        ak = current_auth_info['ak']
+        sk = current_auth_info['sk']
+        session_token = current_auth_info['session_token']
+        client = client_pool.get(
+            ak=ak, sk=sk,
+            session_token=session_token,
+            expired_time=current_auth_info.get('expired_time'))
+    identity = credential_identity(ak, sk, session_token)
+    context = LocalContext(
+        invoke=lambda action, body: invoke_action(catalog, client, identity, action, body),
+        identity=identity,
+        data_dir=Path(server_config.data_dir) if server_config.data_dir else DEFAULT_DATA_DIR,
+        config=server_config)
+    try:
+        local_tool = catalog.local_tools.get(name)
+        interceptor = catalog.interceptors.get(name)
+        if local_tool is not None:
+            metrics.inc('mcp_local_tool_calls_total', labels={'tool': name})
+            arguments = validate_arguments(catalog, name, 'local', filter_params(arguments))
+            resp = await local_tool.handler(context, arguments)
+        elif interceptor is not None:
+            action = catalog.actions[name]
+            arguments = validate_arguments(catalog, name, action.service_code, filter_params(arguments))
+            resp = await interceptor.handler(context, arguments)
+        else:
+            resp = await invoke_action(catalog, client, identity, name, arguments)
+        if resp is None:
+            resp = {}
+        result = TopResponseModel(**resp)
+        return [
+            TextContent(type="text", text=json.dumps(result.model_dump()))
+        ]
+    except ArgumentValidationError:
+        raise
+    except ApiException as apie:
+        error_message = getattr(apie, 'body', None)
+        if error_message is None:
+            raise ValueError(f"Error processing mcp-server-cloudidentity query: {str(apie)}")
+        raise ValueError(error_message)
+    except Exception as e:
+        raise ValueError(f"Error processing mcp-server-cloudidentity query: {str(e)}")
+
+
+def create_sse_routes(mcp_server: Server, prefix: str = '') -> list:
+    """为 MCP Server 创建 SSE 路由（{prefix}/sse 与 {prefix}/messages/）"""
+    sse = SseServerTransport(f"{prefix}/messages/")
+
+    async def handle_sse(request):
+        async with sse.connect_sse(
+                request.scope, request.receive, request._send
+        ) as streams:
+            await mcp_server.run(
+                streams[0], streams[1], mcp_server.create_initialization_options()
+            )
+
+    return [
+        Route(f"{prefix}/sse", endpoint=handle_sse),
+        Mount(f"{prefix}/messages/", app=sse.handle_post_message),
+    ]
+
+
+def create_app(routes: list) -> Starlette:
+    """在 MCP 路由之外挂载 OAuth、指标路由以及鉴权、CORS 中间件"""
+    middleware = []
+    if (server_config.auth == AUTH_TYPE_OAUTH or
+            server_config.credential == CREDENTIAL_TYPE_TOKEN):
+        middleware = [
+            Middleware(SSEMiddleware)
+        ]
+    starlette_app = Starlette(
+        routes=routes + [
+            # 添加OAuth相关路由
+            Route("/.well-known/oauth-authorization-server", endpoint=well_known),
+            Route("/auth/oauth/register", endpoint=oauth_register, methods=["POST"]),
+            Route("/auth/oauth/authorize", endpoint=oauth_authorize, methods=["GET"]),
+            Route("/auth/oauth/callback", endpoint=oauth_callback, methods=["GET"]),
+            Route("/auth/oauth/token", endpoint=oauth_token, methods=["POST"]),
+            Route(METRICS_PATH, endpoint=metrics_endpoint, methods=["GET"]),
+        ],
+        middleware=middleware
+    )
+
+    # 添加CORS中间件
+    starlette_app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=["*"],
+    )
+    return starlette_app
+
+
 async def serve() -> None:
-    mcp_tools = []
-    # 读取swagger
-    openapi_spec = load_swagger(f'{server_config.service_code}.json')
+    # 加载工具目录（优先使用预编译产物，未命中时编译swagger并缓存）
     try:
-        mcp_tools = openapi_to_mcp_tools(openapi_spec)
+        catalog = load_catalog(f'{server_config.service_code}.json', server_config.catalog_dir)
     except Exception as e:
         logger.error(f"openapi tools error: {e}")
         raise
+    catalog.add_local_tools(load_local_tools(__package__))
+    catalog.add_action_interceptors(load_action_interceptors(__package__))
+    mcp_tools = catalog.all_tools
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
@@ -115,95 +317,11 @@ async def serve() -> None:
     async def call_tool(
             name: str, arguments: dict
     ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        result: TopResponseModel
-        if server_config.credential == CREDENTIAL_TYPE_ENV:
-            ak = server_config.ak
-            sk = server_config.sk
-            session_token = server_config.sts_token
-            if ak is None and sk is None:
-                resp = {"Code": "Credential Not Set"}
-                result = TopResponseModel(**resp)
-                return [
-                    TextContent(type="text", text=json.dumps(result.model_dump(), indent=2))
-                ]
-            client = create_api_client(ak=ak, sk=sk, session_token=session_token)
-        else:
-            # 获取 Context
-            current_auth_info = auth_context.get()
-            if current_auth_info is None:
-                resp = {"Code": "Authorization Failed"}
-                result = TopResponseModel(**resp)
-                return [
-                    TextContent(type="text", text=json.dumps(result.model_dump()))
-                ]
-            client = create_api_client(
-                ak=current_auth_info['ak'], sk=current_auth_info['sk'],
-                session_token=current_auth_info['session_token'])
-        try:
-            arguments = filter_params(arguments)
-            paths = openapi_spec.get('paths').get(f'/{name}')
-            service_code = paths.get('x-service-code')
-            version = paths.get('x-version')
-            method = paths.get('x-method')
-            content_type = paths.get('x-content-type')
-            info = create_universal_info(service=service_code, action=name, version=version,
-                                         method=method, content_type=content_type)
-            resp, status_code, resp_header = client.do_call_with_http_info(info=info, body=arguments)
-            if resp is None:
-                resp = {}
-            result = TopResponseModel(**resp)
-            return [
-                TextContent(type="text", text=json.dumps(result.model_dump()))
-            ]
-        except ApiException as apie:
-            error_message = getattr(apie, 'body', None)
-            if error_message is None:
-                raise ValueError(f"Error processing mcp-server-cloudidentity query: {str(apie)}")
-            raise ValueError(error_message)
-        except Exception as e:
-            raise ValueError(f"Error processing mcp-server-cloudidentity query: {str(e)}")
+        return await call_action(catalog, name, arguments)
 
     if server_config.transport == TRANSPORT_SSE:
         # Create an SSE transport at an endpoint
-        sse = SseServerTransport("/messages/")
-
-        async def handle_sse(request):
-            async with sse.connect_sse(
-                    request.scope, request.receive, request._send
-            ) as streams:
-                await server.run(
-                    streams[0], streams[1], server.create_initialization_options()
-                )
-
-        middleware = []
-        if (server_config.auth == AUTH_TYPE_OAUTH or
-                server_config.credential == CREDENTIAL_TYPE_TOKEN):
-            middleware = [
-                Middleware(SSEMiddleware)
-            ]
-        starlette_app = Starlette(
-            routes=[
-                Route("/sse", endpoint=handle_sse),
-                Mount("/messages/", app=sse.handle_post_message),
-                # 添加OAuth相关路由
-                Route("/.well-known/oauth-authorization-server", endpoint=well_known),
-                Route("/auth/oauth/register", endpoint=oauth_register, methods=["POST"]),
-                Route("/auth/oauth/authorize", endpoint=oauth_authorize, methods=["GET"]),
-                Route("/auth/oauth/callback", endpoint=oauth_callback, methods=["GET"]),
-                Route("/auth/oauth/token", endpoint=oauth_token, methods=["POST"]),
-            ],
-            middleware=middleware
-        )
-
-        # 添加CORS中间件
-        starlette_app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            allow_headers=["*"],
-        )
-
+        starlette_app = create_app(create_sse_routes(server))
         config = uvicorn.Config(starlette_app, host="0.0.0.0", port=server_config.sse_port)
         sse_server = uvicorn.Server(config)
         await sse_server.serve()
@@ -214,6 +332,11 @@ async def serve() -> None:
             await server.run(read_stream, write_stream, options)
 
 
+async def metrics_endpoint(request: Optional[Request]):
+    """以 Prometheus 文本格式导出进程内指标"""
+    return PlainTextResponse(metrics.render())
+
+
 # OAuth处理函数
 async def well_known(request: Optional[Request]):
     """处理 .well-known/oauth-authorization-server 端点"""
@@ -276,7 +399,10 @@ async def oauth_register(request: Optional[Request]):
         return JSONResponse({"error": str(e)}, status_code=400)
 
 
-token_store = {}
+# OAuth 访问令牌存储（进程内 LRU 或多 worker 共享的 sqlite 文件）
+token_store = create_token_store(server_config.token_store, server_config.token_store_path,
+                                 max_size=server_config.token_store_size,
+                                 default_ttl=server_config.token_default_ttl)
 
 
 async def oauth_token(request: Request):
@@ -341,7 +467,7 @@ async def oauth_token(request: Request):
                         "error_description": response.get('error_description')
                     }, status_code=400)
 
-                token_store.setdefault(response.get('access_token'), "1")
+                token_store.set(response.get('access_token'), "1", int(response.get('expires_in') or 0))
                 # 成功获取令牌，返回给客户端
                 return JSONResponse({
                     "access_token": response.get('access_token'),
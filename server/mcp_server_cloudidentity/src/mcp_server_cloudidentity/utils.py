@@ -2,11 +2,12 @@ import json
 import os
 from pathlib import Path
 import base64
-from typing import Dict, Union, get_args
+from typing import Dict, List, Union, get_args
 
 import yaml
 
 from .model import *
+from .token_store import TokenStore
 from .variable import *
 
 
@@ -28,6 +29,20 @@ def load_swagger(file_name):
         raise IOError(f"读取swagger文件时发生错误: {str(e)}")
 
 
+def split_list(value: str) -> List[str]:
+    """将逗号分隔的字符串拆分为列表"""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def parse_bool(value: str) -> bool:
+    """将 true/false、1/0、yes/no 形式的字符串转换为布尔值"""
+    if value.strip().lower() in ('true', '1', 'yes', 'on'):
+        return True
+    if value.strip().lower() in ('false', '0', 'no', 'off'):
+        return False
+    raise ValueError(f"Invalid boolean value '{value}'")
+
+
 def load_config(file_name: Union[str, Path]) -> Config:
     config_path = ''
     try:
@@ -60,7 +75,26 @@ def load_config(file_name: Union[str, Path]) -> Config:
             auth=config_dict.get('auth', 'none'),
             credential=config_dict.get('credential', 'env'),
             sse_port=config_dict.get('sse_port', 8888),
-            oauth=oauth_config
+            oauth=oauth_config,
+            catalog_dir=config_dict.get('catalog_dir'),
+            client_pool_size=config_dict.get('client_pool_size', 64),
+            client_pool_ttl=config_dict.get('client_pool_ttl', 600),
+            upstream_concurrency=config_dict.get('upstream_concurrency', 32),
+            upstream_timeout=config_dict.get('upstream_timeout', 30),
+            gateway_services=config_dict.get('gateway_services'),
+            token_store=config_dict.get('token_store', 'memory'),
+            token_store_path=config_dict.get('token_store_path'),
+            token_store_size=config_dict.get('token_store_size', 10000),
+            token_default_ttl=config_dict.get('token_default_ttl', 86400),
+            paginate_concurrency=config_dict.get('paginate_concurrency', 4),
+            paginate_max_items=config_dict.get('paginate_max_items', 10000),
+            data_dir=config_dict.get('data_dir'),
+            response_cache=config_dict.get('response_cache', False),
+            response_cache_size=config_dict.get('response_cache_size', 64 * 1024 * 1024),
+            response_cache_ttl=config_dict.get('response_cache_ttl', 60),
+            response_cache_ttls=config_dict.get('response_cache_ttls'),
+            sts_cache=config_dict.get('sts_cache', True),
+            sts_refresh_margin=config_dict.get('sts_refresh_margin', 300)
         )
 
         env_mapping = [
@@ -71,6 +105,22 @@ def load_config(file_name: Union[str, Path]) -> Config:
             (MCP_SERVER_MODE, "transport", None, get_args(TransportType)),
             (MCP_SERVER_AUTH, "auth", None, get_args(AuthType)),
             (MCP_SERVER_PORT, "sse_port", int, None),
+            (MCP_SERVER_CATALOG_DIR, "catalog_dir", None, None),
+            (MCP_SERVER_CLIENT_POOL_SIZE, "client_pool_size", int, None),
+            (MCP_SERVER_CLIENT_POOL_TTL, "client_pool_ttl", int, None),
+            (MCP_SERVER_UPSTREAM_CONCURRENCY, "upstream_concurrency", int, None),
+            (MCP_SERVER_UPSTREAM_TIMEOUT, "upstream_timeout", int, None),
+            (MCP_SERVER_GATEWAY_SERVICES, "gateway_services", split_list, None),
+            (MCP_SERVER_TOKEN_STORE, "token_store", None, get_args(TokenStoreType)),
+            (MCP_SERVER_TOKEN_STORE_PATH, "token_store_path", None, None),
+            (MCP_SERVER_PAGINATE_CONCURRENCY, "paginate_concurrency", int, None),
+            (MCP_SERVER_PAGINATE_MAX_ITEMS, "paginate_max_items", int, None),
+            (MCP_SERVER_DATA_DIR, "data_dir", None, None),
+            (MCP_SERVER_RESPONSE_CACHE, "response_cache", parse_bool, None),
+            (MCP_SERVER_RESPONSE_CACHE_SIZE, "response_cache_size", int, None),
+            (MCP_SERVER_RESPONSE_CACHE_TTL, "response_cache_ttl", int, None),
+            (MCP_SERVER_STS_CACHE, "sts_cache", parse_bool, None),
+            (MCP_SERVER_STS_REFRESH_MARGIN, "sts_refresh_margin", int, None),
         ]
 
         for env_var, attr_name, converter, allowed_values in env_mapping:
@@ -90,7 +140,7 @@ def load_config(file_name: Union[str, Path]) -> Config:
 
 
 def validate_auth_header(auth_header: Optional[str], server_config: Optional[Config],
-                         token_store: Optional[dict]) -> Dict:
+                         token_store: Optional[TokenStore]) -> Dict:
     if not auth_header:
         return {"is_valid": False, "error": "Authorization header missing"}
     parts = auth_header.split()
@@ -112,7 +162,8 @@ def validate_auth_header(auth_header: Optional[str], server_config: Optional[Con
             credentials = {
                 "ak": data.get('AccessKeyId'),
                 "sk": data.get('SecretAccessKey'),
-                "session_token": data.get('SessionToken')
+                "session_token": data.get('SessionToken'),
+                "expired_time": data.get('ExpiredTime')
             }
             if credentials['ak'] is None or credentials['sk'] is None:
                 return {"is_valid": False, "error": "Incomplete credentials"}
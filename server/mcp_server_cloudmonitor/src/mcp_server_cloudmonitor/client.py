@@ -1,12 +1,17 @@
 import os
 import base64
 import json
-import volcenginesdkcore
 import volcenginesdkvolcobserve
 from mcp.server.fastmcp import Context
 from mcp.server.session import ServerSession
 from starlette.requests import Request
 
+from mcp_server_cloudmonitor.client_cache import ClientCache
+
+# 按 (AK, SessionToken, Region) 缓存客户端，不修改 volcenginesdkcore 的全局默认配置
+_clients = ClientCache()
+
+
 def init_client(region: str = None, ctx: Context = None):
     if "VOLCENGINE_ACCESS_KEY" not in os.environ or "VOLCENGINE_SECRET_KEY" not in os.environ:
         _ctx: Context[ServerSession, object] = ctx
@@ -35,6 +40,7 @@ def init_client(region: str = None, ctx: Context = None):
             ak = data.get('AccessKeyId')
             sk = data.get('SecretAccessKey')
             session_token = data.get('SessionToken')
+            expired_time = data.get('ExpiredTime')
 
         except Exception as e:
             raise ValueError("Decode authorization info error", e)
@@ -42,17 +48,10 @@ def init_client(region: str = None, ctx: Context = None):
         ak = os.environ["VOLCENGINE_ACCESS_KEY"]
         sk = os.environ["VOLCENGINE_SECRET_KEY"]
         session_token = ""
+        expired_time = None
 
-    configuration = volcenginesdkcore.Configuration()
-    configuration.ak = ak
-    configuration.sk = sk
-    if session_token:
-        configuration.session_token = session_token
     # Set region with default if needed
     region = region if region is not None else "cn-beijing"
     print(f"Using region: {region}")
-    configuration.region = region
-
-    # set default configuration
-    volcenginesdkcore.Configuration.set_default(configuration)
-    return volcenginesdkvolcobserve.VOLCOBSERVEApi()
\ No newline at end of file
+    return _clients.get(volcenginesdkvolcobserve.VOLCOBSERVEApi, ak, sk, session_token, region,
+                        expired_time=expired_time)
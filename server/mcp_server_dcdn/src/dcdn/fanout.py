@@ -0,0 +1,209 @@
+"""
+DCDN 监控统计请求扇出
+
+DescribeStatistics / DescribeOriginStatistics 单次请求的查询时间跨度受时间粒度限制（300 秒粒度不足 3 天，
+3600 秒粒度不足 31 天，86400 秒粒度不超过 31 天），超出的请求按允许的时间窗口拆分；
+域名列表按每批 50 个拆分。各子请求在速率限制下并发执行，结果按时间戳合并为一个响应：
+- 不同时间窗口的样本按时间戳去重拼接；
+- 不同域名批次同一时间点的指标按名称累加，只对可以累加的指标拆分域名批次（流量、请求数、状态码数量，
+  以及 300 秒粒度的峰值带宽与峰值 QPS），命中率等指标超过 50 个域名时直接报错。
+
+环境变量：
+- MCP_FANOUT_QPS: 扇出请求的速率上限（次/秒），默认 10
+- MCP_FANOUT_CONCURRENCY: 扇出请求的并发数，默认 8
+
+运行 `python -m src.dcdn.fanout` 在模拟的上游延迟下对比逐个请求与并发扇出的耗时。
+"""
+
+import asyncio
+import datetime
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+QPS = float(os.getenv("MCP_FANOUT_QPS", "10"))
+CONCURRENCY = int(os.getenv("MCP_FANOUT_CONCURRENCY", "8"))
+MAX_DOMAINS = 50
+
+DAY = 86400
+# 各时间粒度（秒）下单次请求允许的最大查询时间跨度（秒）
+MAX_SPAN = {300: 3 * DAY, 3600: 31 * DAY, 86400: 31 * DAY}
+ADDITIVE_METRICS = {"traffic", "request", "2xx", "3xx", "4xx", "5xx"}
+# 峰值带宽与峰值 QPS 只有在最小粒度下才能跨域名相加
+PEAK_METRICS = {"bandwidth", "QPS"}
+
+
+class RateLimiter:
+    """按固定间隔发放请求配额，允许 burst 个请求立即发出"""
+
+    def __init__(self, rate: float = QPS, burst: int = 1):
+        self.interval = 1 / rate
+        self.burst = burst
+        self.next_at = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self.next_at = max(self.next_at, now - (self.burst - 1) * self.interval)
+        wait = self.next_at - now
+        self.next_at += self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+limiter = RateLimiter()
+
+
+async def gather_limited(calls: Sequence[Callable[[], Awaitable[Any]]], concurrency: int = CONCURRENCY,
+                         rate_limiter: Optional[RateLimiter] = None) -> List[Any]:
+    """在并发数与速率限制下执行 calls，结果与 calls 顺序一致"""
+    semaphore = asyncio.Semaphore(concurrency)
+    rate_limiter = rate_limiter or limiter
+
+    async def run(call):
+        async with semaphore:
+            await rate_limiter.acquire()
+            return await call()
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
+def time_windows(start: int, end: int, span: int) -> List[Tuple[int, int]]:
+    """把 [start, end] 拆成不超过 span 秒的首尾相接的窗口"""
+    windows = []
+    while start <= end:
+        windows.append((start, min(start + span - 1, end)))
+        start += span
+    return windows
+
+
+def _parse_time(value: Any) -> Tuple[int, Optional[datetime.tzinfo]]:
+    """StartTime/EndTime 为 Unix 时间戳或 ISO 8601 时间，返回时间戳与时区（时间戳格式时为 None）"""
+    if isinstance(value, (int, float)) or str(value).isdigit():
+        return int(value), None
+    parsed = datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=8)))
+    return int(parsed.timestamp()), parsed.tzinfo
+
+
+def _format_time(timestamp: int, tz: Optional[datetime.tzinfo]) -> Any:
+    if tz is None:
+        return timestamp
+    return datetime.datetime.fromtimestamp(timestamp, tz).isoformat(timespec="seconds")
+
+
+def plan(body: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """拆分请求，返回子请求列表与拆分情况"""
+    (start, tz), (end, _) = _parse_time(body["StartTime"]), _parse_time(body["EndTime"])
+    interval = int(body.get("Interval") or (300 if end - start < 3 * DAY else 3600 if end - start < 31 * DAY else 86400))
+    if interval not in MAX_SPAN:
+        raise ValueError(f"不支持的时间粒度: {interval}")
+    domains = body.get("Domains") or []
+    batches = [domains[i:i + MAX_DOMAINS] for i in range(0, len(domains), MAX_DOMAINS)] or [[]]
+    if len(batches) > 1:
+        metrics = set(body.get("Metrics") or ["all"])
+        allowed = ADDITIVE_METRICS | (PEAK_METRICS if interval == 300 else set())
+        if not metrics <= allowed:
+            raise ValueError(f"指标 {', '.join(sorted(metrics - allowed))} 在时间粒度 {interval} 秒下不能跨域名批次合并，"
+                             f"请一次最多指定 {MAX_DOMAINS} 个域名")
+    windows = time_windows(start, end, MAX_SPAN[interval])
+    bodies = []
+    for batch in batches:
+        for window_start, window_end in windows:
+            sub = dict(body, StartTime=_format_time(window_start, tz), EndTime=_format_time(window_end, tz),
+                       Interval=interval)
+            if batch:
+                sub["Domains"] = batch
+            bodies.append(sub)
+    return bodies, {"Requests": len(bodies), "TimeWindows": len(windows), "DomainBatches": len(batches)}
+
+
+def merge(responses: List[Dict[str, Any]], windows: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    合并子请求的响应
+
+    responses 按域名批次、时间窗口的顺序排列；同一批次内按时间戳去重，不同批次同一时间点的同名指标相加。
+    """
+    samples: Dict[Any, Dict[str, float]] = {}
+    domain_count = 0
+    for batch_start in range(0, len(responses), windows):
+        batch: Dict[Any, Dict[str, float]] = {}
+        for response in responses[batch_start:batch_start + windows]:
+            for sample in (response.get("Result") or {}).get("Results") or []:
+                batch[sample["TimeStamp"]] = {info["Name"]: info["Value"] for info in sample.get("DetailInfo") or []}
+        for timestamp, detail in batch.items():
+            total = samples.setdefault(timestamp, {})
+            for name, value in detail.items():
+                total[name] = total[name] + value if name in total else value
+        domain_count += (responses[batch_start].get("Result") or {}).get("DomainCount") or 0
+    first = responses[0].get("Result") or {}
+    results = [{"TimeStamp": timestamp, "DetailInfo": [{"Name": name, "Value": value} for name, value in detail.items()]}
+               for timestamp, detail in sorted(samples.items(), key=lambda item: _parse_time(item[0])[0])]
+    return {
+        "ResponseMetadata": responses[0].get("ResponseMetadata"),
+        "Result": {"DomainCount": domain_count, "StartTime": body["StartTime"], "EndTime": body["EndTime"],
+                   "Metrics": first.get("Metrics"), "Results": results},
+    }
+
+
+async def fan_out(post: Callable[[str, Dict[str, Any], Dict[str, Any]], Awaitable[Dict[str, Any]]], action: str,
+                  params: Dict[str, Any], body: Dict[str, Any],
+                  rate_limiter: Optional[RateLimiter] = None) -> Dict[str, Any]:
+    """
+    拆分、并发请求并合并，不需要拆分时原样发送一次请求
+
+    Args:
+        post: 异步请求函数，如 service.async_post
+    """
+    if body.get("StartTime") in (None, "") or body.get("EndTime") in (None, ""):
+        return await post(action, params, body)
+    bodies, stats = plan(body)
+    if len(bodies) == 1:
+        return await post(action, params, body)
+    begin = time.perf_counter()
+    responses = await gather_limited([lambda sub=sub: post(action, params, sub) for sub in bodies],
+                                     rate_limiter=rate_limiter)
+    result = merge(responses, stats["TimeWindows"], body)
+    result["FanOut"] = dict(stats, ElapsedMs=round((time.perf_counter() - begin) * 1000, 1))
+    return result
+
+
+def benchmark(latency: float = 0.2, days: int = 30, domains: int = 200, interval: int = 300,
+              qps: float = QPS) -> Dict[str, Any]:
+    """模拟每次请求耗时 latency 秒的上游，对比逐个请求与速率上限为 qps 的并发扇出的耗时"""
+    tz = datetime.timezone(datetime.timedelta(hours=8))
+    end = datetime.datetime(2024, 3, 1, tzinfo=tz)
+    body = {"StartTime": (end - datetime.timedelta(days=days)).isoformat(),
+            "EndTime": (end - datetime.timedelta(seconds=1)).isoformat(), "Interval": interval,
+            "Metrics": ["traffic"], "Domains": [f"d{i}.example.com" for i in range(domains)]}
+
+    async def post(_action, _params, sub):
+        await asyncio.sleep(latency)
+        start, _ = _parse_time(sub["StartTime"])
+        stop, _ = _parse_time(sub["EndTime"])
+        return {"ResponseMetadata": {}, "Result": {"DomainCount": len(sub["Domains"]), "Metrics": ["traffic"], "Results": [
+            {"TimeStamp": _format_time(t, tz), "DetailInfo": [{"Name": "traffic", "Value": 1.0}]}
+            for t in range(start, stop + 1, interval)]}}
+
+    async def sequential():
+        bodies, stats = plan(body)
+        return merge([await post(None, None, sub) for sub in bodies], stats["TimeWindows"], body)
+
+    async def run():
+        begin = time.perf_counter()
+        serial = await sequential()
+        serial_seconds = time.perf_counter() - begin
+        begin = time.perf_counter()
+        parallel = await fan_out(post, "McpDescribeStatistics", {}, body, RateLimiter(qps))
+        parallel_seconds = time.perf_counter() - begin
+        assert parallel["Result"] == serial["Result"]
+        return {"requests": parallel["FanOut"]["Requests"], "samples": len(parallel["Result"]["Results"]),
+                "sequential_seconds": round(serial_seconds, 2), "fan_out_seconds": round(parallel_seconds, 2),
+                "speedup": round(serial_seconds / parallel_seconds, 1)}
+
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    for name, value in benchmark().items():
+        print(f"{name}: {value}")
@@ -1,15 +1,22 @@
 from src.dcdn.api.api import DcdnAPI
 from mcp.server.fastmcp import FastMCP
 from .note import note
+from .fanout import fan_out
+from .metric_cache import MetricSpec, cache
 import json
 
 
 def create_mcp_server():
     service = DcdnAPI()
+    account = service.service_info.credentials.ak
+    # 已结算的时序数据缓存在本地，只请求未缓存的尾部
+    series = MetricSpec()
     mcp = FastMCP(
         "DCDN MCP",
         instructions="Volcengine(火山引擎)全站加速 DCDN MCP，提供全站加速相关服务",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
@@ -133,16 +140,20 @@ def create_mcp_server():
         return reqs
 
     @mcp.tool()
-    def describe_origin_statistics(params: dict, body: dict) -> str:
+    async def describe_origin_statistics(params: dict, body: dict) -> str:
         """
         查询回源资源概况。
         Call steps:
         1. Pass "describe_origin_statistics" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_origin_statistics
+        查询时间跨度超过所选时间粒度允许的范围或 Domains 超过 50 个时，自动按时间窗口与域名批次拆分并发请求，合并为一个响应。
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_post("McpDescribeOriginStatistics", params, json.dumps(body))
+        action = "McpDescribeOriginStatistics?" + json.dumps(params, sort_keys=True)
+        reqs = await cache.afetch(account, action, body, series,
+                                  lambda sub: fan_out(service.async_post, "McpDescribeOriginStatistics", params, sub))
 
-        return reqs
+        return json.dumps(reqs, ensure_ascii=False)
 
     @mcp.tool()
     def describe_top_domains(params: dict, body: dict) -> str:
@@ -235,15 +246,19 @@ def create_mcp_server():
         return reqs
 
     @mcp.tool()
-    def describe_statistics(params: dict, body: dict) -> str:
+    async def describe_statistics(params: dict, body: dict) -> str:
         """
         查询客户端访问视角的监控统计数据。
         Call steps:
         1. Pass "describe_statistics" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_statistics
+        查询时间跨度超过所选时间粒度允许的范围或 Domains 超过 50 个时，自动按时间窗口与域名批次拆分并发请求，合并为一个响应。
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_post("McpDescribeStatistics", params, json.dumps(body))
+        action = "McpDescribeStatistics?" + json.dumps(params, sort_keys=True)
+        reqs = await cache.afetch(account, action, body, series,
+                                  lambda sub: fan_out(service.async_post, "McpDescribeStatistics", params, sub))
 
-        return reqs
+        return json.dumps(reqs, ensure_ascii=False)
 
     return mcp
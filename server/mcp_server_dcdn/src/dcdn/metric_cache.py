@@ -0,0 +1,345 @@
+"""
+指标数据的已结算时间桶缓存
+
+用量与监控数据在结算延迟（默认 12 小时）之后不再变化。对指定了时间粒度的时序查询，
+按 (账号, Action, 查询维度, 时间粒度, 时间桶起点) 把已结算的时间桶永久保存在本地磁盘（SQLite）上；
+再次查询时只把第一个未缓存的时间桶到结束时间的部分发往上游，再与缓存的时间桶合并为一个响应。
+
+时间桶按粒度对齐到绝对时间（按天及以上的粒度对齐到服务端时区 UTC+8 或请求时间自带时区的零点），
+与请求的开始时间无关，开始时间不断后移的看板也能命中之前查询缓存的时间桶；数据点的 TimeStamp 为所在时间桶的起点，
+起点落在 [开始时间, 结束时间] 内的时间桶属于该请求，起点加粒度不晚于当前时间减去结算延迟的时间桶已结算。
+每分钟轮询最近一段时间的看板因此只需请求尚未结算的尾部，整段时间都已缓存时不请求上游。
+
+响应中元素都带 TimeStamp 字段的记录数组视为数据点数组，数据点所在的位置由路径上各层记录的字符串字段
+（如 Metric、Domain、ISP）确定；合并后按 MetricSpec.aggregates 重新计算同一层级的汇总字段（如 TotalTraffic）。
+
+环境变量：
+- MCP_METRIC_CACHE: 是否启用，默认 true
+- MCP_METRIC_CACHE_PATH: 缓存文件路径，默认 ~/.cache/mcp-server/metric_cache.sqlite3
+- MCP_METRIC_CACHE_SETTLE: 结算延迟（秒），结束时间早于当前时间减去该值的时间桶才会缓存，默认 43200
+"""
+
+import copy
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+ENABLED = os.getenv("MCP_METRIC_CACHE", "true").lower() not in ("0", "false", "no")
+PATH = os.path.expanduser(os.getenv("MCP_METRIC_CACHE_PATH", "~/.cache/mcp-server/metric_cache.sqlite3"))
+SETTLE = int(os.getenv("MCP_METRIC_CACHE_SETTLE", "43200"))
+TIMESTAMP = "TimeStamp"
+# 服务端统计按天汇总时使用的时区
+PROVIDER_UTC_OFFSET = 8 * 3600
+
+# 时间桶的划分方式变化时递增，打开旧版本的缓存文件时清空缓存
+SCHEMA_VERSION = 2
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT, granularity INTEGER, bucket INTEGER, points TEXT,
+    PRIMARY KEY (key, granularity, bucket)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS templates (
+    key TEXT, granularity INTEGER, template TEXT,
+    PRIMARY KEY (key, granularity)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """
+    单个 Action 的缓存方式
+
+    Args:
+        interval: 时间粒度参数名
+        intervals: 时间粒度取值到秒数的映射，None 表示取值本身就是秒数
+        default_interval: 未指定时间粒度时上游使用的粒度（秒），None 表示未指定粒度的请求不缓存
+        aggregates: 汇总字段 -> ("sum" 或 "max", 数据点中的字段)
+    """
+    interval: str = "Interval"
+    intervals: Optional[Mapping[str, int]] = None
+    default_interval: Optional[int] = None
+    aggregates: Mapping[str, Tuple[str, str]] = field(default_factory=dict)
+    start: str = "StartTime"
+    end: str = "EndTime"
+
+
+@dataclass
+class Plan:
+    spec: MetricSpec
+    request: Dict[str, Any]
+    key: str
+    granularity: int
+    # 时间桶对齐的时区偏移（秒）
+    offset: int
+    start: int
+    end: int
+    # 已结算时间桶的结束位置（不含）、第一个未缓存的时间桶
+    closed: int
+    first_missing: int
+    time_format: Any
+    cached: Dict[int, str]
+
+    def bucket(self, timestamp: int) -> int:
+        """timestamp 所在时间桶的起点"""
+        return align(timestamp, self.granularity, self.offset)
+
+    def upstream_request(self) -> Optional[Dict[str, Any]]:
+        """发往上游的请求，整段时间都已缓存时为 None"""
+        if self.first_missing > self.end:
+            return None
+        if not self.cached:
+            return self.request
+        return dict(self.request, **{self.spec.start: format_time(self.first_missing, self.time_format)})
+
+
+def align(timestamp: int, granularity: int, offset: int) -> int:
+    """按粒度向下对齐到时区偏移为 offset 的绝对时间"""
+    return (timestamp + offset) // granularity * granularity - offset
+
+
+def utc_offset(time_format: Any) -> int:
+    """请求时间自带时区时使用该时区，否则使用服务端时区"""
+    if isinstance(time_format, datetime.tzinfo):
+        delta = time_format.utcoffset(None)
+        if delta is not None:
+            return int(delta.total_seconds())
+    return PROVIDER_UTC_OFFSET
+
+
+def parse_time(value: Any) -> Tuple[int, Any]:
+    """返回 Unix 时间戳与原始格式（int、str 表示数字时间戳，否则为 ISO 8601 时间的时区）"""
+    if isinstance(value, (int, float)):
+        return int(value), int
+    text = str(value)
+    if text.isdigit():
+        return int(text), str
+    parsed = datetime.datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=8)))
+    return int(parsed.timestamp()), parsed.tzinfo
+
+
+def format_time(timestamp: int, time_format: Any) -> Any:
+    if time_format is int:
+        return timestamp
+    if time_format is str:
+        return str(timestamp)
+    return datetime.datetime.fromtimestamp(timestamp, time_format).isoformat(timespec="seconds")
+
+
+def _identity(item: Dict[str, Any]) -> Dict[str, str]:
+    return {key: value for key, value in item.items() if isinstance(value, str)}
+
+
+def _is_points(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) and TIMESTAMP in item for item in value)
+
+
+def _point_lists(value: Any, path: Tuple = ()) -> Iterator[Tuple[Tuple, List[Dict[str, Any]]]]:
+    """响应中的全部数据点数组及其路径，路径中的列表元素用其字符串字段表示"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if _is_points(item):
+                yield path + (key,), item
+            else:
+                yield from _point_lists(item, path + (key,))
+    elif isinstance(value, list):
+        for item in value:
+            if isinstance(item, dict):
+                yield from _point_lists(item, path + (_identity(item),))
+
+
+def _insert(root: Dict[str, Any], path: List[Any], points: List[Dict[str, Any]]) -> None:
+    node: Any = root
+    for index, step in enumerate(path):
+        if isinstance(step, dict):
+            for item in node:
+                if isinstance(item, dict) and _identity(item) == step:
+                    node = item
+                    break
+            else:
+                node.append(dict(step))
+                node = node[-1]
+        else:
+            container = list if index == len(path) - 1 or isinstance(path[index + 1], dict) else dict
+            if not isinstance(node.get(step), container):
+                node[step] = container()
+            node = node[step]
+    node.extend(points)
+
+
+def _normalize(value: Any, aggregates: Mapping[str, Tuple[str, str]]) -> None:
+    """数据点按时间排序去重，并重新计算汇总字段"""
+    if isinstance(value, list):
+        for item in value:
+            _normalize(item, aggregates)
+        return
+    if not isinstance(value, dict):
+        return
+    for key, item in value.items():
+        if _is_points(item):
+            unique = {parse_time(point[TIMESTAMP])[0]: point for point in item}
+            item[:] = [unique[timestamp] for timestamp in sorted(unique)]
+        else:
+            _normalize(item, aggregates)
+    for name, (operator, source) in aggregates.items():
+        if name not in value:
+            continue
+        numbers = [point[source] for item in value.values() if _is_points(item) for point in item
+                   if isinstance(point.get(source), (int, float))]
+        if numbers:
+            value[name] = sum(numbers) if operator == "sum" else max(numbers)
+
+
+class _Refetch(Exception):
+    pass
+
+
+class MetricCache:
+    def __init__(self, path: str = PATH, settle: int = SETTLE, enabled: bool = ENABLED):
+        self.path = path
+        self.settle = settle
+        self.enabled = enabled
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                db.executescript("DROP TABLE IF EXISTS buckets; DROP TABLE IF EXISTS templates;")
+                db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            db.executescript(SCHEMA)
+            self._db = db
+        return self._db
+
+    def plan(self, account: str, action: str, request: Dict[str, Any], spec: MetricSpec) -> Optional[Plan]:
+        """查找已缓存的时间桶，返回 None 表示该请求不缓存"""
+        if not self.enabled or request.get(spec.start) in (None, "") or request.get(spec.end) in (None, ""):
+            return None
+        raw = request.get(spec.interval)
+        try:
+            if raw in (None, ""):
+                granularity = spec.default_interval
+            else:
+                granularity = spec.intervals.get(str(raw)) if spec.intervals is not None else int(raw)
+            start, time_format = parse_time(request[spec.start])
+            end, _ = parse_time(request[spec.end])
+        except (TypeError, ValueError):
+            return None
+        if not granularity:
+            return None
+        offset = utc_offset(time_format)
+        dimensions = {name: value for name, value in request.items() if name not in (spec.start, spec.end, spec.interval)}
+        key = hashlib.sha256(json.dumps([account, action, dimensions, offset], sort_keys=True,
+                                        default=str).encode()).hexdigest()
+        # 请求包含起点在 [start, end] 内的对齐时间桶，其中 bucket + granularity <= now - settle 的已结算
+        first = -align(-start, granularity, -offset)
+        last_settled = align(int(time.time()) - self.settle - granularity, granularity, offset)
+        closed = max(first, min(align(end, granularity, offset), last_settled) + granularity)
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT bucket, points FROM buckets WHERE key = ? AND granularity = ? AND bucket >= ? AND bucket < ?",
+                (key, granularity, first, closed)).fetchall()
+        stored = dict(rows)
+        first_missing = first
+        while first_missing < closed and first_missing in stored:
+            first_missing += granularity
+        cached = {bucket: stored[bucket] for bucket in range(first, first_missing, granularity)}
+        return Plan(spec, request, key, granularity, offset, start, end, closed, first_missing, time_format, cached)
+
+    def _store(self, plan: Plan, response: Dict[str, Any]) -> None:
+        buckets: Dict[int, List] = {bucket: [] for bucket in range(plan.first_missing, plan.closed, plan.granularity)}
+        template = copy.deepcopy(response)
+        for path, points in _point_lists(response):
+            for point in points:
+                timestamp, _ = parse_time(point[TIMESTAMP])
+                bucket = plan.bucket(timestamp)
+                if bucket in buckets:
+                    buckets[bucket].append([list(path), point])
+        for _, points in _point_lists(template):
+            points.clear()
+        rows = [(plan.key, plan.granularity, bucket, json.dumps(points, ensure_ascii=False))
+                for bucket, points in buckets.items()]
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.execute("BEGIN")
+                db.executemany("INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)", rows)
+                db.execute("INSERT OR REPLACE INTO templates VALUES (?, ?, ?)",
+                           (plan.key, plan.granularity, json.dumps(template, ensure_ascii=False)))
+
+    def complete(self, plan: Plan, response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """保存上游响应中已结算的时间桶，再与缓存的时间桶合并；response 为 None 表示没有请求上游"""
+        if response is None:
+            with self._lock:
+                row = self._connect().execute("SELECT template FROM templates WHERE key = ? AND granularity = ?",
+                                              (plan.key, plan.granularity)).fetchone()
+            response = json.loads(row[0]) if row else {"Result": {}}
+        else:
+            if (response.get("ResponseMetadata") or {}).get("Error") or not isinstance(response.get("Result"), dict):
+                return response
+            try:
+                self._store(plan, response)
+            except (KeyError, TypeError, ValueError):
+                # 无法识别数据点的时间时不缓存；上游只返回了未缓存的部分时，改为请求整段时间
+                if plan.cached:
+                    raise _Refetch()
+                return response
+        if not plan.cached:
+            return response
+        for bucket in plan.cached.values():
+            for path, point in json.loads(bucket):
+                if plan.start <= parse_time(point[TIMESTAMP])[0] <= plan.end:
+                    _insert(response, path, [point])
+        _normalize(response, plan.spec.aggregates)
+        result = response["Result"]
+        for name in (plan.spec.start, plan.spec.end):
+            if name in result:
+                result[name] = plan.request[name]
+        response["MetricCache"] = {
+            "CachedBuckets": len(plan.cached),
+            "UpstreamStartTime": format_time(plan.first_missing, plan.time_format) if plan.upstream_request() else None,
+        }
+        return response
+
+    def fetch(self, account: str, action: str, request: Dict[str, Any], spec: MetricSpec,
+              fetch: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        带缓存地查询
+
+        Args:
+            fetch: 请求上游并返回解析后的响应，参数为（可能缩短了时间段的）请求
+        """
+        plan = self.plan(account, action, request, spec)
+        if plan is None:
+            return fetch(request)
+        upstream = plan.upstream_request()
+        try:
+            return self.complete(plan, fetch(upstream) if upstream is not None else None)
+        except _Refetch:
+            return fetch(request)
+
+    async def afetch(self, account: str, action: str, request: Dict[str, Any], spec: MetricSpec,
+                     fetch: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """fetch 的异步版本"""
+        plan = self.plan(account, action, request, spec)
+        if plan is None:
+            return await fetch(request)
+        upstream = plan.upstream_request()
+        try:
+            return self.complete(plan, await fetch(upstream) if upstream is not None else None)
+        except _Refetch:
+            return await fetch(request)
+
+
+cache = MetricCache()
@@ -26,8 +26,9 @@ def get_auth_info():
         ak = data.get("AccessKeyId")
         sk = data.get("SecretAccessKey")
         session_token = data.get("SessionToken")
+        expired_time = data.get("ExpiredTime")
 
-        return ak, sk, session_token
+        return ak, sk, session_token, expired_time
 
     except Exception as e:
         LOG.error(f"Decode authorization info error: {e}")
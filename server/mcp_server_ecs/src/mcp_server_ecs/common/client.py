@@ -4,10 +4,13 @@ import volcenginesdkcore
 from volcenginesdkecs.api.ecs_api import ECSApi
 
 from mcp_server_ecs.common.auth import get_auth_info
+from mcp_server_ecs.common.client_cache import ClientCache
 from mcp_server_ecs.common.config import auth_config, deploy_config
 from mcp_server_ecs.common.logs import LOG
 
 _ecs_local_client = None
+# 远程模式下按 (AK, SessionToken, Region) 缓存客户端
+_ecs_clients = ClientCache()
 
 
 def get_volc_ecs_client(region: str = None) -> ECSApi:
@@ -29,22 +32,14 @@ def get_volc_ecs_client(region: str = None) -> ECSApi:
                     os.environ.get("VOLCENGINE_ENDPOINT") or auth_config["endpoint"]
                 )
                 ecs_config.client_side_validation = True
-                volcenginesdkcore.Configuration.set_default(ecs_config)
-                _ecs_local_client = ECSApi()
+                _ecs_local_client = ECSApi(volcenginesdkcore.ApiClient(ecs_config))
 
             return _ecs_local_client
 
         else:
-            ak, sk, session_token = get_auth_info()
-            ecs_config = volcenginesdkcore.Configuration()
-            ecs_config.ak = ak
-            ecs_config.sk = sk
-            ecs_config.session_token = session_token
-            ecs_config.client_side_validation = True
-            ecs_config.region = region
-            volcenginesdkcore.Configuration.set_default(ecs_config)
-
-            return ECSApi()
+            ak, sk, session_token, expired_time = get_auth_info()
+            return _ecs_clients.get(ECSApi, ak, sk, session_token, region, expired_time=expired_time,
+                                    client_side_validation=True)
 
     except Exception as e:
         LOG.error(f"Failed to get volc ecs client: {e}")
@@ -10,6 +10,8 @@ def create_mcp_server():
         "mcp-server-enterprise",
         instructions="Volcengine(火山引擎) 企业服务-商标服务 MCP , 你的商标注册、管理助手",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
@@ -0,0 +1,232 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from fastmcp.utilities.logging import configure_logging, get_logger
+from mcp.types import Tool
+
+from .local_tool import ActionInterceptor, LocalTool
+from .openapi import RefResolver, openapi_to_mcp_tools
+from .paginator import Pagination, detect_pagination, pagination_schema
+from .utils import load_swagger
+from .validator import ArgumentValidator
+
+# 定义logger
+logger = get_logger(__name__)
+configure_logging("INFO")
+
+# 目录产物格式版本，编译逻辑变化时需递增，使旧产物自动失效
+CATALOG_VERSION = 3
+CATALOG_SUFFIX = '.catalog.json'
+# 未配置缓存目录时使用的默认目录
+DEFAULT_CATALOG_DIR = Path(tempfile.gettempdir()) / 'mcp-server-catalog'
+
+
+@dataclass
+class ActionMeta:
+    """单个 Action 的调用元数据，对应 swagger path 上的 x-* 扩展字段"""
+    service_code: Optional[str]
+    version: Optional[str]
+    method: Optional[str]
+    content_type: Optional[str]
+    # 从 swagger 识别出的分页方式，非分页接口为 None
+    pagination: Optional[Pagination] = None
+
+    def __post_init__(self):
+        # 从目录产物加载时为 dict
+        if isinstance(self.pagination, dict):
+            self.pagination = Pagination(**self.pagination)
+
+
+@dataclass
+class ToolCatalog:
+    """编译后的工具目录：MCP Tool 列表 + 按 Action 名索引的调用元数据与参数校验器"""
+    digest: str
+    tools: List[Tool]
+    actions: Dict[str, ActionMeta]
+    validators: Dict[str, ArgumentValidator] = field(default_factory=dict, repr=False)
+    # 服务包 extensions 模块声明的本地工具，不写入目录产物
+    local_tools: Dict[str, LocalTool] = field(default_factory=dict, repr=False)
+    interceptors: Dict[str, ActionInterceptor] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        # 参数校验器由 inputSchema 在加载时编译一次，不写入目录产物
+        if not self.validators:
+            self.validators = {tool.name: ArgumentValidator(tool.name, tool.inputSchema) for tool in self.tools}
+
+    @property
+    def all_tools(self) -> List[Tool]:
+        return self.tools + [local_tool.tool for local_tool in self.local_tools.values()]
+
+    def add_local_tools(self, local_tools: Dict[str, LocalTool]) -> None:
+        for name, local_tool in local_tools.items():
+            if name in self.actions:
+                logger.error(f"警告：本地工具 '{name}' 与 swagger 中的 Action 重名，已忽略。")
+                continue
+            self.local_tools[name] = local_tool
+            self.validators[name] = ArgumentValidator(name, local_tool.tool.inputSchema)
+
+    def add_action_interceptors(self, interceptors: Dict[str, ActionInterceptor]) -> None:
+        for name, interceptor in interceptors.items():
+            if name not in self.actions:
+                logger.error(f"警告：拦截器对应的 Action '{name}' 不存在，已忽略。")
+                continue
+            self.interceptors[name] = interceptor
+
+
+def swagger_digest(raw: bytes) -> str:
+    """计算 swagger 文件内容与目录格式版本的联合哈希，作为产物的缓存键"""
+    hasher = hashlib.sha256()
+    hasher.update(f'catalog-v{CATALOG_VERSION}:'.encode('utf-8'))
+    hasher.update(raw)
+    return hasher.hexdigest()
+
+
+def artifact_name(file_name: str, digest: str) -> str:
+    return f'{Path(file_name).stem}.{digest[:16]}{CATALOG_SUFFIX}'
+
+
+def compile_catalog(openapi_spec: Dict[str, Any], digest: str) -> ToolCatalog:
+    """
+    将 swagger 文档编译为工具目录（解析 $ref 并生成 Tool，同时提取每个 Action 的调用元数据与分页方式）
+    """
+    tools = openapi_to_mcp_tools(openapi_spec)
+    resolver = RefResolver(openapi_spec)
+    actions: Dict[str, ActionMeta] = {}
+    for path, path_item in (openapi_spec.get('paths') or {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        pagination = None
+        for method, operation in path_item.items():
+            if method.startswith('x-') or method == 'parameters' or not isinstance(operation, dict):
+                continue
+            try:
+                pagination = detect_pagination(resolver, path_item, operation)
+            except ValueError as e:
+                logger.error(f"警告：Action {path} 分页参数识别失败，将不支持自动翻页: {e}")
+            break
+        actions[path.lstrip('/')] = ActionMeta(
+            service_code=path_item.get('x-service-code'),
+            version=path_item.get('x-version'),
+            method=path_item.get('x-method'),
+            content_type=path_item.get('x-content-type'),
+            pagination=pagination,
+        )
+
+    # 分页接口额外暴露 auto_paginate / max_items 参数（生成 Tool 时 properties 为新建字典，可直接修改）
+    for tool in tools:
+        meta = actions.get(tool.name)
+        if meta is not None and meta.pagination is not None:
+            tool.inputSchema.setdefault('properties', {}).update(pagination_schema())
+    return ToolCatalog(digest=digest, tools=tools, actions=actions)
+
+
+def dump_catalog(catalog: ToolCatalog, target: Path) -> None:
+    """原子写入目录产物，避免多个进程同时冷启动时读到半截文件"""
+    data = {
+        'version': CATALOG_VERSION,
+        'digest': catalog.digest,
+        'tools': [tool.model_dump(mode='json', exclude_none=True) for tool in catalog.tools],
+        'actions': {name: asdict(meta) for name, meta in catalog.actions.items()},
+    }
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_catalog(source: Path, digest: str) -> Optional[ToolCatalog]:
+    """读取目录产物，不存在或与当前 swagger 不匹配时返回 None"""
+    try:
+        with open(source, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.error(f"警告：目录产物 {source} 读取失败，将重新编译: {e}")
+        return None
+    if data.get('version') != CATALOG_VERSION or data.get('digest') != digest:
+        return None
+    return ToolCatalog(
+        digest=digest,
+        tools=[Tool.model_validate(tool) for tool in data['tools']],
+        actions={name: ActionMeta(**meta) for name, meta in data['actions'].items()},
+    )
+
+
+def load_catalog(file_name: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None) -> ToolCatalog:
+    """
+    加载工具目录。
+
+    依次查找构建期预编译在 config 目录下的产物和运行期缓存目录下的产物，
+    均未命中时编译 swagger 并写入缓存目录，后续启动直接加载产物。
+
+    Args:
+        file_name: swagger 文件名（位于 config 目录）或 swagger 文件的绝对路径
+        cache_dir: 运行期缓存目录，默认使用系统临时目录
+
+    Returns:
+        ToolCatalog
+    """
+    swagger_path = Path(__file__).parent / 'config' / file_name
+    try:
+        raw = swagger_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"swagger文件未找到: {swagger_path}")
+    digest = swagger_digest(raw)
+    name = artifact_name(file_name, digest)
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CATALOG_DIR
+
+    for directory in (swagger_path.parent, cache_dir):
+        catalog = read_catalog(directory / name, digest)
+        if catalog is not None:
+            return catalog
+
+    catalog = compile_catalog(load_swagger(file_name), digest)
+    try:
+        dump_catalog(catalog, cache_dir / name)
+    except OSError as e:
+        logger.error(f"警告：目录产物写入 {cache_dir} 失败，下次启动将重新编译: {e}")
+    return catalog
+
+
+# 构建期预编译并对比启动耗时: python -m mcp_server_iam.catalog
+if __name__ == "__main__":
+    from .utils import load_config
+
+    rounds = 20
+    swagger_file = f'{load_config("cfg.yaml").service_code}.json'
+    config_dir = Path(__file__).parent / 'config'
+    raw_bytes = (config_dir / swagger_file).read_bytes()
+    swagger_hash = swagger_digest(raw_bytes)
+    artifact = config_dir / artifact_name(swagger_file, swagger_hash)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        compiled = compile_catalog(load_swagger(swagger_file), swagger_hash)
+    cold = (time.perf_counter() - start) / rounds
+
+    for stale in config_dir.glob(f'{Path(swagger_file).stem}.*{CATALOG_SUFFIX}'):
+        stale.unlink()
+    dump_catalog(compiled, artifact)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        load_catalog(swagger_file)
+    warm = (time.perf_counter() - start) / rounds
+
+    print(f"artifact: {artifact}")
+    print(f"tools: {len(compiled.tools)}, actions: {len(compiled.actions)}")
+    print(f"compile from swagger: {cold * 1000:.2f} ms")
+    print(f"load from artifact:   {warm * 1000:.2f} ms ({cold / warm:.1f}x)")
@@ -0,0 +1,196 @@
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import uvicorn
+from mcp.server import Server
+from mcp.server.stdio import stdio_server
+from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
+
+from .catalog import ToolCatalog, load_catalog
+from .local_tool import load_action_interceptors, load_local_tools
+from .server import call_action, create_app, create_sse_routes, logger, server_config
+from .variable import *
+
+
+def resolve_spec_path(service: str) -> Path:
+    """
+    定位服务的 swagger 文件，支持：
+    - 直接给出 .json 文件路径
+    - 已安装的 mcp_server_<service> 包内的 config/<service>.json
+    - 代码库中的 server/mcp_server_<service>/src/mcp_server_<service>/config/<service>.json
+    """
+    candidate = Path(service)
+    if candidate.suffix == '.json':
+        if not candidate.is_file():
+            raise FileNotFoundError(f"swagger文件未找到: {candidate}")
+        return candidate.resolve()
+
+    package = f'mcp_server_{service}'
+    if package == __package__:
+        return Path(__file__).parent / 'config' / f'{service}.json'
+    spec = importlib.util.find_spec(package)
+    if spec is not None and spec.submodule_search_locations:
+        path = Path(list(spec.submodule_search_locations)[0]) / 'config' / f'{service}.json'
+        if path.is_file():
+            return path
+    path = Path(__file__).parents[3] / package / 'src' / package / 'config' / f'{service}.json'
+    if path.is_file():
+        return path
+    raise ValueError(f"无法定位服务 {service} 的 swagger 文件，请安装 {package} 或直接指定 json 路径")
+
+
+def load_service_catalogs(services: Sequence[str]) -> Dict[str, ToolCatalog]:
+    catalogs: Dict[str, ToolCatalog] = {}
+    for service in services:
+        name = Path(service).stem if service.endswith('.json') else service
+        if name in catalogs:
+            raise ValueError(f"重复的网关服务: {name}")
+        catalogs[name] = load_catalog(resolve_spec_path(service), server_config.catalog_dir)
+        if not service.endswith('.json'):
+            catalogs[name].add_local_tools(load_local_tools(f'mcp_server_{name}'))
+            catalogs[name].add_action_interceptors(load_action_interceptors(f'mcp_server_{name}'))
+    return catalogs
+
+
+def create_gateway_server(catalogs: Dict[str, ToolCatalog], prefixed: bool) -> Server:
+    """
+    创建承载一个或多个服务的 MCP Server
+
+    prefixed 为 True 时工具名以 `<服务名>_` 为前缀，用于在同一个会话中暴露多个服务的工具。
+    """
+    title = "mcp-server-" + "-".join(catalogs)
+    gateway_server = Server(title)
+    tools: List[Tool] = []
+    routes: Dict[str, Tuple[ToolCatalog, str]] = {}
+    for service, catalog in catalogs.items():
+        for tool in catalog.all_tools:
+            tool_name = f'{service}_{tool.name}' if prefixed else tool.name
+            if tool_name in routes:
+                logger.error(f"警告：网关中存在重名工具 '{tool_name}'，服务 {service} 的同名工具将被忽略。")
+                continue
+            if len(tool_name) > 64:
+                logger.error(f"警告：网关工具名 '{tool_name}' 超过 64 个字符，部分客户端可能无法识别。")
+            routes[tool_name] = (catalog, tool.name)
+            tools.append(tool.model_copy(update={'name': tool_name}) if prefixed else tool)
+
+    @gateway_server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return tools
+
+    @gateway_server.call_tool()
+    async def call_tool(
+            name: str, arguments: dict
+    ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        route = routes.get(name)
+        if route is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return await call_action(route[0], route[1], arguments)
+
+    return gateway_server
+
+
+def create_gateway_app(catalogs: Dict[str, ToolCatalog]):
+    """
+    SSE 模式下每个服务挂载在 /<服务名>/sse，另在 /sse 提供带服务名前缀的聚合入口；
+    所有服务共享客户端池、上游执行器、令牌存储与指标。
+    """
+    routes = []
+    for service, catalog in catalogs.items():
+        routes += create_sse_routes(create_gateway_server({service: catalog}, prefixed=False), f'/{service}')
+    routes += create_sse_routes(create_gateway_server(catalogs, prefixed=True))
+    return create_app(routes)
+
+
+async def serve_gateway(services: Optional[Sequence[str]] = None) -> None:
+    services = services or server_config.gateway_services or [server_config.service_code]
+    try:
+        catalogs = load_service_catalogs(services)
+    except Exception as e:
+        logger.error(f"openapi tools error: {e}")
+        raise
+    logger.info(f"gateway services: {', '.join(catalogs)}")
+
+    if server_config.transport == TRANSPORT_SSE:
+        config = uvicorn.Config(create_gateway_app(catalogs), host="0.0.0.0", port=server_config.sse_port)
+        sse_server = uvicorn.Server(config)
+        await sse_server.serve()
+    else:
+        # STDIO 只有一个会话，使用带服务名前缀的聚合工具
+        gateway_server = create_gateway_server(catalogs, prefixed=True)
+        options = gateway_server.create_initialization_options()
+        async with stdio_server() as (read_stream, write_stream):
+            await gateway_server.run(read_stream, write_stream, options)
+
+
+def _rss_kb() -> int:
+    with open('/proc/self/status', 'r') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def _benchmark_child(services: List[str], call: Optional[str], rounds: int) -> None:
+    """基准测试子进程：加载服务并构建应用，输出 RSS 与（可选的）调用 p99 延迟"""
+    catalogs = load_service_catalogs(services)
+    create_gateway_app(catalogs)
+    latencies = []
+    if call:
+        service, action = call.split(':', 1)
+        if service in catalogs:
+            async def run_calls():
+                for _ in range(rounds):
+                    start = time.perf_counter()
+                    await call_action(catalogs[service], action, {})
+                    latencies.append(time.perf_counter() - start)
+            asyncio.run(run_calls())
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000 if latencies else None
+    print(json.dumps({'rss_kb': _rss_kb(), 'p99_ms': p99}))
+
+
+def benchmark(services: List[str], call: Optional[str], rounds: int) -> None:
+    """对比 N 个独立进程与单个网关进程的 RSS 以及调用 p99 延迟"""
+
+    def spawn(names: List[str]) -> dict:
+        code = (f'from {__package__}.gateway import _benchmark_child; '
+                f'_benchmark_child({names!r}, {call!r}, {rounds})')
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True,
+                                env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    separate = [spawn([service]) for service in services]
+    gateway = spawn(services)
+    separate_p99 = [r['p99_ms'] for r in separate if r['p99_ms'] is not None]
+    print(f"services: {', '.join(services)}")
+    print(f"separate processes: rss {sum(r['rss_kb'] for r in separate) / 1024:.1f} MiB"
+          + (f", p99 {max(separate_p99):.1f} ms" if separate_p99 else ""))
+    print(f"gateway process:    rss {gateway['rss_kb'] / 1024:.1f} MiB"
+          + (f", p99 {gateway['p99_ms']:.1f} ms" if gateway['p99_ms'] is not None else ""))
+
+
+def main():
+    """Volcengine MCP Gateway"""
+    parser = argparse.ArgumentParser(description="在单个进程中承载多个 swagger 驱动的 MCP 服务")
+    parser.add_argument('services', nargs='*', help="服务名（如 iam sts tag）或 swagger json 路径")
+    parser.add_argument('--benchmark', action='store_true', help="对比独立进程与网关进程的 RSS 及 p99 延迟")
+    parser.add_argument('--call', help="基准测试中调用的 Action，格式 <服务名>:<Action>，需要配置凭证")
+    parser.add_argument('--rounds', type=int, default=50, help="基准测试调用次数")
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark(args.services or server_config.gateway_services or [server_config.service_code],
+                  args.call, args.rounds)
+    else:
+        asyncio.run(serve_gateway(args.services))
+
+
+if __name__ == "__main__":
+    main()
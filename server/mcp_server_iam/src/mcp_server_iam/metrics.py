@@ -0,0 +1,50 @@
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Metrics:
+    """
+    进程内指标注册表：计数器与回调式仪表盘，以 Prometheus 文本格式导出
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._gauges: Dict[Tuple[str, LabelKey], Callable[[], float]] = {}
+
+    @staticmethod
+    def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+        # 标签值统一为字符串，避免 None 与字符串混在一起时导出排序失败
+        return tuple(sorted((name, str(value)) for name, value in (labels or {}).items()))
+
+    def inc(self, name: str, value: float = 1, labels: Optional[Dict[str, str]] = None) -> None:
+        key = (name, self._label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def gauge(self, name: str, func: Callable[[], float], labels: Optional[Dict[str, str]] = None) -> None:
+        """注册仪表盘，导出时调用 func 获取当前值"""
+        with self._lock:
+            self._gauges[(name, self._label_key(labels))] = func
+
+    def get(self, name: str, labels: Optional[Dict[str, str]] = None) -> float:
+        key = (name, self._label_key(labels))
+        with self._lock:
+            if key in self._gauges:
+                return self._gauges[key]()
+            return self._counters.get(key, 0)
+
+    def render(self) -> str:
+        with self._lock:
+            samples = list(self._counters.items()) + [(key, func()) for key, func in self._gauges.items()]
+        lines = []
+        for (name, labels), value in sorted(samples, key=lambda item: item[0]):
+            label_str = ','.join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f'{name}{{{label_str}}} {value}' if label_str else f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+# 进程级默认注册表
+metrics = Metrics()
@@ -1,11 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 
 from pydantic import BaseModel, ConfigDict
 
 CredentialType = Literal["env", "token"]
 TransportType = Literal["sse", "stdio"]
 AuthType = Literal["none", "oauth"]
+TokenStoreType = Literal["memory", "sqlite"]
 
 
 @dataclass
@@ -28,6 +29,25 @@ class Config:
     ak: Optional[str] = None
     sk: Optional[str] = None
     sts_token: Optional[str] = None
+    catalog_dir: Optional[str] = None  # 工具目录产物缓存目录
+    client_pool_size: int = 64  # 按凭证缓存的客户端数量上限
+    client_pool_ttl: int = 600  # 客户端最长复用时间(秒)
+    upstream_concurrency: int = 32  # 并发执行的上游调用数上限
+    upstream_timeout: int = 30  # 单次上游调用超时时间(秒)
+    gateway_services: Optional[List[str]] = None  # 网关模式下承载的服务列表
+    token_store: TokenStoreType = "memory"  # OAuth 令牌存储，支持 "memory" 或 "sqlite"
+    token_store_path: Optional[str] = None  # sqlite 令牌存储文件路径
+    token_store_size: int = 10000  # 保存的令牌数量上限
+    token_default_ttl: int = 86400  # OAuth 未返回 expires_in 时的令牌有效期(秒)
+    paginate_concurrency: int = 4  # 自动翻页时并发拉取的页数上限
+    paginate_max_items: int = 10000  # 自动翻页未指定 max_items 时返回的条目数上限
+    data_dir: Optional[str] = None  # 本地工具的数据目录
+    response_cache: bool = False  # 是否缓存只读 Action（Get/List/Describe 等）的响应
+    response_cache_size: int = 64 * 1024 * 1024  # 响应缓存总大小上限(字节)
+    response_cache_ttl: int = 60  # 响应缓存默认有效期(秒)
+    response_cache_ttls: Optional[Dict[str, int]] = None  # 按 Action 配置的有效期(秒)，0 表示不缓存
+    sts_cache: bool = True  # 是否缓存 AssumeRole 返回的临时凭证（仅 sts 服务）
+    sts_refresh_margin: int = 300  # 临时凭证过期前多少秒开始后台刷新
 
     def check(self):
         # 验证 service_code
@@ -43,6 +63,9 @@ class Config:
         if self.transport == "sse" and self.sse_port == 0:
             raise ValueError("sse port can not be 0")
 
+        if self.token_store == "sqlite" and not self.token_store_path:
+            raise ValueError("token_store_path must be set when token_store is sqlite")
+
 
 class OAuthClientRegistration(BaseModel):
     """OAuth客户端注册信息模型"""
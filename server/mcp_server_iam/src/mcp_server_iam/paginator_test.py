@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+
+from mcp_server_iam.paginator import (
+    PAGINATION_STYLE_OFFSET, PAGINATION_STYLE_PAGE, PAGINATION_STYLE_TOKEN, Pagination, merge_pages, paginate,
+)
+
+
+def offset_server(total: int, cap: int, with_total: bool = True):
+    """单页最多返回 cap 条的偏移分页服务端"""
+    calls = []
+
+    async def fetch(arguments):
+        calls.append(dict(arguments))
+        offset, limit = arguments["Offset"], min(arguments["Limit"], cap)
+        page = {"Items": [{"Id": i} for i in range(offset, min(offset + limit, total))]}
+        if with_total:
+            page["Total"] = total
+        return page
+
+    return fetch, calls
+
+
+def page_server(total: int, cap: int):
+    """单页最多返回 cap 条的页码分页服务端"""
+
+    async def fetch(arguments):
+        size = min(arguments["PageSize"], cap)
+        offset = (arguments["PageNumber"] - 1) * size
+        return {"Items": [{"Id": i} for i in range(offset, min(offset + size, total))], "TotalCount": total}
+
+    return fetch
+
+
+class TestPaginate(unittest.TestCase):
+    def setUp(self):
+        self.offset = Pagination(style=PAGINATION_STYLE_OFFSET, cursor_param="Offset", size_param="Limit",
+                                 max_size=100, items=["Items"], total="Total")
+
+    def test_full_pages_fetched_concurrently(self):
+        fetch, calls = offset_server(total=250, cap=100)
+        result = asyncio.run(paginate(self.offset, fetch, {}, max_items=1000))
+        self.assertEqual([item["Id"] for item in result["Items"]], list(range(250)))
+        self.assertEqual([call["Offset"] for call in calls], [0, 100, 200])
+        self.assertFalse(result["AutoPaginated"]["Truncated"])
+
+    def test_server_caps_page_size(self):
+        fetch, calls = offset_server(total=250, cap=50)
+        result = asyncio.run(paginate(self.offset, fetch, {}, max_items=1000))
+        self.assertEqual([item["Id"] for item in result["Items"]], list(range(250)))
+        self.assertEqual([call["Offset"] for call in calls], [0, 50, 100, 150, 200])
+
+    def test_server_caps_page_size_without_total(self):
+        pagination = Pagination(style=PAGINATION_STYLE_OFFSET, cursor_param="Offset", size_param="Limit",
+                                max_size=100, items=["Items"])
+        fetch, _ = offset_server(total=120, cap=50, with_total=False)
+        result = asyncio.run(paginate(pagination, fetch, {}, max_items=1000))
+        self.assertEqual([item["Id"] for item in result["Items"]], list(range(120)))
+
+    def test_page_style_caps_page_size(self):
+        pagination = Pagination(style=PAGINATION_STYLE_PAGE, cursor_param="PageNumber", size_param="PageSize",
+                                max_size=100, items=["Items"], total="TotalCount")
+        result = asyncio.run(paginate(pagination, page_server(total=130, cap=40), {}, max_items=1000))
+        self.assertEqual([item["Id"] for item in result["Items"]], list(range(130)))
+
+    def test_last_short_page_needs_no_extra_request(self):
+        fetch, calls = offset_server(total=30, cap=50)
+        result = asyncio.run(paginate(self.offset, fetch, {}, max_items=1000))
+        self.assertEqual(len(result["Items"]), 30)
+        self.assertEqual(len(calls), 1)
+
+    def test_max_items_truncates(self):
+        fetch, _ = offset_server(total=250, cap=50)
+        result = asyncio.run(paginate(self.offset, fetch, {}, max_items=120))
+        self.assertEqual(len(result["Items"]), 120)
+        self.assertTrue(result["AutoPaginated"]["Truncated"])
+
+
+class TestMergePages(unittest.TestCase):
+    def setUp(self):
+        self.offset = Pagination(style=PAGINATION_STYLE_OFFSET, cursor_param="Offset", size_param="Limit",
+                                 max_size=2, items=["Items"])
+
+    def test_identical_rows_are_kept(self):
+        pages = [{"Items": [{"V": 1}, {"V": 1}]}, {"Items": [{"V": 2}, {"V": 1}]}]
+        self.assertEqual(merge_pages(self.offset, pages, 10)["Items"], [{"V": 1}, {"V": 1}, {"V": 2}, {"V": 1}])
+
+    def test_overlap_between_pages_is_removed(self):
+        # 翻页期间插入了一条数据，第二页的开头重复了第一页的最后一条
+        pages = [{"Items": [{"V": 1}, {"V": 2}]}, {"Items": [{"V": 2}, {"V": 3}]}]
+        self.assertEqual(merge_pages(self.offset, pages, 10)["Items"], [{"V": 1}, {"V": 2}, {"V": 3}])
+
+    def test_token_pages_are_not_deduplicated(self):
+        pagination = Pagination(style=PAGINATION_STYLE_TOKEN, cursor_param="NextToken", size_param="MaxResults",
+                                max_size=2, items=["Items"], next_token="NextToken")
+        pages = [{"Items": [{"V": 1}], "NextToken": "a"}, {"Items": [{"V": 1}], "NextToken": ""}]
+        self.assertEqual(len(merge_pages(pagination, pages, 10)["Items"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
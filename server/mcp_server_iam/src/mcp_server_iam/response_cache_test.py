@@ -0,0 +1,62 @@
+import asyncio
+import json
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from mcp_server_iam import server
+from mcp_server_iam.catalog import load_catalog
+from mcp_server_iam.metrics import Metrics
+from mcp_server_iam.response_cache import ResponseCache
+
+
+class TestResponseCacheIsolation(unittest.TestCase):
+    """响应缓存按完整凭证隔离：只知道 AK 不能读到他人缓存的响应"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.catalog = load_catalog(Path(server.__file__).parent / 'config' / 'iam.json')
+
+    def setUp(self):
+        self.upstream_calls = []
+
+        async def dispatch_action(client, action, name, arguments):
+            self.upstream_calls.append(name)
+            return {"UserMetadata": [{"UserName": "alice"}]}
+
+        patches = [
+            mock.patch.object(server, 'response_cache', ResponseCache(registry=Metrics())),
+            mock.patch.object(server, 'dispatch_action', dispatch_action),
+            mock.patch.object(server.client_pool, 'get', lambda **kwargs: object()),
+            mock.patch.object(server.server_config, 'credential', 'token'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def call(self, ak: str, sk: str, session_token: str = ''):
+        async def run():
+            server.auth_context.set({'ak': ak, 'sk': sk, 'session_token': session_token})
+            return await server.call_action(self.catalog, 'ListUsers', {})
+
+        return json.loads(asyncio.run(run())[0].text)
+
+    def test_same_credential_hits_cache(self):
+        first = self.call('AKVICTIM', 'real-secret')
+        second = self.call('AKVICTIM', 'real-secret')
+        self.assertEqual(first, second)
+        self.assertEqual(self.upstream_calls, ['ListUsers'])
+
+    def test_same_ak_with_different_sk_misses_cache(self):
+        self.call('AKVICTIM', 'real-secret')
+        self.call('AKVICTIM', 'wrong-secret')
+        self.assertEqual(self.upstream_calls, ['ListUsers', 'ListUsers'])
+
+    def test_different_session_token_misses_cache(self):
+        self.call('AKTEMP', 'secret', 'token-1')
+        self.call('AKTEMP', 'secret', 'token-2')
+        self.assertEqual(len(self.upstream_calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,8 @@ def create_mcp_server():
         "IGA MCP",
         instructions="Volcengine(火山引擎) IGA(智能全球加速) MCP，提供智能全球加速相关服务",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
@@ -10,6 +10,8 @@ def create_mcp_server():
         "IoT MCP Server",
         instructions="火山引擎物联网平台 MCP 服务",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
@@ -1,16 +1,32 @@
 from src.live.api.api import LiveAPI
 from mcp.server.fastmcp import FastMCP
 from .note import note
+from .metric_cache import MetricSpec, cache
 from src.utils.response import HandlerVolcResponse
 import json
 
 
 def create_mcp_server():
     service = LiveAPI()
+    account = service.service_info.credentials.ak
+    # 已结算的时序数据缓存在本地，只请求未缓存的尾部，合并后重新计算汇总字段
+    traffic_series = MetricSpec(interval="Aggregation", default_interval=300, aggregates={
+        "TotalTraffic": ("sum", "Traffic"), "PeakBandwidth": ("max", "Bandwidth")})
+    session_series = MetricSpec(interval="Aggregation", default_interval=300, aggregates={
+        "TotalRequest": ("sum", "Request"), "PeakOnlineUser": ("max", "OnlineUser")})
+    edge_series = MetricSpec(interval="Aggregation", default_interval=300, aggregates={
+        "TotalUpTraffic": ("sum", "UpTraffic"), "TotalDownTraffic": ("sum", "DownTraffic"),
+        "TotalRequest": ("sum", "Request"), "PeakUpBandwidth": ("max", "UpBandwidth"),
+        "PeakDownBandwidth": ("max", "DownBandwidth")})
+
+    def post(action):
+        return lambda sub: json.loads(service.mcp_post(action, {}, json.dumps(sub)))
     mcp = FastMCP(
         "LIVE MCP",
         instructions="Volcengine(火山引擎) LIVE(视频直播) MCP",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
@@ -66,10 +82,9 @@ def create_mcp_server():
         Call steps:
         1. Pass "describe_live_source_traffic_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_live_source_traffic_data
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_post(
-            "McpDescribeLiveSourceTrafficData", {}, json.dumps(body)
-        )
+        reqs = cache.fetch(account, "McpDescribeLiveSourceTrafficData", body, traffic_series, post("McpDescribeLiveSourceTrafficData"))
 
         return HandlerVolcResponse(reqs)
 
@@ -80,10 +95,9 @@ def create_mcp_server():
         Call steps:
         1. Pass "describe_live_stream_session_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_live_stream_session_data
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_post(
-            "McpDescribeLiveStreamSessionData", {}, json.dumps(body)
-        )
+        reqs = cache.fetch(account, "McpDescribeLiveStreamSessionData", body, session_series, post("McpDescribeLiveStreamSessionData"))
 
         return HandlerVolcResponse(reqs)
 
@@ -316,8 +330,9 @@ def create_mcp_server():
         Call steps:
         1. Pass "describe_live_edge_stat_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_live_edge_stat_data
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_post("McpDescribeLiveEdgeStatData", {}, json.dumps(body))
+        reqs = cache.fetch(account, "McpDescribeLiveEdgeStatData", body, edge_series, post("McpDescribeLiveEdgeStatData"))
 
         return HandlerVolcResponse(reqs)
 
@@ -0,0 +1,105 @@
+"""
+按需加载的工具参数说明
+
+参数说明保存在 note.txt 中，每条以 "@@ 工具名" 一行开头；note.idx 记录每条说明在 note.txt 中的字节偏移与长度。
+import 时只读取索引，get_note 查询某个工具时才按偏移读取这一条说明，读取后缓存，同一说明只保留一份字符串。
+note.idx 缺失或与 note.txt 的大小不一致时，扫描 note.txt 重新建立索引。
+
+修改 note.txt 后运行 `python -m <package>.note_store <note.txt 路径>` 重新生成 note.idx。
+"""
+
+import json
+import os
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+HEADER = b"@@ "
+
+
+def scan(data_path: str) -> Dict[str, List[int]]:
+    """扫描 note.txt，返回 工具名 -> [偏移, 长度]"""
+    index: Dict[str, List[int]] = {}
+    name: Optional[str] = None
+    start = offset = 0
+    with open(data_path, "rb") as f:
+        for line in f:
+            if line.startswith(HEADER):
+                if name is not None:
+                    # 说明与下一条的标题之间有一个换行符
+                    index[name] = [start, offset - start - 1]
+                name = line[len(HEADER):].rstrip(b"\r\n").decode("utf-8")
+                start = offset + len(line)
+            offset += len(line)
+    if name is not None:
+        index[name] = [start, max(offset - start - 1, 0)]
+    return index
+
+
+def index_path(data_path: str) -> str:
+    return os.path.splitext(data_path)[0] + ".idx"
+
+
+def write_index(data_path: str) -> Dict[str, List[int]]:
+    index = scan(data_path)
+    with open(index_path(data_path), "w", encoding="utf-8") as f:
+        json.dump({"size": os.path.getsize(data_path), "notes": index}, f, ensure_ascii=False, indent=0)
+    return index
+
+
+def write(notes: Dict[str, str], data_path: str) -> None:
+    """把 工具名 -> 说明 写为 note.txt 与 note.idx"""
+    with open(data_path, "wb") as f:
+        for name, text in notes.items():
+            f.write(HEADER + name.encode("utf-8") + b"\n" + text.encode("utf-8") + b"\n")
+    write_index(data_path)
+
+
+class NoteStore(Mapping):
+    """只读的 工具名 -> 说明 映射，说明在第一次访问时从 note.txt 读取"""
+
+    def __init__(self, data_path: str):
+        self.data_path = data_path
+        self._index: Optional[Dict[str, Tuple[int, int]]] = None
+        self._cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> Dict[str, Tuple[int, int]]:
+        if self._index is None:
+            try:
+                with open(index_path(self.data_path), encoding="utf-8") as f:
+                    stored = json.load(f)
+                if stored.get("size") != os.path.getsize(self.data_path):
+                    raise ValueError("stale index")
+                index = stored["notes"]
+            except (OSError, ValueError, KeyError):
+                index = scan(self.data_path)
+            self._index = {sys.intern(name): (offset, length) for name, (offset, length) in index.items()}
+        return self._index
+
+    def __getitem__(self, name: str) -> str:
+        text = self._cache.get(name)
+        if text is None:
+            offset, length = self.index[name]
+            with self._lock:
+                with open(self.data_path, "rb") as f:
+                    f.seek(offset)
+                    text = sys.intern(f.read(length).decode("utf-8"))
+                self._cache[name] = text
+        return text
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        print(f"{path}: {len(write_index(path))} notes")
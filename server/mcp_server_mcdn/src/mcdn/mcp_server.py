@@ -10,6 +10,8 @@ def create_mcp_server():
         "MCDN MCP",
         instructions="Volcengine(火山引擎) MCDN(多云CDN) MCP",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
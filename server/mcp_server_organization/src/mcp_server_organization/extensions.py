@@ -0,0 +1,100 @@
+import time
+from typing import Any, Dict
+
+from mcp.types import Tool
+
+from .local_tool import LocalContext, LocalTool
+from .org_tree import DEFAULT_TTL, NODE_ACCOUNT, NODE_ORG_UNIT, OrgTreeCache
+
+trees = OrgTreeCache()
+
+QUERY_ANCESTORS = 'Ancestors'
+QUERY_PATH = 'Path'
+QUERY_DESCENDANTS = 'Descendants'
+QUERY_CHILDREN = 'Children'
+QUERY_CONTAINS = 'Contains'
+
+
+async def crawl_organization_tree(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    begin = time.perf_counter()
+    tree, changes = await trees.get(context.invoke, context.identity, ttl=arguments.get('TTL') or DEFAULT_TTL,
+                                    mode=arguments.get('Refresh') or 'incremental')
+    result = tree.status()
+    if changes is not None:
+        result["Changes"] = changes
+    result["ElapsedMs"] = round((time.perf_counter() - begin) * 1000, 2)
+    return result
+
+
+async def query_organization_tree(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tree, _ = await trees.get(context.invoke, context.identity)
+    begin = time.perf_counter()
+    query = arguments['Query']
+    node_id = arguments['NodeID']
+    detail = bool(arguments.get('Detail'))
+    result: Dict[str, Any] = {"Node": tree.get(node_id).to_dict(detail)}
+    if query == QUERY_ANCESTORS:
+        result["Nodes"] = [node.to_dict(detail) for node in tree.ancestors(node_id)]
+    elif query == QUERY_PATH:
+        result["Nodes"] = [node.to_dict(detail) for node in tree.path(node_id)]
+    elif query == QUERY_CONTAINS:
+        if not arguments.get('AncestorID'):
+            raise ValueError("Contains 查询需要指定 AncestorID")
+        result["Contains"] = tree.contains(arguments['AncestorID'], node_id)
+    else:
+        max_depth = 1 if query == QUERY_CHILDREN else arguments.get('MaxDepth')
+        nodes = tree.descendants(node_id, arguments.get('NodeType'), max_depth)
+        offset = arguments.get('Offset') or 0
+        limit = arguments.get('Limit') or 100
+        result["Total"] = len(nodes)
+        result["Nodes"] = [node.to_dict(detail) for node in nodes[offset:offset + limit]]
+    result["SnapshotAt"] = int(tree.built_at)
+    result["QueryMs"] = round((time.perf_counter() - begin) * 1000, 3)
+    return result
+
+
+LOCAL_TOOLS = [
+    LocalTool(
+        tool=Tool(
+            name='CrawlOrganizationTree',
+            description="拉取企业组织树并缓存快照：首次从根组织单元开始按层广度优先拉取，同一层的组织单元并发查询子单元与成员账号；"
+                        "已有快照时默认增量刷新，只更新新增、删除、移动或变更的节点。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "Refresh": {"type": "string", "enum": ["incremental", "full"],
+                                "description": "刷新方式：incremental 增量刷新（默认），full 重新拉取整棵树"},
+                    "TTL": {"type": "integer", "minimum": 1,
+                            "description": f"快照有效期（秒），默认 {DEFAULT_TTL}，过期后查询时自动增量刷新"},
+                },
+            },
+        ),
+        handler=crawl_organization_tree,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='QueryOrganizationTree',
+            description="基于本地组织树快照查询组织单元或成员账号的祖先（Ancestors）、从根开始的路径（Path）、"
+                        "子节点（Children）、全部后代（Descendants，如某组织单元下递归的全部账号）或是否属于某组织单元（Contains）。"
+                        "没有快照或快照过期时先拉取或刷新。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "Query": {"type": "string",
+                              "enum": [QUERY_ANCESTORS, QUERY_PATH, QUERY_CHILDREN, QUERY_DESCENDANTS, QUERY_CONTAINS],
+                              "description": "查询类型"},
+                    "NodeID": {"type": "string", "description": "组织单元 ID 或成员账号 ID"},
+                    "AncestorID": {"type": "string", "description": "Contains 查询的组织单元 ID"},
+                    "NodeType": {"type": "string", "enum": [NODE_ORG_UNIT, NODE_ACCOUNT],
+                                 "description": "Children/Descendants 查询只返回该类型的节点"},
+                    "MaxDepth": {"type": "integer", "minimum": 1, "description": "Descendants 查询的最大相对深度"},
+                    "Detail": {"type": "boolean", "description": "是否返回节点的完整信息，默认 false"},
+                    "Limit": {"type": "integer", "minimum": 1, "description": "返回的节点数，默认 100"},
+                    "Offset": {"type": "integer", "minimum": 0, "description": "偏移量，默认 0"},
+                },
+                "required": ["Query", "NodeID"],
+            },
+        ),
+        handler=query_organization_tree,
+    ),
+]
@@ -0,0 +1,265 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastmcp.utilities.logging import configure_logging, get_logger
+
+from .local_tool import ActionInvoker
+
+# 定义logger
+logger = get_logger(__name__)
+configure_logging("INFO")
+
+DEFAULT_TTL = 3600
+DEFAULT_CONCURRENCY = 8
+PAGE_SIZE = 100
+MAX_ITEMS = 1_000_000
+
+NODE_ORG_UNIT = 'OrgUnit'
+NODE_ACCOUNT = 'Account'
+
+
+@dataclass
+class Node:
+    """组织树节点（组织单元或成员账号）"""
+    ID: str
+    Type: str
+    Name: Optional[str]
+    ParentID: Optional[str]
+    Detail: Dict[str, Any] = field(default_factory=dict, repr=False)
+    children: List[str] = field(default_factory=list, repr=False)
+    depth: int = 0
+    # 先序遍历的进入/离开序号，子树成员即 [enter, leave) 区间内的节点
+    enter: int = 0
+    leave: int = 0
+
+    def to_dict(self, detail: bool = False) -> Dict[str, Any]:
+        data = {"ID": self.ID, "Type": self.Type, "Name": self.Name, "ParentID": self.ParentID, "Depth": self.depth}
+        if detail:
+            data["Detail"] = self.Detail
+        return data
+
+
+def _ou_node(unit: Dict[str, Any]) -> Node:
+    return Node(ID=str(unit['ID']), Type=NODE_ORG_UNIT, Name=unit.get('Name'),
+                ParentID=str(unit['ParentID']) if unit.get('ParentID') not in (None, '', '0') else None,
+                Detail=unit)
+
+
+def _account_node(account: Dict[str, Any]) -> Node:
+    return Node(ID=str(account.get('AccountID') or account['ID']), Type=NODE_ACCOUNT,
+                Name=account.get('ShowName') or account.get('AccountName'),
+                ParentID=str(account['OrgUnitID']) if account.get('OrgUnitID') else None, Detail=account)
+
+
+class OrgTree:
+    """
+    组织树快照
+
+    节点通过 ParentID 指向父节点并记录子节点列表；构建完成后做一次先序遍历，
+    为每个节点记录深度与 [enter, leave) 区间：祖先与路径查询沿父指针向上，为 O(depth)；
+    子树成员为先序序列中的连续区间，判断归属为 O(1)。
+    """
+
+    def __init__(self, nodes: Dict[str, Node], ttl: int = DEFAULT_TTL):
+        self.nodes = nodes
+        self.ttl = ttl
+        self.built_at = time.time()
+        self.order: List[str] = []
+        self.reindex()
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) >= self.built_at + self.ttl
+
+    @property
+    def roots(self) -> List[str]:
+        return [node.ID for node in self.nodes.values() if node.ParentID is None or node.ParentID not in self.nodes]
+
+    def reindex(self) -> None:
+        for node in self.nodes.values():
+            node.children = []
+        for node in self.nodes.values():
+            if node.ParentID in self.nodes:
+                self.nodes[node.ParentID].children.append(node.ID)
+        self.order = []
+        # 迭代先序遍历，避免深层组织触发递归深度限制
+        stack: List[Tuple[str, int, bool]] = [(root, 0, False) for root in reversed(sorted(self.roots))]
+        while stack:
+            node_id, depth, leaving = stack.pop()
+            node = self.nodes[node_id]
+            if leaving:
+                node.leave = len(self.order)
+                continue
+            node.depth = depth
+            node.enter = len(self.order)
+            self.order.append(node_id)
+            stack.append((node_id, depth, True))
+            children = sorted(node.children, key=lambda child: (self.nodes[child].Type, child))
+            stack += [(child, depth + 1, False) for child in reversed(children)]
+
+    def get(self, node_id: str) -> Node:
+        node = self.nodes.get(str(node_id))
+        if node is None:
+            raise ValueError(f"组织树中不存在节点: {node_id}")
+        return node
+
+    def ancestors(self, node_id: str) -> List[Node]:
+        """由近及远的祖先节点"""
+        result = []
+        node = self.get(node_id)
+        while node.ParentID in self.nodes:
+            node = self.nodes[node.ParentID]
+            result.append(node)
+        return result
+
+    def path(self, node_id: str) -> List[Node]:
+        """从根到节点的路径"""
+        return list(reversed(self.ancestors(node_id))) + [self.get(node_id)]
+
+    def contains(self, ancestor_id: str, node_id: str) -> bool:
+        ancestor, node = self.get(ancestor_id), self.get(node_id)
+        return ancestor.enter <= node.enter < ancestor.leave
+
+    def descendants(self, node_id: str, node_type: Optional[str] = None,
+                    max_depth: Optional[int] = None) -> List[Node]:
+        node = self.get(node_id)
+        result = [self.nodes[child] for child in self.order[node.enter + 1:node.leave]]
+        if node_type:
+            result = [child for child in result if child.Type == node_type]
+        if max_depth is not None:
+            result = [child for child in result if child.depth - node.depth <= max_depth]
+        return result
+
+    def status(self) -> Dict[str, Any]:
+        types = [node.Type for node in self.nodes.values()]
+        return {
+            "OrgUnits": types.count(NODE_ORG_UNIT),
+            "Accounts": types.count(NODE_ACCOUNT),
+            "Roots": self.roots,
+            "Depth": max((node.depth for node in self.nodes.values()), default=0),
+            "BuiltAt": int(self.built_at),
+            "ExpiresAt": int(self.built_at + self.ttl),
+        }
+
+
+async def _list(invoke: ActionInvoker, action: str, arguments: Dict[str, Any], items: str) -> List[Dict[str, Any]]:
+    resp = await invoke(action, dict(arguments, Limit=PAGE_SIZE, auto_paginate=True, max_items=MAX_ITEMS))
+    return resp.get(items) or []
+
+
+async def _roots(invoke: ActionInvoker) -> List[Node]:
+    # 根组织单元没有父单元，或父单元不在组织单元列表中
+    units = [_ou_node(unit) for unit in (await invoke('ListOrganizationalUnits', {})).get('SubUnitList') or []]
+    ids = {unit.ID for unit in units}
+    return [unit for unit in units if unit.ParentID is None or unit.ParentID not in ids]
+
+
+async def crawl(invoke: ActionInvoker, ttl: int = DEFAULT_TTL, concurrency: int = DEFAULT_CONCURRENCY) -> OrgTree:
+    """
+    从根组织单元开始按层广度优先拉取组织树
+
+    同一层的组织单元并发调用 ListOrganizationalUnitsForParent 与 ListAccounts（自动翻页），
+    子组织单元构成下一层。
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def expand(unit_id: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        async with semaphore:
+            return await asyncio.gather(
+                _list(invoke, 'ListOrganizationalUnitsForParent', {'ParentId': unit_id}, 'SubUnitList'),
+                _list(invoke, 'ListAccounts', {'OrgUnitId': unit_id}, 'AccountList'))
+
+    nodes: Dict[str, Node] = {}
+    level = await _roots(invoke)
+    while level:
+        for unit in level:
+            nodes[unit.ID] = unit
+        expanded = await asyncio.gather(*(expand(unit.ID) for unit in level))
+        next_level = []
+        for unit, (children, accounts) in zip(level, expanded):
+            for account in accounts:
+                node = _account_node(account)
+                node.ParentID = unit.ID
+                nodes[node.ID] = node
+            next_level += [child for child in map(_ou_node, children) if child.ID not in nodes]
+        level = next_level
+    return OrgTree(nodes, ttl)
+
+
+async def refresh(invoke: ActionInvoker, tree: OrgTree, ttl: Optional[int] = None) -> Dict[str, Any]:
+    """
+    增量刷新组织树快照
+
+    一次 ListOrganizationalUnits 与一次全量 ListAccounts（自动翻页）取得当前的组织单元与账号归属，
+    与快照比较后只更新新增、删除、移动或变更的节点，然后重建先序区间。
+    """
+    units, accounts = await asyncio.gather(invoke('ListOrganizationalUnits', {}),
+                                           _list(invoke, 'ListAccounts', {}, 'AccountList'))
+    current = {node.ID: node for node in map(_ou_node, units.get('SubUnitList') or [])}
+    current.update((node.ID, node) for node in map(_account_node, accounts))
+    changes: Dict[str, List[str]] = {"Added": [], "Removed": [], "Moved": [], "Updated": []}
+    for node_id in [node_id for node_id in tree.nodes if node_id not in current]:
+        del tree.nodes[node_id]
+        changes["Removed"].append(node_id)
+    for node_id, node in current.items():
+        old = tree.nodes.get(node_id)
+        if old is None:
+            tree.nodes[node_id] = node
+            changes["Added"].append(node_id)
+            continue
+        if old.ParentID != node.ParentID:
+            changes["Moved"].append(node_id)
+        elif old.Detail != node.Detail:
+            changes["Updated"].append(node_id)
+        else:
+            continue
+        old.ParentID, old.Name, old.Detail = node.ParentID, node.Name, node.Detail
+    if changes["Added"] or changes["Removed"] or changes["Moved"]:
+        tree.reindex()
+    tree.built_at = time.time()
+    if ttl is not None:
+        tree.ttl = ttl
+    return changes
+
+
+class OrgTreeCache:
+    """按凭证缓存组织树快照，并发的构建请求共享同一次拉取"""
+
+    def __init__(self):
+        self._trees: Dict[str, OrgTree] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def peek(self, identity: str) -> Optional[OrgTree]:
+        return self._trees.get(identity)
+
+    async def get(self, invoke: ActionInvoker, identity: str, ttl: int = DEFAULT_TTL,
+                  mode: Optional[str] = None) -> Tuple[OrgTree, Optional[Dict[str, Any]]]:
+        """
+        返回组织树快照及本次刷新的变更
+
+        mode 为 None 时快照未过期直接返回，过期后增量刷新；
+        为 'incremental' 时立即增量刷新；为 'full' 时重新广度优先拉取。
+        """
+        tree = self._trees.get(identity)
+        if tree is not None and mode is None and not tree.expired():
+            return tree, None
+        if identity in self._pending:
+            return await asyncio.shield(self._pending[identity])
+        future = asyncio.get_running_loop().create_future()
+        self._pending[identity] = future
+        try:
+            if tree is None or mode == 'full':
+                result = (await crawl(invoke, ttl), None)
+            else:
+                result = (tree, await refresh(invoke, tree, ttl))
+            self._trees[identity] = result[0]
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # 没有其他等待者时避免 "exception was never retrieved" 警告
+            future.exception()
+            raise
+        finally:
+            del self._pending[identity]
@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+
+from mcp_server_organization.org_tree import NODE_ACCOUNT, NODE_ORG_UNIT, Node, OrgTree, refresh
+
+# root
+# ├── ou-a
+# │   ├── ou-a1
+# │   │   └── acc-3
+# │   └── acc-2
+# ├── ou-b
+# └── acc-1
+UNITS = [
+    {'ID': 'root', 'Name': 'Root', 'ParentID': '0'},
+    {'ID': 'ou-a', 'Name': 'A', 'ParentID': 'root'},
+    {'ID': 'ou-a1', 'Name': 'A1', 'ParentID': 'ou-a'},
+    {'ID': 'ou-b', 'Name': 'B', 'ParentID': 'root'},
+]
+ACCOUNTS = [
+    {'AccountID': 'acc-1', 'AccountName': 'one', 'OrgUnitID': 'root'},
+    {'AccountID': 'acc-2', 'AccountName': 'two', 'OrgUnitID': 'ou-a'},
+    {'AccountID': 'acc-3', 'AccountName': 'three', 'OrgUnitID': 'ou-a1'},
+]
+
+
+def build_tree() -> OrgTree:
+    nodes = {}
+    for unit in UNITS:
+        parent = unit['ParentID'] if unit['ParentID'] != '0' else None
+        nodes[unit['ID']] = Node(ID=unit['ID'], Type=NODE_ORG_UNIT, Name=unit['Name'], ParentID=parent, Detail=unit)
+    for account in ACCOUNTS:
+        nodes[account['AccountID']] = Node(ID=account['AccountID'], Type=NODE_ACCOUNT, Name=account['AccountName'],
+                                           ParentID=account['OrgUnitID'], Detail=account)
+    return OrgTree(nodes)
+
+
+def ids(nodes) -> list:
+    return [node.ID for node in nodes]
+
+
+class TestOrgTreeIntervals(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = build_tree()
+
+    def test_subtree_is_a_contiguous_interval(self):
+        for node_id, node in self.tree.nodes.items():
+            members = set(self.tree.order[node.enter:node.leave])
+            expected = {other for other in self.tree.nodes
+                        if other == node_id or node_id in ids(self.tree.ancestors(other))}
+            self.assertEqual(members, expected, node_id)
+
+    def test_leaf_interval_holds_only_itself(self):
+        node = self.tree.get('acc-3')
+        self.assertEqual(node.leave - node.enter, 1)
+        self.assertEqual(self.tree.descendants('acc-3'), [])
+
+    def test_contains(self):
+        self.assertTrue(self.tree.contains('root', 'acc-3'))
+        self.assertTrue(self.tree.contains('ou-a', 'acc-3'))
+        self.assertTrue(self.tree.contains('ou-a', 'ou-a'))
+        self.assertFalse(self.tree.contains('ou-b', 'acc-3'))
+        self.assertFalse(self.tree.contains('acc-3', 'ou-a'))
+
+    def test_descendants_filters(self):
+        self.assertEqual(sorted(ids(self.tree.descendants('ou-a'))), ['acc-2', 'acc-3', 'ou-a1'])
+        self.assertEqual(sorted(ids(self.tree.descendants('root', node_type=NODE_ACCOUNT))),
+                         ['acc-1', 'acc-2', 'acc-3'])
+        self.assertEqual(sorted(ids(self.tree.descendants('root', max_depth=1))), ['acc-1', 'ou-a', 'ou-b'])
+
+    def test_depth_and_path(self):
+        self.assertEqual(self.tree.get('acc-3').depth, 3)
+        self.assertEqual(ids(self.tree.path('acc-3')), ['root', 'ou-a', 'ou-a1', 'acc-3'])
+        self.assertEqual(ids(self.tree.ancestors('root')), [])
+
+    def test_unknown_node(self):
+        with self.assertRaises(ValueError):
+            self.tree.get('missing')
+
+    def test_deep_tree_does_not_recurse(self):
+        nodes = {'n0': Node(ID='n0', Type=NODE_ORG_UNIT, Name=None, ParentID=None)}
+        for depth in range(1, 5000):
+            nodes[f'n{depth}'] = Node(ID=f'n{depth}', Type=NODE_ORG_UNIT, Name=None, ParentID=f'n{depth - 1}')
+        tree = OrgTree(nodes)
+        self.assertEqual(tree.get('n4999').depth, 4999)
+        self.assertTrue(tree.contains('n0', 'n4999'))
+
+
+class TestOrgTreeRefresh(unittest.TestCase):
+
+    def test_move_reindexes_intervals(self):
+        tree = build_tree()
+        accounts = [dict(account) for account in ACCOUNTS]
+        accounts[2]['OrgUnitID'] = 'ou-b'
+        units = [dict(unit) for unit in UNITS] + [{'ID': 'ou-c', 'Name': 'C', 'ParentID': 'root'}]
+
+        async def invoke(action, arguments):
+            if action == 'ListOrganizationalUnits':
+                return {'SubUnitList': units}
+            return {'AccountList': accounts}
+
+        changes = asyncio.run(refresh(invoke, tree))
+        self.assertEqual(changes['Moved'], ['acc-3'])
+        self.assertEqual(changes['Added'], ['ou-c'])
+        self.assertTrue(tree.contains('ou-b', 'acc-3'))
+        self.assertFalse(tree.contains('ou-a', 'acc-3'))
+        self.assertEqual(sorted(ids(tree.descendants('ou-a'))), ['acc-2', 'ou-a1'])
+
+
+if __name__ == "__main__":
+    unittest.main()
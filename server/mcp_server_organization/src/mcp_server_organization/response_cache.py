@@ -0,0 +1,104 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .metrics import Metrics, metrics as default_metrics
+
+# 只读 Action 的名称前缀，其余 Action 视为写操作
+READ_ACTION_PREFIXES = ('Get', 'List', 'Describe', 'Query', 'Search', 'Lookup')
+
+
+def is_read_action(action: str) -> bool:
+    return action.startswith(READ_ACTION_PREFIXES)
+
+
+class ResponseCache:
+    """
+    只读 Action 的响应缓存（read-through）
+
+    - 缓存键为 (凭证标识, 服务, Action, 规范化参数)，不同凭证互不可见
+    - 每个 Action 可单独配置 TTL，TTL 为 0 的 Action 不缓存
+    - 按序列化后的字节数限制总大小，超出时淘汰最久未使用的条目
+    - 同一服务中调用任意写操作时清空该服务的缓存
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, default_ttl: int = 60,
+                 action_ttls: Optional[Dict[str, int]] = None, registry: Metrics = default_metrics):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.action_ttls = dict(action_ttls or {})
+        self.registry = registry
+        self._lock = threading.Lock()
+        # key -> (服务, 响应 JSON, 过期时间)
+        self._entries: OrderedDict[str, Tuple[str, bytes, float]] = OrderedDict()
+        self._bytes = 0
+        registry.gauge('mcp_response_cache_bytes', lambda: self._bytes)
+        registry.gauge('mcp_response_cache_entries', lambda: len(self._entries))
+
+    def ttl(self, action: str) -> int:
+        if not is_read_action(action):
+            return 0
+        return self.action_ttls.get(action, self.default_ttl)
+
+    @staticmethod
+    def key(identity: str, service: str, action: str, arguments: Dict[str, Any]) -> str:
+        normalized = json.dumps(arguments, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+        return hashlib.sha256(f'{identity}\0{service}\0{action}\0{normalized}'.encode('utf-8')).hexdigest()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def get(self, key: str, service: str, action: str) -> Optional[Dict[str, Any]]:
+        labels = {'service': service, 'action': action}
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= time.time():
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            self.registry.inc('mcp_response_cache_misses_total', labels=labels)
+            return None
+        self.registry.inc('mcp_response_cache_hits_total', labels=labels)
+        return json.loads(entry[1])
+
+    def set(self, key: str, service: str, action: str, value: Dict[str, Any]) -> None:
+        ttl = self.ttl(action)
+        if ttl <= 0:
+            return
+        data = json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (service, data, time.time() + ttl)
+            self._bytes += len(data)
+            evicted = 0
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+        if evicted:
+            self.registry.inc('mcp_response_cache_evictions_total', evicted)
+
+    def invalidate(self, service: str) -> None:
+        """写操作后清空该服务的缓存"""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry[0] == service]
+            for key in keys:
+                self._remove(key)
+        if keys:
+            self.registry.inc('mcp_response_cache_invalidations_total', labels={'service': service})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
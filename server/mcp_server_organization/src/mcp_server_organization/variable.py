@@ -6,6 +6,8 @@ OAUTH_HANDLED_PATHS = frozenset({
     '/auth/oauth/token'
 })
 
+METRICS_PATH = '/metrics'
+
 AUTHORIZATION_HEADER = 'Authorization'
 
 TRANSPORT_SSE = 'sse'
@@ -19,6 +21,22 @@ VOLCENGINE_CREDENTIAL_TYPE = 'VOLCENGINE_CREDENTIAL_TYPE'
 MCP_SERVER_MODE = 'MCP_SERVER_MODE'
 MCP_SERVER_AUTH = 'MCP_SERVER_AUTH'
 MCP_SERVER_PORT = 'MCP_SERVER_PORT'
+MCP_SERVER_CATALOG_DIR = 'MCP_SERVER_CATALOG_DIR'
+MCP_SERVER_CLIENT_POOL_SIZE = 'MCP_SERVER_CLIENT_POOL_SIZE'
+MCP_SERVER_CLIENT_POOL_TTL = 'MCP_SERVER_CLIENT_POOL_TTL'
+MCP_SERVER_UPSTREAM_CONCURRENCY = 'MCP_SERVER_UPSTREAM_CONCURRENCY'
+MCP_SERVER_UPSTREAM_TIMEOUT = 'MCP_SERVER_UPSTREAM_TIMEOUT'
+MCP_SERVER_GATEWAY_SERVICES = 'MCP_SERVER_GATEWAY_SERVICES'
+MCP_SERVER_TOKEN_STORE = 'MCP_SERVER_TOKEN_STORE'
+MCP_SERVER_TOKEN_STORE_PATH = 'MCP_SERVER_TOKEN_STORE_PATH'
+MCP_SERVER_PAGINATE_CONCURRENCY = 'MCP_SERVER_PAGINATE_CONCURRENCY'
+MCP_SERVER_PAGINATE_MAX_ITEMS = 'MCP_SERVER_PAGINATE_MAX_ITEMS'
+MCP_SERVER_DATA_DIR = 'MCP_SERVER_DATA_DIR'
+MCP_SERVER_RESPONSE_CACHE = 'MCP_SERVER_RESPONSE_CACHE'
+MCP_SERVER_RESPONSE_CACHE_SIZE = 'MCP_SERVER_RESPONSE_CACHE_SIZE'
+MCP_SERVER_RESPONSE_CACHE_TTL = 'MCP_SERVER_RESPONSE_CACHE_TTL'
+MCP_SERVER_STS_CACHE = 'MCP_SERVER_STS_CACHE'
+MCP_SERVER_STS_REFRESH_MARGIN = 'MCP_SERVER_STS_REFRESH_MARGIN'
 
 CREDENTIAL_TYPE_ENV = 'env'
 CREDENTIAL_TYPE_TOKEN = 'token'
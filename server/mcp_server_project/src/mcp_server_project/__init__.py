@@ -1,9 +1,15 @@
-from .server import serve
+def __getattr__(name):
+    # 延迟导入 server：网关加载其他服务包的 extensions 时不执行该服务 server 模块的初始化
+    if name == 'serve':
+        from .server import serve
+        return serve
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
     """Volcengine MCP Server"""
     import asyncio
+    from .server import serve
     asyncio.run(serve())
 
 
@@ -1,5 +1,4 @@
 import re
-from copy import deepcopy
 from typing import Any, Dict, List, Set, Optional
 
 from fastmcp.utilities.logging import configure_logging, get_logger
@@ -12,130 +11,147 @@ configure_logging("INFO")
 
 
 # $ref 解析逻辑
-def resolve_refs(swagger_dict: Dict[str, Any]) -> Dict[str, Any]:
+class RefResolver:
     """
-    递归解析Swagger字典中的所有内部 $ref 引用 (#/...)
+    惰性、结构共享的 Swagger 内部 $ref 引用 (#/...) 解析器
 
-    Args:
-        swagger_dict: 原始 Swagger 文档字典
-
-    Returns:
-        展开所有 $ref 引用后的 Swagger 文档字典 (一个新的字典对象)
-        如果解析失败则可能抛出 ValueError。
+    - 同一个引用目标只解析一次，所有引用处共享同一个解析结果，内存与耗时随定义数量而非引用数量增长
+    - 不含 $ref 的子树直接复用原文档节点，仅当子节点发生变化时才复制外层容器（写时复制）
+    - 仅解析调用方传入的节点，未被使用的部分（如 responses）不会被展开
 
-    注意：此函数返回一个新的字典，原始字典不会被修改。
+    注意：解析结果与原文档及其他解析结果共享节点，调用方不得原地修改，需要修改时请先浅拷贝。
     """
-    # 用于缓存已解析的引用，避免重复解析和循环引用问题
-    cache = {}
-    # 用于检测循环引用，存储正在解析的 $ref 路径
-    resolving_stack = set()
 
-    def _resolve_node(node: Any) -> Any:
-        """递归解析节点中的$ref"""
+    def __init__(self, swagger_dict: Dict[str, Any]):
+        self.swagger_dict = swagger_dict
+        # 用于缓存已解析的引用，相同引用直接共享解析结果
+        self._cache: Dict[str, Any] = {}
+        # 用于检测循环引用，存储正在解析的 $ref 路径
+        self._resolving_stack: Set[str] = set()
+
+    def resolve(self, node: Any) -> Any:
+        """递归解析节点中的$ref，节点未发生变化时原样返回"""
         if isinstance(node, list):
-            # 递归处理列表中的每个元素
-            # 使用列表推导式创建新列表，避免修改原列表
-            return [_resolve_node(item) for item in node]
+            resolved = [self.resolve(item) for item in node]
+            if all(new is old for new, old in zip(resolved, node)):
+                return node
+            return resolved
 
         if not isinstance(node, dict):
             # 基本类型或非字典对象，直接返回
             return node
 
-        if "$ref" in node:
-            ref_path = node["$ref"]
-            if not isinstance(ref_path, str):
-                logger.error(f"警告：发现非字符串类型的 $ref 值：{ref_path}，将忽略此 $ref。")
-                # 处理字典中 $ref 之外的其他键
-                result = {}
-                for k, v in node.items():
-                    if k != "$ref":
-                        result[k] = _resolve_node(v)
-                return result
-
-            # 检查是否是内部引用
-            if ref_path.startswith('#/'):
-                cache_key = ref_path
-
-                # 检查缓存
-                if cache_key in cache:
-                    # 从缓存返回深拷贝，防止后续修改影响缓存
-                    return deepcopy(cache[cache_key])
-
-                # 检查循环引用
-                if ref_path in resolving_stack:
-                    logger.error(f"警告：检测到循环引用: {ref_path}，将返回 null 或空对象以中断循环。")
-                    # 可以返回 None, {}, 或者一个特定的错误标记对象
-                    # 返回空字典可能比 None 更安全，避免后续处理 .get() 等方法出错
-                    return {"$ref_cycle_detected": ref_path}
-
-                # 将当前引用添加到解析栈
-                resolving_stack.add(ref_path)
-
-                #  查找引用目标
-                parts = ref_path[2:].split('/')
-                target = swagger_dict  # 从根开始查找
-                try:
-                    for part in parts:
-                        # RFC 6901 JSON Pointer 反转义
-                        part_unescaped = part.replace('~1', '/').replace('~0', '~')
-                        if isinstance(target, list):
-                            target = target[int(part_unescaped)]
-                        elif isinstance(target, dict):
-                            # 尝试数字键（用于 responses 等）和字符串键
-                            if part_unescaped.isdigit() and int(part_unescaped) in target:
-                                target = target[int(part_unescaped)]
-                            elif part_unescaped in target:
-                                target = target[part_unescaped]
-                            else:
-                                raise KeyError(f"路径部分 '{part_unescaped}' 在字典中未找到")
-                        else:
-                            raise TypeError(f"路径部分 '{part_unescaped}' 无法在非字典/列表类型中查找")
-                except (KeyError, IndexError, ValueError, TypeError) as e:
-                    # 查找失败，从解析栈中移除并抛出错误
-                    resolving_stack.remove(ref_path)
-                    raise ValueError(f"无法解析引用: {ref_path}, 错误: {e}") from e
-
-                # 递归解析找到的目标
-                resolved_target = _resolve_node(deepcopy(target))
-
-                # 处理 $ref 同级的其他属性
-                result = deepcopy(resolved_target)
-                # 如果基础不是字典（例如 $ref 指向一个字符串或数字），则无法合并
-                if isinstance(result, dict):
-                    for k, v in node.items():
-                        if k != "$ref":
-                            # 对同级属性的值也进行递归解析
-                            result[k] = _resolve_node(v)
-                elif len(node) > 1:  # 如果 $ref 指向非对象，但同级还有其他属性
-                    logger.error(f"警告：$ref '{ref_path}' 指向非对象类型，但同级存在其他属性，这些属性将被忽略。")
-
-                # 缓存并返回结果
-                cache[cache_key] = result
-                # 从解析栈中移除
-                resolving_stack.remove(ref_path)
-
-                return result
+        if "$ref" not in node:
+            return self._resolve_members(node)
+
+        ref_path = node["$ref"]
+        if not isinstance(ref_path, str):
+            logger.error(f"警告：发现非字符串类型的 $ref 值：{ref_path}，将忽略此 $ref。")
+            # 处理字典中 $ref 之外的其他键
+            return {k: self.resolve(v) for k, v in node.items() if k != "$ref"}
+
+        if not ref_path.startswith('#/'):
+            # 不支持外部引用或其他格式的 $ref，保留原样，但递归处理其子节点
+            logger.error(f"警告：跳过不支持的外部或非标准 $ref: {ref_path}")
+            return self._resolve_members(node)
+
+        resolved_target = self._resolve_ref(ref_path)
+        if len(node) == 1:
+            return resolved_target
+
+        # 处理 $ref 同级的其他属性，在解析结果的浅拷贝上合并，不影响共享的缓存结果
+        if not isinstance(resolved_target, dict):
+            logger.error(f"警告：$ref '{ref_path}' 指向非对象类型，但同级存在其他属性，这些属性将被忽略。")
+            return resolved_target
+        result = dict(resolved_target)
+        for k, v in node.items():
+            if k != "$ref":
+                # 对同级属性的值也进行递归解析
+                result[k] = self.resolve(v)
+        return result
 
-            else:
-                # 不支持外部引用或其他格式的 $ref，保留原样，但递归处理其子节点（如果它是对象）
-                logger.error(f"警告：跳过不支持的外部或非标准 $ref: {ref_path}")
-                result = {}
-                for k, v in node.items():
-                    # 保留 $ref 键本身，但递归处理其他值
-                    if k == "$ref":
-                        result[k] = v
+    def deref(self, node: Any) -> Any:
+        """仅跟随节点自身的 $ref 链，不展开子节点，用于只读地查看 responses 等大结构的顶层"""
+        seen: Set[str] = set()
+        while isinstance(node, dict) and isinstance(node.get('$ref'), str) and node['$ref'].startswith('#/'):
+            if node['$ref'] in seen:
+                return {"$ref_cycle_detected": node['$ref']}
+            seen.add(node['$ref'])
+            node = self._lookup(node['$ref'])
+        return node
+
+    def _resolve_members(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """解析字典的每个值，只有当某个值发生变化时才复制字典"""
+        result = None
+        for k, v in node.items():
+            resolved = self.resolve(v)
+            if result is None and resolved is not v:
+                result = dict(node)
+            if result is not None:
+                result[k] = resolved
+        return node if result is None else result
+
+    def _resolve_ref(self, ref_path: str) -> Any:
+        # 检查缓存
+        if ref_path in self._cache:
+            return self._cache[ref_path]
+
+        # 检查循环引用
+        if ref_path in self._resolving_stack:
+            logger.error(f"警告：检测到循环引用: {ref_path}，将返回 null 或空对象以中断循环。")
+            # 返回空字典可能比 None 更安全，避免后续处理 .get() 等方法出错
+            return {"$ref_cycle_detected": ref_path}
+
+        # 将当前引用添加到解析栈
+        self._resolving_stack.add(ref_path)
+        try:
+            resolved = self.resolve(self._lookup(ref_path))
+        finally:
+            # 从解析栈中移除
+            self._resolving_stack.discard(ref_path)
+
+        self._cache[ref_path] = resolved
+        return resolved
+
+    def _lookup(self, ref_path: str) -> Any:
+        """按 JSON Pointer 查找引用目标"""
+        parts = ref_path[2:].split('/')
+        target = self.swagger_dict  # 从根开始查找
+        try:
+            for part in parts:
+                # RFC 6901 JSON Pointer 反转义
+                part_unescaped = part.replace('~1', '/').replace('~0', '~')
+                if isinstance(target, list):
+                    target = target[int(part_unescaped)]
+                elif isinstance(target, dict):
+                    # 尝试数字键（用于 responses 等）和字符串键
+                    if part_unescaped.isdigit() and int(part_unescaped) in target:
+                        target = target[int(part_unescaped)]
+                    elif part_unescaped in target:
+                        target = target[part_unescaped]
                     else:
-                        result[k] = _resolve_node(v)
-                return result
+                        raise KeyError(f"路径部分 '{part_unescaped}' 在字典中未找到")
+                else:
+                    raise TypeError(f"路径部分 '{part_unescaped}' 无法在非字典/列表类型中查找")
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise ValueError(f"无法解析引用: {ref_path}, 错误: {e}") from e
+        return target
 
-        # 处理普通对象（没有 $ref 键）
-        result = {}
-        for k, v in node.items():
-            result[k] = _resolve_node(v)
-        return result
 
-    # 从根节点开始解析，传入原始字典的深拷贝以确保原始字典不变
-    return _resolve_node(deepcopy(swagger_dict))
+def resolve_refs(swagger_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    递归解析Swagger字典中的所有内部 $ref 引用 (#/...)
+
+    Args:
+        swagger_dict: 原始 Swagger 文档字典
+
+    Returns:
+        展开所有 $ref 引用后的 Swagger 文档字典
+        如果解析失败则可能抛出 ValueError。
+
+    注意：原始字典不会被修改，但返回结果与原始字典共享未包含 $ref 的节点，不得原地修改。
+    """
+    return RefResolver(swagger_dict).resolve(swagger_dict)
 
 
 #  ToolName 辅助函数
@@ -186,15 +202,14 @@ def openapi_to_mcp_tools(openapi_spec: Optional[Dict[str, Any]]) -> List[Tool]:
         一个 mcp.types.Tool 对象列表。
     """
     tools: List[Tool] = []
-    resolved_spec: Optional[Dict[str, Any]] = None
-    # 1. 解析 $ref 引用
-    try:
-        resolved_spec = resolve_refs(openapi_spec)
-    except Exception as e:
-        raise e
+    if not isinstance(openapi_spec, dict):
+        logger.error("警告：swagger 文档不是字典。")
+        return []
+    # 1. 惰性解析 $ref 引用，仅展开生成工具所需的参数与请求体
+    resolver = RefResolver(openapi_spec)
 
     # 2. 将 OpenAPI 操作转换为 MCP Tools...
-    paths = resolved_spec.get('paths', {})
+    paths = openapi_spec.get('paths', {})
     if not isinstance(paths, dict):
         logger.error("警告：解析后的规范中缺少 'paths' 键或其值不是字典。")
         return []
@@ -203,9 +218,11 @@ def openapi_to_mcp_tools(openapi_spec: Optional[Dict[str, Any]]) -> List[Tool]:
     for path, path_item in paths.items():
         if not isinstance(path_item, dict):
             continue
+        if "$ref" in path_item:
+            path_item = resolver.resolve(path_item)
 
         # 获取路径级别的参数
-        path_level_params = path_item.get('parameters', [])
+        path_level_params = resolver.resolve(path_item.get('parameters', []))
         if not isinstance(path_level_params, list):  # 添加检查
             logger.error(f"警告：路径 '{path}' 的 parameters 不是列表，已忽略。")
             path_level_params = []
@@ -243,7 +260,7 @@ def openapi_to_mcp_tools(openapi_spec: Optional[Dict[str, Any]]) -> List[Tool]:
             param_properties: Dict[str, Any] = {}
 
             # 合并路径级和操作级的参数
-            operation_params = operation.get('parameters', [])
+            operation_params = resolver.resolve(operation.get('parameters', []))
             if not isinstance(operation_params, list):  # 添加检查
                 logger.error(f"警告：操作 {method.upper()} {path} 的 parameters 不是列表，已忽略。")
                 operation_params = []
@@ -255,7 +272,7 @@ def openapi_to_mcp_tools(openapi_spec: Optional[Dict[str, Any]]) -> List[Tool]:
 
             # 反向迭代，优先处理操作级参数
             for param_def in reversed(all_params):
-                # $ref 已被解析，直接使用字段
+                # $ref 已被解析，直接使用字段（解析结果为共享节点，不得原地修改）
                 param_name = param_def.get('name')
                 param_in = param_def.get('in')
 
@@ -275,7 +292,7 @@ def openapi_to_mcp_tools(openapi_spec: Optional[Dict[str, Any]]) -> List[Tool]:
 
                     # 如果模式中没有描述，则从参数本身获取描述
                     if 'description' not in param_schema and param_def.get('description'):
-                        param_schema['description'] = param_def.get('description')
+                        param_schema = {**param_schema, 'description': param_def.get('description')}
 
                     param_properties[param_name] = param_schema
                     if param_def.get('required', False) or param_in == 'path':
@@ -285,7 +302,7 @@ def openapi_to_mcp_tools(openapi_spec: Optional[Dict[str, Any]]) -> List[Tool]:
                     logger.error(f"警告：参数 '{param_name}' 缺少有效的 schema 定义（非字典），已跳过。")
 
             # 处理请求体 (仅 application/json)
-            request_body = operation.get('requestBody')
+            request_body = resolver.resolve(operation.get('requestBody'))
             if isinstance(request_body, dict):
                 # 检查是否是循环引用占位符
                 if "$ref_cycle_detected" in request_body:
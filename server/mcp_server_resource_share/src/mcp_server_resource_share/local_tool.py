@@ -0,0 +1,69 @@
+import hashlib
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from mcp.types import Tool
+
+# 以当前凭证调用上游 Action：(Action 名, 参数) -> 响应 Result
+ActionInvoker = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# 未配置 data_dir 时本地工具使用的数据目录
+DEFAULT_DATA_DIR = Path.home() / '.cache' / 'mcp-server'
+
+
+@dataclass
+class LocalContext:
+    """本地工具的调用上下文"""
+    invoke: ActionInvoker
+    identity: str  # 当前凭证的标识（AK、SK 与 SessionToken 的摘要），用于隔离不同调用方的本地数据
+    data_dir: Path  # 本地数据目录
+    config: Any = None  # 服务配置 Config
+
+
+@dataclass
+class LocalTool:
+    """在本地执行的工具（如基于本地数据的聚合查询），与 swagger 生成的工具一起暴露"""
+    tool: Tool
+    handler: Callable[[LocalContext, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class ActionInterceptor:
+    """拦截 swagger 中的同名 Action（如为 AssumeRole 增加凭证缓存），handler 通过 context.invoke 调用上游"""
+    action: str
+    handler: Callable[[LocalContext, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def credential_identity(ak: Optional[str], sk: Optional[str], session_token: Optional[str] = None) -> str:
+    """
+    本地数据的租户标识
+
+    AK 不是秘密，只按 AK 区分时知道 AK 即可读取他人的本地数据，因此 SK 与 SessionToken 也参与摘要；
+    临时凭证轮换后标识随之变化，之前的本地数据不再被读取。
+    """
+    raw = '\0'.join(part or '' for part in (ak, sk, session_token))
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def _extensions(package: str) -> Any:
+    """服务包的 extensions 模块，不存在时返回 None"""
+    try:
+        return importlib.import_module(f'{package}.extensions')
+    except ModuleNotFoundError as e:
+        if e.name not in (package, f'{package}.extensions'):
+            raise
+        return None
+
+
+def load_local_tools(package: str) -> Dict[str, LocalTool]:
+    """加载服务包 extensions 模块中声明的 LOCAL_TOOLS，服务没有本地工具时返回空字典"""
+    tools: List[LocalTool] = getattr(_extensions(package), 'LOCAL_TOOLS', [])
+    return {local_tool.tool.name: local_tool for local_tool in tools}
+
+
+def load_action_interceptors(package: str) -> Dict[str, ActionInterceptor]:
+    """加载服务包 extensions 模块中声明的 ACTION_INTERCEPTORS"""
+    interceptors: List[ActionInterceptor] = getattr(_extensions(package), 'ACTION_INTERCEPTORS', [])
+    return {interceptor.action: interceptor for interceptor in interceptors}
@@ -0,0 +1,231 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .openapi import RefResolver
+
+# 分页控制参数，仅在本地使用，不会发送到上游
+AUTO_PAGINATE_ARG = 'auto_paginate'
+MAX_ITEMS_ARG = 'max_items'
+
+PAGINATION_STYLE_OFFSET = 'offset'
+PAGINATION_STYLE_PAGE = 'page'
+PAGINATION_STYLE_TOKEN = 'token'
+
+# (分页方式, 游标参数, 页大小参数候选)
+_REQUEST_PATTERNS = [
+    (PAGINATION_STYLE_TOKEN, 'NextToken', ('MaxResults', 'Limit', 'PageSize')),
+    (PAGINATION_STYLE_OFFSET, 'Offset', ('Limit',)),
+    (PAGINATION_STYLE_PAGE, 'PageNumber', ('PageSize',)),
+]
+_TOTAL_FIELDS = ('Total', 'TotalCount')
+
+PageFetcher = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class Pagination:
+    """从 swagger 中识别出的 Action 分页方式"""
+    style: str  # offset / page / token
+    cursor_param: str  # Offset / PageNumber / NextToken
+    size_param: Optional[str]  # Limit / PageSize / MaxResults
+    max_size: Optional[int]  # 页大小参数的 maximum
+    items: List[str]  # 响应中承载列表数据的字段
+    total: Optional[str] = None  # 响应中的总数字段（offset / page）
+    next_token: Optional[str] = None  # 响应中的下一页游标字段（token）
+
+
+def _operation_params(resolver: RefResolver, path_item: Dict[str, Any], operation: Dict[str, Any]
+                      ) -> Dict[str, Dict[str, Any]]:
+    """收集操作的 query/path 参数与请求体属性：参数名 -> schema"""
+    params: Dict[str, Dict[str, Any]] = {}
+    for param in (path_item.get('parameters') or []) + (operation.get('parameters') or []):
+        param = resolver.deref(param)
+        if isinstance(param, dict) and isinstance(param.get('name'), str):
+            params[param['name']] = resolver.deref(param.get('schema')) or {}
+    request_body = resolver.deref(operation.get('requestBody'))
+    if isinstance(request_body, dict) and isinstance(request_body.get('content'), dict):
+        for media_type in request_body['content'].values():
+            schema = resolver.deref((media_type or {}).get('schema'))
+            if isinstance(schema, dict) and isinstance(schema.get('properties'), dict):
+                for name, prop in schema['properties'].items():
+                    params.setdefault(name, resolver.deref(prop) or {})
+    return params
+
+
+def _response_properties(resolver: RefResolver, operation: Dict[str, Any]) -> Dict[str, Any]:
+    responses = operation.get('responses') or {}
+    response = resolver.deref(responses.get('200') or responses.get(200))
+    if not isinstance(response, dict):
+        return {}
+    for media_type in (response.get('content') or {}).values():
+        schema = resolver.deref((media_type or {}).get('schema'))
+        if isinstance(schema, dict) and isinstance(schema.get('properties'), dict):
+            return {name: resolver.deref(prop) for name, prop in schema['properties'].items()}
+    return {}
+
+
+def detect_pagination(resolver: RefResolver, path_item: Dict[str, Any], operation: Dict[str, Any]
+                      ) -> Optional[Pagination]:
+    """根据请求参数（Limit/Offset、PageNumber/PageSize、NextToken）与响应结构识别分页方式"""
+    params = _operation_params(resolver, path_item, operation)
+    response = _response_properties(resolver, operation)
+    items = [name for name, prop in response.items() if isinstance(prop, dict) and prop.get('type') == 'array']
+    if not items:
+        return None
+
+    for style, cursor_param, size_candidates in _REQUEST_PATTERNS:
+        if cursor_param not in params:
+            continue
+        size_param = next((name for name in size_candidates if name in params), None)
+        max_size = params[size_param].get('maximum') if size_param else None
+        pagination = Pagination(style=style, cursor_param=cursor_param, size_param=size_param,
+                                max_size=max_size if isinstance(max_size, int) else None, items=items)
+        if style == PAGINATION_STYLE_TOKEN:
+            if 'NextToken' not in response:
+                continue
+            pagination.next_token = 'NextToken'
+        else:
+            if size_param is None:
+                continue
+            pagination.total = next((name for name in _TOTAL_FIELDS if name in response), None)
+        return pagination
+    return None
+
+
+def pagination_schema() -> Dict[str, Any]:
+    """分页工具额外暴露的控制参数"""
+    return {
+        AUTO_PAGINATE_ARG: {
+            "type": "boolean",
+            "description": "自动翻页并合并所有分页结果（偏移分页并发拉取，游标分页顺序拉取），默认 false",
+        },
+        MAX_ITEMS_ARG: {
+            "type": "integer",
+            "minimum": 1,
+            "description": "自动翻页时最多返回的条目数",
+        },
+    }
+
+
+def _item_key(item: Any) -> str:
+    return json.dumps(item, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _overlap(previous: List[str], current: List[str]) -> int:
+    """previous 末尾与 current 开头相同的条目数（翻页期间有数据插入时，相邻两页会有重叠）"""
+    for count in range(min(len(previous), len(current)), 0, -1):
+        if previous[-count:] == current[:count]:
+            return count
+    return 0
+
+
+def merge_pages(pagination: Pagination, pages: List[Dict[str, Any]], max_items: int) -> Dict[str, Any]:
+    """按顺序合并分页结果，去掉相邻两页重叠的条目并截断到 max_items；内容相同但不在重叠处的条目保留"""
+    result = dict(pages[0]) if pages else {}
+    truncated = False
+    for field in pagination.items:
+        merged: List[Any] = []
+        previous: List[str] = []
+        for page in pages:
+            items = page.get(field) or []
+            keys = [_item_key(item) for item in items]
+            skip = _overlap(previous, keys) if pagination.style != PAGINATION_STYLE_TOKEN else 0
+            merged.extend(items[skip:])
+            previous = keys
+        if len(merged) > max_items:
+            merged = merged[:max_items]
+            truncated = True
+        result[field] = merged
+    if pagination.next_token and pages:
+        # 保留最后一页的游标，因 max_items 提前停止时调用方可继续拉取
+        result[pagination.next_token] = pages[-1].get(pagination.next_token) or ''
+    result['AutoPaginated'] = {
+        "Pages": len(pages),
+        "Items": max((len(result.get(field) or []) for field in pagination.items), default=0),
+        "Truncated": truncated,
+    }
+    return result
+
+
+def _page_count(page: Dict[str, Any], pagination: Pagination) -> int:
+    return max((len(page.get(field) or []) for field in pagination.items), default=0)
+
+
+async def paginate(pagination: Pagination, fetch: PageFetcher, arguments: Dict[str, Any],
+                   max_items: int, concurrency: int = 4) -> Dict[str, Any]:
+    """
+    自动翻页
+
+    - offset / page：先拉取第一页获得总数，其余页在 concurrency 限制下并发拉取
+    - token：按 NextToken 顺序拉取
+    - 无总数的 offset / page：顺序拉取直到返回不足一页
+    - 第一页的条目数少于请求的页大小但还有后续数据（服务端限制了单页条目数）：以第一页的条目数为步长顺序拉取
+    拉取条目数达到 max_items 后停止。
+    """
+    arguments = dict(arguments)
+    if pagination.size_param and arguments.get(pagination.size_param) is None and pagination.max_size:
+        arguments[pagination.size_param] = pagination.max_size
+    size = arguments.get(pagination.size_param) if pagination.size_param else None
+
+    if pagination.style == PAGINATION_STYLE_TOKEN:
+        pages = []
+        collected = 0
+        while True:
+            page = await fetch(arguments)
+            pages.append(page)
+            collected += _page_count(page, pagination)
+            token = page.get(pagination.next_token)
+            if not token or collected >= max_items:
+                break
+            arguments[pagination.cursor_param] = token
+        return merge_pages(pagination, pages, max_items)
+
+    is_offset = pagination.style == PAGINATION_STYLE_OFFSET
+    start = arguments.get(pagination.cursor_param)
+    if start is None:
+        start = 0 if is_offset else 1
+    arguments[pagination.cursor_param] = start
+    first = await fetch(arguments)
+    pages = [first]
+    observed = _page_count(first, pagination)
+    size = size or first.get(pagination.size_param) or observed
+    if not size or observed == 0:
+        return merge_pages(pagination, pages, max_items)
+
+    total = first.get(pagination.total) if pagination.total else None
+    already = (start if is_offset else (start - 1) * size)
+    capped = observed < size and not (isinstance(total, int) and already + observed >= total)
+    if capped:
+        # 服务端实际的单页条目数小于请求的页大小，按实际条目数翻页，页码分页同时把页大小改为实际条目数
+        size = observed
+        if not is_offset:
+            arguments[pagination.size_param] = size
+            already = (start - 1) * size
+
+    def cursor(index: int) -> int:
+        # index 为相对于起始页的页序号
+        return start + index * size if is_offset else start + index
+
+    if isinstance(total, int) and not capped:
+        remaining = min(total - already, max_items) - observed
+        page_total = max(0, -(-remaining // size))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(index: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await fetch(dict(arguments, **{pagination.cursor_param: cursor(index)}))
+
+        pages += await asyncio.gather(*(fetch_page(index) for index in range(1, page_total + 1)))
+        return merge_pages(pagination, pages, max_items)
+
+    # 响应中没有总数或单页条目数受限，顺序拉取直到不足一页或达到总数
+    index, collected = 1, observed
+    limit = min(max_items, total - already) if isinstance(total, int) else max_items
+    while collected < limit and _page_count(pages[-1], pagination) >= size:
+        page = await fetch(dict(arguments, **{pagination.cursor_param: cursor(index)}))
+        pages.append(page)
+        collected += _page_count(page, pagination)
+        index += 1
+    return merge_pages(pagination, pages, max_items)
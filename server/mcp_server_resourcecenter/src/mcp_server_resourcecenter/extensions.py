@@ -0,0 +1,106 @@
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Dict
+
+from mcp.types import Tool
+
+from .inventory import DEFAULT_TTL, GROUP_FIELDS, InventoryManager
+from .local_tool import LocalContext, LocalTool
+
+inventories = InventoryManager()
+
+
+async def crawl_resource_inventory(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    index = inventories.start(context.invoke, context.identity, ttl=arguments.get('TTL') or DEFAULT_TTL,
+                              types=arguments.get('ResourceTypes'), regions=arguments.get('Regions'),
+                              refresh=bool(arguments.get('Refresh')))
+    if arguments.get('Wait') and index.task is not None:
+        await asyncio.shield(index.task)
+    return index.status()
+
+
+async def get_resource_inventory_status(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    index = inventories.get(context.identity)
+    if index is None:
+        return {"Resources": 0, "Complete": False, "Message": "资源清单不存在或已过期，请先调用 CrawlResourceInventory"}
+    return index.status()
+
+
+async def query_resource_inventory(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    index = inventories.get(context.identity)
+    if index is None:
+        # 没有可用的索引时开始拉取，并等待完成
+        index = inventories.start(context.invoke, context.identity)
+        await asyncio.shield(index.task)
+    start = time.perf_counter()
+    resources = index.select(arguments.get('ResourceIDs'), arguments.get('ResourceTypes'), arguments.get('Regions'),
+                             arguments.get('Tags'), arguments.get('NameContains'))
+    result: Dict[str, Any] = {"Total": len(resources), "Complete": index.complete}
+    group_by = arguments.get('GroupBy')
+    if group_by:
+        counts = Counter(getattr(resource, group_by) for resource in resources)
+        result["Groups"] = [{group_by: name, "Count": count} for name, count in counts.most_common()]
+    else:
+        offset = arguments.get('Offset') or 0
+        limit = arguments.get('Limit') or 100
+        result["Resources"] = [resource.to_dict() for resource in resources[offset:offset + limit]]
+    result["QueryMs"] = round((time.perf_counter() - start) * 1000, 2)
+    return result
+
+
+_SCOPE_PROPERTIES = {
+    "ResourceTypes": {"type": "array", "items": {"type": "string"},
+                      "description": "资源类型，格式 <服务>.<资源类型>，如 [\"ecs.instance\"]"},
+    "Regions": {"type": "array", "items": {"type": "string"}, "description": "地域，如 [\"cn-beijing\"]"},
+}
+
+LOCAL_TOOLS = [
+    LocalTool(
+        tool=Tool(
+            name='CrawlResourceInventory',
+            description="在后台拉取当前账号的资源清单并建立本地索引：通过 ListResourceTypes/GetResourceCounts "
+                        "确定有资源的类型，按资源类型（资源较多时再按地域）并发调用 SearchResources，每返回一页即写入索引。"
+                        "索引在 TTL 内可被 QueryResourceInventory 直接查询。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **_SCOPE_PROPERTIES,
+                    "TTL": {"type": "integer", "minimum": 1, "description": f"索引有效期（秒），默认 {DEFAULT_TTL}"},
+                    "Refresh": {"type": "boolean", "description": "是否丢弃现有索引重新拉取，默认 false"},
+                    "Wait": {"type": "boolean", "description": "是否等待拉取完成后再返回，默认 false"},
+                },
+            },
+        ),
+        handler=crawl_resource_inventory,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='GetResourceInventoryStatus',
+            description="查询资源清单索引的拉取进度（已完成分片数、资源数、过期时间、错误）。",
+            inputSchema={"type": "object", "properties": {}},
+        ),
+        handler=get_resource_inventory_status,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='QueryResourceInventory',
+            description="基于本地资源清单索引按资源 ID、类型、地域、标签、名称查询资源或分组计数；"
+                        "拉取尚未完成时返回已拉取的部分（Complete 为 false），没有索引时先拉取并等待完成。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "ResourceIDs": {"type": "array", "items": {"type": "string"}, "description": "资源 ID"},
+                    **_SCOPE_PROPERTIES,
+                    "Tags": {"type": "object",
+                             "description": "标签过滤，标签键 -> 标签值或标签值列表，值为空字符串时只要求存在该标签键"},
+                    "NameContains": {"type": "string", "description": "资源名称或 ID 包含的字符串"},
+                    "GroupBy": {"type": "string", "enum": list(GROUP_FIELDS), "description": "按字段分组计数"},
+                    "Limit": {"type": "integer", "minimum": 1, "description": "返回的资源数，默认 100"},
+                    "Offset": {"type": "integer", "minimum": 0, "description": "偏移量，默认 0"},
+                },
+            },
+        ),
+        handler=query_resource_inventory,
+    ),
+]
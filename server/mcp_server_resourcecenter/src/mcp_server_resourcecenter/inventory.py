@@ -0,0 +1,247 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from fastmcp.utilities.logging import configure_logging, get_logger
+
+from .local_tool import ActionInvoker
+
+# 定义logger
+logger = get_logger(__name__)
+configure_logging("INFO")
+
+SEARCH_ACTION = 'SearchResources'
+SEARCH_PAGE_SIZE = 100
+DEFAULT_TTL = 1800
+DEFAULT_CONCURRENCY = 8
+# 资源数超过该值的资源类型再按地域拆分，拆分后的分片并发拉取
+SPLIT_THRESHOLD = 1000
+
+GROUP_FIELDS = ('ResourceType', 'Region', 'ProjectName', 'Service')
+
+
+class Resource(NamedTuple):
+    """索引中的资源，只保留查询所需字段"""
+    ResourceID: str
+    ResourceType: str  # <Service>.<ResourceType>
+    Service: str
+    Region: Optional[str]
+    ResourceName: Optional[str]
+    ProjectName: Optional[str]
+    CreateTime: Optional[str]
+    Tags: Tuple[Tuple[str, str], ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self._asdict()
+        data['Tags'] = [{'Key': key, 'Value': value} for key, value in self.Tags]
+        return data
+
+
+def type_filter_value(group_name: str) -> str:
+    # GetResourceCounts 的分组名形如 ecs:instance，SearchResources 的过滤值形如 ecs.instance
+    return group_name.replace(':', '.', 1)
+
+
+class ResourceIndex:
+    """
+    单个账号的资源清单索引（内存）
+
+    资源按 (类型, ID) 去重，并建立按 ID、类型、地域、标签的倒排索引；
+    拉取过程中每返回一页即写入索引，拉取未完成时也可查询（结果标记为不完整）。
+    """
+
+    def __init__(self, ttl: int = DEFAULT_TTL, scope: Tuple[Tuple[str, ...], Tuple[str, ...]] = ((), ())):
+        self.ttl = ttl
+        # 拉取范围 (资源类型, 地域)，为空表示全部
+        self.scope = scope
+        self.started_at = time.time()
+        self.completed_at: Optional[float] = None
+        self.shards_total = 0
+        self.shards_done = 0
+        self.errors: List[str] = []
+        self.task: Optional[asyncio.Task] = None
+        self._resources: Dict[Tuple[str, str], Resource] = {}
+        self._by_id: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self._by_type: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self._by_region: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self._by_tag: Dict[Tuple[str, str], Set[Tuple[str, str]]] = defaultdict(set)
+
+    @property
+    def complete(self) -> bool:
+        return self.completed_at is not None
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return self.complete and (now or time.time()) >= self.completed_at + self.ttl
+
+    def add(self, items: Iterable[Dict[str, Any]]) -> None:
+        for item in items:
+            resource_type = f"{item.get('Service')}.{item.get('ResourceType')}"
+            resource = Resource(
+                ResourceID=str(item.get('ResourceID')), ResourceType=resource_type,
+                Service=item.get('Service'), Region=item.get('Region'), ResourceName=item.get('ResourceName'),
+                ProjectName=item.get('ProjectName'), CreateTime=item.get('CreateTime'),
+                Tags=tuple((tag.get('Key'), tag.get('Value') or '') for tag in item.get('Tags') or []),
+            )
+            key = (resource_type, resource.ResourceID)
+            self._remove(key)
+            self._resources[key] = resource
+            self._by_id[resource.ResourceID].add(key)
+            self._by_type[resource_type].add(key)
+            self._by_region[resource.Region or ''].add(key)
+            for tag in resource.Tags:
+                self._by_tag[tag].add(key)
+                self._by_tag[(tag[0], None)].add(key)
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        resource = self._resources.pop(key, None)
+        if resource is None:
+            return
+        self._by_id[resource.ResourceID].discard(key)
+        self._by_type[resource.ResourceType].discard(key)
+        self._by_region[resource.Region or ''].discard(key)
+        for tag in resource.Tags:
+            self._by_tag[tag].discard(key)
+            self._by_tag[(tag[0], None)].discard(key)
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "Resources": len(self._resources),
+            "Complete": self.complete,
+            "ShardsTotal": self.shards_total,
+            "ShardsDone": self.shards_done,
+            "StartedAt": int(self.started_at),
+            "ExpiresAt": int(self.completed_at + self.ttl) if self.complete else None,
+            "Errors": self.errors,
+        }
+
+    def select(self, resource_ids: Optional[Sequence[str]] = None, types: Optional[Sequence[str]] = None,
+               regions: Optional[Sequence[str]] = None, tags: Optional[Dict[str, Any]] = None,
+               name_contains: Optional[str] = None) -> List[Resource]:
+        """各条件之间为与，条件内的多个取值为或；标签值为空时只要求存在该标签键"""
+        candidates: Optional[Set[Tuple[str, str]]] = None
+
+        def narrow(keys: Set[Tuple[str, str]]) -> None:
+            nonlocal candidates
+            candidates = set(keys) if candidates is None else candidates & keys
+
+        if resource_ids:
+            narrow(set().union(*(self._by_id.get(str(value), set()) for value in resource_ids)))
+        if types:
+            narrow(set().union(*(self._by_type.get(value, set()) for value in types)))
+        if regions:
+            narrow(set().union(*(self._by_region.get(value, set()) for value in regions)))
+        for key, values in (tags or {}).items():
+            values = values if isinstance(values, list) else [values]
+            values = [value for value in values if value is not None and value != '']
+            if values:
+                narrow(set().union(*(self._by_tag.get((key, str(value)), set()) for value in values)))
+            else:
+                narrow(self._by_tag.get((key, None), set()))
+        keys = self._resources.keys() if candidates is None else candidates
+        resources = [self._resources[key] for key in keys if key in self._resources]
+        if name_contains:
+            resources = [r for r in resources if name_contains in (r.ResourceName or '') or name_contains in r.ResourceID]
+        resources.sort(key=lambda r: (r.ResourceType, r.Region or '', r.ResourceID))
+        return resources
+
+
+async def _count(invoke: ActionInvoker, group_by: str) -> Dict[str, int]:
+    resp = await invoke('GetResourceCounts', {'GroupByKey': group_by})
+    return {item['GroupName']: item.get('Count') or 0 for item in resp.get('ResourceCounts') or []
+            if item.get('GroupName')}
+
+
+async def plan_shards(invoke: ActionInvoker, types: Optional[Sequence[str]] = None,
+                      regions: Optional[Sequence[str]] = None) -> List[Tuple[str, Optional[str]]]:
+    """
+    生成拉取分片 (资源类型, 地域)
+
+    通过 ListResourceTypes 与 GetResourceCounts 获取资源类型及数量，跳过没有资源的类型；
+    资源数超过 SPLIT_THRESHOLD 的类型按有资源的地域拆分为多个分片。
+    """
+    resource_types, type_counts, region_counts = await asyncio.gather(
+        invoke('ListResourceTypes', {}), _count(invoke, 'ResourceType'), _count(invoke, 'Region'))
+    counts = {type_filter_value(name): count for name, count in type_counts.items()}
+    all_types = [f"{item['Service']}.{item['ResourceType']}" for item in resource_types.get('ResourceTypes') or []]
+    if counts:
+        all_types = [name for name in all_types if counts.get(name, 0) > 0] + \
+                    [name for name in counts if name not in all_types and counts[name] > 0]
+    if types:
+        all_types = [name for name in all_types if name in types] or list(types)
+    all_regions = list(regions) if regions else [name for name, count in region_counts.items() if count > 0]
+
+    shards: List[Tuple[str, Optional[str]]] = []
+    for name in all_types:
+        if regions or (counts.get(name, 0) > SPLIT_THRESHOLD and all_regions):
+            shards += [(name, region) for region in all_regions]
+        else:
+            shards.append((name, None))
+    return shards
+
+
+async def crawl(invoke: ActionInvoker, index: ResourceIndex, types: Optional[Sequence[str]] = None,
+                regions: Optional[Sequence[str]] = None, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+    """按分片在 concurrency 限制下并发拉取 SearchResources，每返回一页即写入索引"""
+    try:
+        shards = await plan_shards(invoke, types, regions)
+    except Exception as e:
+        index.errors.append(f"plan: {e}")
+        index.completed_at = time.time()
+        raise
+    index.shards_total = len(shards)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def crawl_shard(resource_type: str, region: Optional[str]) -> None:
+        filters = [{'Key': 'ResourceType', 'Values': [resource_type]}]
+        if region:
+            filters.append({'Key': 'Region', 'Values': [region]})
+        arguments: Dict[str, Any] = {'Filter': filters, 'MaxResults': SEARCH_PAGE_SIZE}
+        async with semaphore:
+            try:
+                while True:
+                    page = await invoke(SEARCH_ACTION, arguments)
+                    index.add(page.get('Resources') or [])
+                    if not page.get('NextToken'):
+                        break
+                    arguments = dict(arguments, NextToken=page['NextToken'])
+            except Exception as e:
+                logger.error(f"警告：资源类型 {resource_type} {region or ''} 拉取失败: {e}")
+                index.errors.append(f"{resource_type}{'@' + region if region else ''}: {e}")
+            finally:
+                index.shards_done += 1
+
+    await asyncio.gather(*(crawl_shard(*shard) for shard in shards))
+    index.completed_at = time.time()
+
+
+class InventoryManager:
+    """按凭证维护资源清单索引，过期前的查询直接使用索引，不重新拉取"""
+
+    def __init__(self):
+        self._indexes: Dict[str, ResourceIndex] = {}
+
+    def get(self, identity: str) -> Optional[ResourceIndex]:
+        index = self._indexes.get(identity)
+        if index is not None and index.expired():
+            del self._indexes[identity]
+            return None
+        return index
+
+    def start(self, invoke: ActionInvoker, identity: str, ttl: int = DEFAULT_TTL,
+              types: Optional[Sequence[str]] = None, regions: Optional[Sequence[str]] = None,
+              refresh: bool = False) -> ResourceIndex:
+        scope = (tuple(sorted(types or ())), tuple(sorted(regions or ())))
+        index = self.get(identity)
+        if index is not None and not refresh and index.scope == scope:
+            return index
+        if index is not None and index.task is not None and not index.task.done():
+            index.task.cancel()
+        index = ResourceIndex(ttl, scope)
+        index.task = asyncio.ensure_future(crawl(invoke, index, types, regions))
+        index.task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        self._indexes[identity] = index
+        return index
@@ -0,0 +1,160 @@
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+# 编译后的校验函数：(值, 字段路径, 错误列表) -> 转换后的值
+SchemaValidator = Callable[[Any, str, List[Dict[str, str]]], Any]
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    'string': lambda v: isinstance(v, str),
+    'integer': lambda v: isinstance(v, int) and not isinstance(v, bool),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'boolean': lambda v: isinstance(v, bool),
+    'array': lambda v: isinstance(v, list),
+    'object': lambda v: isinstance(v, dict),
+}
+
+
+class ArgumentValidationError(ValueError):
+    """工具参数未通过本地校验，errors 为 [{"Field": ..., "Message": ...}]"""
+
+    def __init__(self, tool_name: str, errors: List[Dict[str, str]]):
+        self.tool_name = tool_name
+        self.errors = errors
+        super().__init__(json.dumps({
+            "Error": {
+                "Code": "InvalidParameter",
+                "Message": f"Invalid arguments for {tool_name}: "
+                           + "; ".join(f"{e['Field'] or '<root>'}: {e['Message']}" for e in errors),
+                "Details": errors,
+            }
+        }, ensure_ascii=False))
+
+
+def _coerce(type_: str, value: Any) -> Any:
+    """尝试将明显可转换的值转换为目标类型（如字符串形式的整数），无法转换时原样返回"""
+    try:
+        if type_ == 'integer':
+            if isinstance(value, str):
+                return int(value.strip())
+            if isinstance(value, float) and value.is_integer():
+                return int(value)
+        elif type_ == 'number' and isinstance(value, str):
+            text = value.strip()
+            return int(text) if text.lstrip('+-').isdigit() else float(text)
+        elif type_ == 'string' and isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        elif type_ == 'boolean' and isinstance(value, str) and value.strip().lower() in ('true', 'false'):
+            return value.strip().lower() == 'true'
+        elif type_ in ('array', 'object') and isinstance(value, str) and value.strip()[:1] in ('[', '{'):
+            return json.loads(value)
+        elif type_ == 'array' and not isinstance(value, (list, dict)):
+            return [value]
+    except ValueError:
+        pass
+    return value
+
+
+def _enum_key(value: Any) -> str:
+    # swagger 中的枚举值类型常与字段类型不一致（如整数字段的字符串枚举），统一按字符串比较
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def _join(path: str, key: Any) -> str:
+    if isinstance(key, int):
+        return f'{path}[{key}]'
+    return f'{path}.{key}' if path else str(key)
+
+
+def compile_schema(schema: Any) -> SchemaValidator:
+    """将 JSON Schema（工具 inputSchema 使用的子集）编译为校验函数，关键字只在编译时解析一次"""
+    if not isinstance(schema, dict):
+        return lambda value, path, errors: value
+
+    type_ = schema.get('type') if isinstance(schema.get('type'), str) else None
+    type_check = _TYPE_CHECKS.get(type_)
+    enum = schema.get('enum') if isinstance(schema.get('enum'), list) else None
+    enum_keys = {_enum_key(item) for item in enum} if enum is not None else None
+    min_length = schema.get('minLength')
+    max_length = schema.get('maxLength')
+    pattern = None
+    if isinstance(schema.get('pattern'), str):
+        try:
+            pattern = re.compile(schema['pattern'])
+        except re.error:
+            pass
+    minimum = schema.get('minimum')
+    maximum = schema.get('maximum')
+    min_items = schema.get('minItems')
+    max_items = schema.get('maxItems')
+    items = compile_schema(schema['items']) if isinstance(schema.get('items'), dict) else None
+    properties = {name: compile_schema(prop) for name, prop in schema.get('properties', {}).items()} \
+        if isinstance(schema.get('properties'), dict) else {}
+    required = [name for name in schema.get('required', []) if isinstance(name, str)] \
+        if isinstance(schema.get('required'), list) else []
+
+    def validate(value: Any, path: str, errors: List[Dict[str, str]]) -> Any:
+        if type_check is not None and not type_check(value):
+            coerced = _coerce(type_, value)
+            if not type_check(coerced):
+                errors.append({"Field": path, "Message": f"expected {type_}, got {type(value).__name__}"})
+                return value
+            value = coerced
+
+        if enum_keys is not None:
+            candidates = value if isinstance(value, list) else [value]
+            if any(_enum_key(item) not in enum_keys for item in candidates):
+                errors.append({"Field": path, "Message": f"must be one of {enum}"})
+        if isinstance(value, str):
+            if isinstance(min_length, int) and len(value) < min_length:
+                errors.append({"Field": path, "Message": f"length must be >= {min_length}"})
+            if isinstance(max_length, int) and len(value) > max_length:
+                errors.append({"Field": path, "Message": f"length must be <= {max_length}"})
+            if pattern is not None and not pattern.search(value):
+                errors.append({"Field": path, "Message": f"must match pattern {pattern.pattern}"})
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            if isinstance(minimum, (int, float)) and value < minimum:
+                errors.append({"Field": path, "Message": f"must be >= {minimum}"})
+            if isinstance(maximum, (int, float)) and value > maximum:
+                errors.append({"Field": path, "Message": f"must be <= {maximum}"})
+        elif isinstance(value, list):
+            if isinstance(min_items, int) and len(value) < min_items:
+                errors.append({"Field": path, "Message": f"must contain >= {min_items} items"})
+            if isinstance(max_items, int) and len(value) > max_items:
+                errors.append({"Field": path, "Message": f"must contain <= {max_items} items"})
+            if items is not None:
+                value = [items(item, _join(path, i), errors) for i, item in enumerate(value)]
+        elif isinstance(value, dict):
+            for name in required:
+                if value.get(name) is None:
+                    errors.append({"Field": _join(path, name), "Message": "is required"})
+            if properties:
+                value = {name: properties[name](item, _join(path, name), errors) if name in properties else item
+                         for name, item in value.items()}
+        return value
+
+    return validate
+
+
+class ArgumentValidator:
+    """单个工具的参数校验器，基于 inputSchema 预编译"""
+
+    def __init__(self, tool_name: str, input_schema: Optional[Dict[str, Any]]):
+        self.tool_name = tool_name
+        self._validate = compile_schema(input_schema)
+
+    def validate(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        校验并转换参数
+
+        Returns:
+            转换后的参数（如 "10" -> 10）
+
+        Raises:
+            ArgumentValidationError: 参数不合法
+        """
+        errors: List[Dict[str, str]] = []
+        value = self._validate(arguments, '', errors)
+        if errors:
+            raise ArgumentValidationError(self.tool_name, errors)
+        return value
@@ -18,3 +18,6 @@ class RtcAPI(BaseService):
             service_info_map=service_info_map,
         )
         self.set_api_info(api_info)
+        # 启动、更新、停止智能体任务不是幂等操作，服务端出错时不自动重试
+        for action in api_info:
+            self.set_action_policy(action, retries=0)
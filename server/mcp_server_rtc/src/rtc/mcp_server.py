@@ -20,6 +20,8 @@ def create_mcp_server():
         port=int(os.getenv("MCP_SERVER_PORT", "8000")),
         streamable_http_path=os.getenv("STREAMABLE_HTTP_PATH", "/mcp")
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
@@ -0,0 +1,102 @@
+import asyncio
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastmcp.utilities.logging import configure_logging, get_logger
+
+from .metrics import Metrics, metrics as default_metrics
+from .sdk_tool import parse_expired_time
+
+# 定义logger
+logger = get_logger(__name__)
+configure_logging("INFO")
+
+CacheKey = Tuple[str, str, str, str]
+CredentialFetcher = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+def credential_key(identity: str, arguments: Dict[str, Any]) -> CacheKey:
+    """
+    缓存键：(调用方凭证标识, RoleTrn, RoleSessionName, 策略摘要)，有效时长不同的请求视为不同策略
+
+    identity 必须是 credential_identity(ak, sk, session_token) 这类覆盖完整凭证的摘要：
+    缓存命中时不会再访问上游校验凭证，只按 AK 区分时知道 AK 即可取走他人的临时凭证。
+    """
+    policy = json.dumps([arguments.get('Policy') or '', arguments.get('DurationSeconds')], ensure_ascii=False)
+    return (identity, str(arguments.get('RoleTrn') or ''), str(arguments.get('RoleSessionName') or ''),
+            hashlib.sha256(policy.encode('utf-8')).hexdigest())
+
+
+class StsCredentialCache:
+    """
+    AssumeRole 临时凭证缓存（refresh-ahead + singleflight）
+
+    - 未过期的凭证直接返回
+    - 距离 ExpiredTime 不足 refresh_margin 秒时返回当前凭证，同时在后台刷新
+    - 相同缓存键的并发请求（包括后台刷新）合并为一次上游调用
+    """
+
+    def __init__(self, refresh_margin: int = 300, max_size: int = 1024, registry: Metrics = default_metrics):
+        self.refresh_margin = refresh_margin
+        self.max_size = max_size
+        self.registry = registry
+        # key -> (AssumeRole 响应, 过期时间戳)
+        self._entries: OrderedDict[CacheKey, Tuple[Dict[str, Any], float]] = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        registry.gauge('mcp_sts_cache_entries', lambda: len(self._entries))
+
+    async def get(self, key: CacheKey, fetch: CredentialFetcher) -> Dict[str, Any]:
+        entry = self._entries.get(key)
+        now = time.time()
+        if entry is not None and entry[1] > now:
+            self._entries.move_to_end(key)
+            self.registry.inc('mcp_sts_cache_hits_total')
+            if entry[1] - now <= self.refresh_margin and key not in self._inflight:
+                self.registry.inc('mcp_sts_cache_refreshes_total')
+                self._start(key, fetch).add_done_callback(self._log_refresh_error)
+            return copy.deepcopy(entry[0])
+
+        self.registry.inc('mcp_sts_cache_misses_total')
+        if key in self._inflight:
+            self.registry.inc('mcp_sts_cache_collapsed_total')
+        # shield 防止某个等待方被取消时中断其他等待方共享的上游调用
+        return copy.deepcopy(await asyncio.shield(self._start(key, fetch)))
+
+    def _start(self, key: CacheKey, fetch: CredentialFetcher) -> asyncio.Future:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._load(key, fetch))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return future
+
+    async def _load(self, key: CacheKey, fetch: CredentialFetcher) -> Dict[str, Any]:
+        resp = await fetch()
+        expires_at = parse_expired_time((resp.get('Credentials') or {}).get('ExpiredTime'))
+        if expires_at is None:
+            logger.error("警告：AssumeRole 响应中缺少有效的 ExpiredTime，凭证不会被缓存。")
+            return resp
+        self._entries[key] = (resp, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return resp
+
+    @staticmethod
+    def _log_refresh_error(future: asyncio.Future) -> None:
+        # 后台刷新失败时保留旧凭证直到过期，下次调用会再次尝试刷新
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"警告：后台刷新 STS 凭证失败: {future.exception()}")
+
+    def invalidate(self, key: Optional[CacheKey] = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
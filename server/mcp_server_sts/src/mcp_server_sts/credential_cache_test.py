@@ -0,0 +1,145 @@
+import asyncio
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from mcp_server_sts import extensions
+from mcp_server_sts.credential_cache import StsCredentialCache, credential_key
+from mcp_server_sts.local_tool import LocalContext, credential_identity
+from mcp_server_sts.metrics import Metrics
+
+ROLE = {'RoleTrn': 'trn:iam::2100000000:role/reader', 'RoleSessionName': 'mcp'}
+
+
+def credentials(token: str, ttl: float = 3600) -> dict:
+    return {'Credentials': {'AccessKeyId': 'AKTP', 'SessionToken': token, 'ExpiredTime': time.time() + ttl}}
+
+
+class TestCredentialKey(unittest.TestCase):
+
+    def test_same_ak_with_different_secret_is_a_different_key(self):
+        victim = credential_key(credential_identity('AK', 'secret'), ROLE)
+        attacker = credential_key(credential_identity('AK', 'guess'), ROLE)
+        self.assertNotEqual(victim, attacker)
+        self.assertNotEqual(victim, credential_key(credential_identity('AK', 'secret', 'token'), ROLE))
+        self.assertEqual(victim, credential_key(credential_identity('AK', 'secret'), dict(ROLE)))
+
+    def test_policy_and_duration_are_part_of_the_key(self):
+        identity = credential_identity('AK', 'secret')
+        base = credential_key(identity, ROLE)
+        self.assertNotEqual(base, credential_key(identity, {**ROLE, 'Policy': '{"Statement":[]}'}))
+        self.assertNotEqual(base, credential_key(identity, {**ROLE, 'DurationSeconds': 900}))
+
+
+class TestStsCredentialCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = StsCredentialCache(refresh_margin=300, registry=Metrics())
+        self.calls = 0
+
+    def fetcher(self, ttl: float = 3600, delay: float = 0):
+        async def fetch():
+            self.calls += 1
+            await asyncio.sleep(delay)
+            return credentials(f'token-{self.calls}', ttl)
+        return fetch
+
+    def test_concurrent_misses_share_one_upstream_call(self):
+        key = credential_key('caller', ROLE)
+
+        async def run():
+            return await asyncio.gather(*[self.cache.get(key, self.fetcher(delay=0.01)) for _ in range(5)])
+
+        results = asyncio.run(run())
+        self.assertEqual(self.calls, 1)
+        self.assertEqual({r['Credentials']['SessionToken'] for r in results}, {'token-1'})
+        self.assertEqual(len(self.cache), 1)
+
+    def test_hit_returns_cached_copy(self):
+        key = credential_key('caller', ROLE)
+
+        async def run():
+            first = await self.cache.get(key, self.fetcher())
+            first['Credentials']['SessionToken'] = 'mutated'
+            return await self.cache.get(key, self.fetcher())
+
+        self.assertEqual(asyncio.run(run())['Credentials']['SessionToken'], 'token-1')
+        self.assertEqual(self.calls, 1)
+
+    def test_near_expiry_serves_current_and_refreshes_in_background(self):
+        key = credential_key('caller', ROLE)
+
+        async def run():
+            await self.cache.get(key, self.fetcher(ttl=60))
+            stale = await self.cache.get(key, self.fetcher())
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            fresh = await self.cache.get(key, self.fetcher())
+            return stale, fresh
+
+        stale, fresh = asyncio.run(run())
+        self.assertEqual(stale['Credentials']['SessionToken'], 'token-1')
+        self.assertEqual(fresh['Credentials']['SessionToken'], 'token-2')
+        self.assertEqual(self.calls, 2)
+
+    def test_response_without_expiry_is_not_cached(self):
+        key = credential_key('caller', ROLE)
+
+        async def fetch():
+            self.calls += 1
+            return {'Credentials': {'SessionToken': 'token'}}
+
+        async def run():
+            await self.cache.get(key, fetch)
+            await self.cache.get(key, fetch)
+
+        asyncio.run(run())
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestAssumeRoleIsolation(unittest.TestCase):
+    """AssumeRole 缓存按完整凭证隔离：只知道 AK 不能取走他人缓存的临时凭证"""
+
+    def setUp(self):
+        patch = mock.patch.object(extensions, '_cache', StsCredentialCache(registry=Metrics()))
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.upstream = []
+
+    def assume_role(self, ak: str, sk: str, session_token: str = '') -> dict:
+        async def invoke(action, body):
+            self.upstream.append((ak, sk, action))
+            return credentials(f'{ak}/{sk}')
+
+        context = LocalContext(invoke=invoke, identity=credential_identity(ak, sk, session_token),
+                               data_dir=Path('.'), config=SimpleNamespace(sts_cache=True))
+        return asyncio.run(extensions.assume_role(context, dict(ROLE)))
+
+    def test_same_ak_with_different_secret_misses(self):
+        self.assume_role('AK', 'secret')
+        stolen = self.assume_role('AK', 'guess')
+        self.assertEqual(stolen['Credentials']['SessionToken'], 'AK/guess')
+        self.assertEqual(len(self.upstream), 2)
+
+    def test_same_credentials_hit(self):
+        self.assume_role('AK', 'secret')
+        self.assertEqual(self.assume_role('AK', 'secret')['Credentials']['SessionToken'], 'AK/secret')
+        self.assertEqual(len(self.upstream), 1)
+
+    def test_cache_disabled_always_calls_upstream(self):
+        async def invoke(action, body):
+            self.upstream.append(action)
+            return credentials('token')
+
+        context = LocalContext(invoke=invoke, identity='caller', data_dir=Path('.'),
+                               config=SimpleNamespace(sts_cache=False))
+        asyncio.run(extensions.assume_role(context, dict(ROLE)))
+        asyncio.run(extensions.assume_role(context, dict(ROLE)))
+        self.assertEqual(self.upstream, ['AssumeRole', 'AssumeRole'])
+
+
+if __name__ == "__main__":
+    unittest.main()
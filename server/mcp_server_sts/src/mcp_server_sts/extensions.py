@@ -0,0 +1,27 @@
+from typing import Any, Dict, Optional
+
+from .credential_cache import StsCredentialCache, credential_key
+from .local_tool import ActionInterceptor, LocalContext
+
+ASSUME_ROLE_ACTION = 'AssumeRole'
+
+_cache: Optional[StsCredentialCache] = None
+
+
+def get_cache(context: LocalContext) -> StsCredentialCache:
+    global _cache
+    if _cache is None:
+        _cache = StsCredentialCache(refresh_margin=context.config.sts_refresh_margin)
+    return _cache
+
+
+async def assume_role(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    if context.config is not None and not context.config.sts_cache:
+        return await context.invoke(ASSUME_ROLE_ACTION, arguments)
+    return await get_cache(context).get(credential_key(context.identity, arguments),
+                                        lambda: context.invoke(ASSUME_ROLE_ACTION, dict(arguments)))
+
+
+ACTION_INTERCEPTORS = [
+    ActionInterceptor(action=ASSUME_ROLE_ACTION, handler=assume_role),
+]
@@ -1,3 +1,10 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
 from volcenginesdkcore import UniversalApi, UniversalInfo, ApiClient, Configuration
 
 
@@ -29,6 +36,95 @@ def create_api_client(ak, sk, session_token='', region='cn-beijing', host='open.
     return UniversalApi(ApiClient(config))
 
 
+def parse_expired_time(expired_time) -> Optional[float]:
+    """将 STS 凭证中的 ExpiredTime（ISO8601 字符串或时间戳）转换为时间戳，无法解析时返回 None"""
+    if not expired_time:
+        return None
+    if isinstance(expired_time, (int, float)):
+        return float(expired_time)
+    try:
+        return datetime.fromisoformat(str(expired_time).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+class ApiClientPool:
+    """
+    按凭证复用 UniversalApi 的客户端池（LRU + TTL）
+
+    同一凭证的调用复用同一个 ApiClient 及其 urllib3 连接池，热调用可直接复用 keep-alive 连接。
+    条目在创建超过 ttl 秒或临近 STS 凭证过期（提前 expiry_margin 秒）时失效，超过 max_size 时淘汰最久未使用的条目。
+    """
+
+    def __init__(self, max_size: int = 64, ttl: int = 600, expiry_margin: int = 60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.expiry_margin = expiry_margin
+        self._clients: OrderedDict[Tuple[str, str, str, str], Tuple[UniversalApi, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(ak, sk, session_token, region, host) -> Tuple[str, str, str, str]:
+        # 密钥与 session token 只以哈希形式参与缓存键
+        secret_hash = hashlib.sha256(f'{sk}\0{session_token or ""}'.encode('utf-8')).hexdigest()
+        return ak, secret_hash, region, host
+
+    @staticmethod
+    def _close(client: UniversalApi) -> None:
+        try:
+            client.api_client.rest_client.pool_manager.clear()
+        except Exception:
+            pass
+
+    def _deadline(self, now: float, expired_time) -> float:
+        deadline = now + self.ttl
+        expired_at = parse_expired_time(expired_time)
+        if expired_at is not None:
+            deadline = min(deadline, now + expired_at - time.time() - self.expiry_margin)
+        return deadline
+
+    def get(self, ak, sk, session_token='', region='cn-beijing', host='open.volcengineapi.com',
+            expired_time=None) -> UniversalApi:
+        """获取凭证对应的客户端，未命中或已过期时新建"""
+        key = self._key(ak, sk, session_token, region, host)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._clients.move_to_end(key)
+                    return entry[0]
+                del self._clients[key]
+                self._close(entry[0])
+
+        client = create_api_client(ak=ak, sk=sk, session_token=session_token, region=region, host=host)
+        deadline = self._deadline(now, expired_time)
+        if deadline <= now:
+            # 凭证即将过期，不再缓存
+            return client
+        with self._lock:
+            existing = self._clients.get(key)
+            if existing is not None:
+                # 并发创建时保留先写入的客户端
+                self._clients.move_to_end(key)
+                return existing[0]
+            self._clients[key] = (client, deadline)
+            while len(self._clients) > self.max_size:
+                _, (evicted, _) = self._clients.popitem(last=False)
+                self._close(evicted)
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client, _ in clients:
+            self._close(client)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
 # 使用示例
 if __name__ == "__main__":
     # 创建API客户端
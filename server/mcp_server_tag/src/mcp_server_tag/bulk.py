@@ -0,0 +1,158 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from fastmcp.utilities.logging import configure_logging, get_logger
+from volcenginesdkcore.rest import ApiException
+
+from .validator import ArgumentValidationError
+
+# 定义logger
+logger = get_logger(__name__)
+configure_logging("INFO")
+
+DEFAULT_RATE = 10.0
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RETRIES = 3
+# 限流后的初始退避时间（秒），连续限流时指数增长
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+THROTTLING_CODES = ('Throttling', 'RequestLimitExceeded', 'FlowLimitExceeded', 'TooManyRequests')
+
+T = TypeVar('T')
+
+
+def is_throttled(error: BaseException) -> bool:
+    """上游返回 429 或限流错误码"""
+    if isinstance(error, ApiException):
+        if error.status == 429:
+            return True
+        body = error.body.decode('utf-8', 'ignore') if isinstance(error.body, bytes) else str(error.body or '')
+        return any(code in body for code in THROTTLING_CODES)
+    return False
+
+
+def is_retryable(error: BaseException, idempotent: bool = True) -> bool:
+    """
+    限流、服务端错误、超时与网络错误可重试，参数等客户端错误不重试
+
+    非幂等的写操作只重试限流：服务端错误、超时与网络错误时请求可能已经生效，重试会重复写入。
+    """
+    if not idempotent:
+        return is_throttled(error)
+    if isinstance(error, ApiException):
+        return is_throttled(error) or not error.status or error.status >= 500
+    return not isinstance(error, ArgumentValidationError)
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """限流响应中的 Retry-After（秒）"""
+    headers = getattr(error, 'headers', None) or {}
+    value = dict(headers).get('Retry-After') or dict(headers).get('retry-after')
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """
+    令牌桶限流器
+
+    按 rate 次/秒发放令牌，最多积累 burst 个；任一请求被上游限流时，
+    所有请求暂停到退避结束，退避期间不发放令牌。
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self.throttled = 0
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        self.throttled += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
+
+
+@dataclass
+class ChunkResult:
+    items: List[Any]
+    response: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed: float = field(default=0.0)
+
+
+def chunked(items: Sequence[T], size: int) -> List[List[T]]:
+    return [list(items[i:i + size]) for i in range(0, len(items), size)]
+
+
+async def run_chunks(chunks: Sequence[List[Any]], call: Callable[[List[Any]], Awaitable[Dict[str, Any]]],
+                     limiter: RateLimiter, concurrency: int = DEFAULT_CONCURRENCY,
+                     retries: int = DEFAULT_RETRIES, idempotent: bool = True) -> List[ChunkResult]:
+    """
+    在 concurrency 与限流器限制下并发执行各分块，结果顺序与 chunks 一致
+
+    被限流的分块按 Retry-After（没有时指数退避）暂停所有请求后重试，
+    服务端错误、超时等按指数退避重试，最多重试 retries 次；客户端错误不重试，
+    idempotent 为 False（如 CreateTags）时只重试限流，重试耗尽或不可重试的分块记录最后一次错误。
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(chunk: List[Any]) -> ChunkResult:
+        result = ChunkResult(items=chunk)
+        begin = time.perf_counter()
+        async with semaphore:
+            for attempt in range(retries + 1):
+                await limiter.acquire()
+                result.attempts = attempt + 1
+                try:
+                    result.response = await call(chunk)
+                    result.error = None
+                    break
+                except Exception as e:
+                    body = getattr(e, 'body', None)
+                    result.error = body.decode('utf-8', 'ignore') if isinstance(body, bytes) else str(body or e)
+                    backoff = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** attempt) * (0.5 + random.random() / 2)
+                    if not is_retryable(e, idempotent):
+                        break
+                    if is_throttled(e):
+                        limiter.pause(retry_after(e) or backoff)
+                    elif attempt < retries:
+                        await asyncio.sleep(backoff)
+                    if attempt < retries:
+                        logger.warning(f"警告：分块第 {attempt + 1} 次执行失败，将重试: {result.error}")
+        result.elapsed = time.perf_counter() - begin
+        return result
+
+    return await asyncio.gather(*(run(chunk) for chunk in chunks))
+
+
+def summary(results: Sequence[ChunkResult], limiter: RateLimiter, elapsed: float) -> Dict[str, Any]:
+    return {
+        "Chunks": len(results),
+        "FailedChunks": sum(1 for result in results if result.error is not None),
+        "Requests": sum(result.attempts for result in results),
+        "Throttled": limiter.throttled,
+        "ElapsedMs": round(elapsed * 1000, 2),
+    }
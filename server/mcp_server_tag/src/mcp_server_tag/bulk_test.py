@@ -0,0 +1,58 @@
+import asyncio
+import unittest
+
+from volcenginesdkcore.rest import ApiException
+
+from mcp_server_tag.bulk import RateLimiter, run_chunks
+
+
+def api_error(status: int, body: str = '') -> ApiException:
+    error = ApiException(status=status, reason='error')
+    error.body = body
+    error.headers = {'Retry-After': '0.01'}
+    return error
+
+
+class TestRunChunks(unittest.TestCase):
+
+    def run_chunks(self, errors, idempotent: bool):
+        attempts = []
+
+        async def call(chunk):
+            attempts.append(chunk)
+            if len(attempts) <= len(errors):
+                raise errors[len(attempts) - 1]
+            return {'ok': True}
+
+        results = asyncio.run(run_chunks([['a']], call, RateLimiter(1000), retries=3, idempotent=idempotent))
+        return results[0], len(attempts)
+
+    def test_write_is_not_retried_after_server_error(self):
+        result, attempts = self.run_chunks([api_error(500)], idempotent=False)
+        self.assertEqual(attempts, 1)
+        self.assertIsNotNone(result.error)
+
+    def test_write_is_not_retried_after_network_error(self):
+        result, attempts = self.run_chunks([TimeoutError('timeout')], idempotent=False)
+        self.assertEqual(attempts, 1)
+        self.assertIsNotNone(result.error)
+
+    def test_write_is_retried_after_throttling(self):
+        result, attempts = self.run_chunks([api_error(429), api_error(400, 'Throttling')], idempotent=False)
+        self.assertEqual(attempts, 3)
+        self.assertIsNone(result.error)
+        self.assertEqual(result.response, {'ok': True})
+
+    def test_read_is_retried_after_server_error(self):
+        result, attempts = self.run_chunks([api_error(503), api_error(429)], idempotent=True)
+        self.assertEqual(attempts, 3)
+        self.assertIsNone(result.error)
+
+    def test_client_error_is_not_retried(self):
+        result, attempts = self.run_chunks([api_error(400, 'InvalidParameter')], idempotent=True)
+        self.assertEqual(attempts, 1)
+        self.assertIn('InvalidParameter', result.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
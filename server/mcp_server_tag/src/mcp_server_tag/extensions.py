@@ -0,0 +1,192 @@
+import time
+from typing import Any, Dict, List
+
+from mcp.types import Tool
+
+from .bulk import DEFAULT_CONCURRENCY, DEFAULT_RATE, DEFAULT_RETRIES, RateLimiter, chunked, run_chunks, summary
+from .local_tool import LocalContext, LocalTool
+
+# CreateTags 单次请求的标签数
+CREATE_TAGS_CHUNK = 20
+# GetResources 单次请求的资源 Trn 数
+RESOURCE_TRN_CHUNK = 20
+# GetTagValues 的 TagKeys 最多 20 个
+TAG_KEYS_CHUNK = 20
+READ_MAX_ITEMS = 1_000_000
+
+# 同一账号的批量调用共享限流器
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_limiter(context: LocalContext, arguments: Dict[str, Any]) -> RateLimiter:
+    rate = arguments.get('RateLimit') or DEFAULT_RATE
+    limiter = _limiters.get(context.identity)
+    if limiter is None or limiter.rate != rate:
+        limiter = _limiters[context.identity] = RateLimiter(rate)
+    return limiter
+
+
+async def _run(context: LocalContext, arguments: Dict[str, Any], action: str, chunks: List[List[Any]],
+               build: Any, paginate: bool = False, idempotent: bool = True):
+    limiter = get_limiter(context, arguments)
+    throttled = limiter.throttled
+    begin = time.perf_counter()
+
+    async def call(chunk: List[Any]) -> Dict[str, Any]:
+        body = build(chunk)
+        if paginate:
+            body.update(auto_paginate=True, max_items=READ_MAX_ITEMS)
+        return await context.invoke(action, body)
+
+    results = await run_chunks(chunks, call, limiter, arguments.get('Concurrency') or DEFAULT_CONCURRENCY,
+                               DEFAULT_RETRIES if arguments.get('Retries') is None else arguments['Retries'],
+                               idempotent)
+    stats = summary(results, limiter, time.perf_counter() - begin)
+    stats['Throttled'] = limiter.throttled - throttled
+    return results, stats
+
+
+async def bulk_create_tags(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tags = arguments['Tags']
+    chunk_size = arguments.get('ChunkSize') or CREATE_TAGS_CHUNK
+    results, stats = await _run(context, arguments, 'CreateTags', chunked(tags, chunk_size),
+                                lambda chunk: {'Tags': chunk}, idempotent=False)
+    items = [{"Key": tag.get('Key'), "Value": tag.get('Value'), "Success": result.error is None,
+              "Attempts": result.attempts, **({"Error": result.error} if result.error is not None else {})}
+             for result in results for tag in result.items]
+    return {"Results": items, "Succeeded": sum(1 for item in items if item['Success']),
+            "Failed": sum(1 for item in items if not item['Success']), **stats}
+
+
+async def bulk_get_resources(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    trns = arguments.get('ResourceTrnList') or []
+    filters = {name: arguments[name] for name in ('ResourceTypeFilters', 'TagFilters') if arguments.get(name)}
+    if trns:
+        chunks = chunked(trns, arguments.get('ChunkSize') or RESOURCE_TRN_CHUNK)
+        build = lambda chunk: dict(filters, ResourceTrnList=chunk)
+    else:
+        # 未指定资源时按资源类型并发拉取
+        types = filters.pop('ResourceTypeFilters', None)
+        chunks = [[name] for name in types] if types else [[]]
+        build = lambda chunk: dict(filters, **({'ResourceTypeFilters': chunk} if chunk else {}))
+    results, stats = await _run(context, arguments, 'GetResources', chunks, build, paginate=True)
+    mappings = [mapping for result in results for mapping in (result.response or {}).get('ResourceTagMappingList') or []]
+    response: Dict[str, Any] = {"ResourceTagMappingList": mappings, **stats}
+    if trns:
+        found = {mapping.get('ResourceTrn') for mapping in mappings}
+        errors = {trn: result.error for result in results if result.error is not None for trn in result.items}
+        response["NotFound"] = [trn for trn in trns if trn not in found and trn not in errors]
+    else:
+        errors = {','.join(result.items) or '*': result.error for result in results if result.error is not None}
+    response["Errors"] = errors
+    return response
+
+
+async def bulk_get_tag_keys(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tag_types = arguments.get('TagTypes') or [None]
+    results, stats = await _run(context, arguments, 'GetTagKeys', [[tag_type] for tag_type in tag_types],
+                                lambda chunk: {'TagType': chunk[0]} if chunk[0] else {}, paginate=True)
+    keys = [key for result in results for key in (result.response or {}).get('TagKeys') or []]
+    errors = {result.items[0] or '*': result.error for result in results if result.error is not None}
+    return {"TagKeys": keys, "Errors": errors, **stats}
+
+
+async def bulk_get_tag_values(context: LocalContext, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    tag_keys = list(dict.fromkeys(arguments['TagKeys']))
+    results, stats = await _run(context, arguments, 'GetTagValues', chunked(tag_keys, TAG_KEYS_CHUNK),
+                                lambda chunk: {'TagKeys': chunk}, paginate=True)
+    values: Dict[str, List[str]] = {key: [] for key in tag_keys}
+    errors: Dict[str, str] = {}
+    for result in results:
+        if result.error is not None:
+            errors.update((key, result.error) for key in result.items)
+        for tag in (result.response or {}).get('Tags') or []:
+            values.setdefault(tag.get('Key'), []).append(tag.get('Value'))
+    return {"TagValues": values, "Errors": errors, **stats}
+
+
+_TAG_ITEM = {
+    "type": "object",
+    "properties": {"Key": {"type": "string", "description": "标签键"}, "Value": {"type": "string", "description": "标签值"}},
+    "required": ["Key"],
+}
+_BULK_PROPERTIES = {
+    "Concurrency": {"type": "integer", "minimum": 1, "description": f"并发请求数，默认 {DEFAULT_CONCURRENCY}"},
+    "RateLimit": {"type": "number", "exclusiveMinimum": 0, "description": f"每秒请求数上限，默认 {DEFAULT_RATE:g}"},
+    "Retries": {"type": "integer", "minimum": 0, "description": f"失败分块的重试次数，默认 {DEFAULT_RETRIES}；BulkCreateTags 只重试被限流的分块"},
+}
+
+LOCAL_TOOLS = [
+    LocalTool(
+        tool=Tool(
+            name='BulkCreateTags',
+            description="批量创建预置标签：标签列表不限长度，自动按 CreateTags 单次请求上限分块，"
+                        "在限流器下并发执行，被限流（429）的分块自动退避重试；其他失败可能已部分写入，不自动重试，"
+                        "返回每个标签的执行结果。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "Tags": {"type": "array", "items": _TAG_ITEM, "minItems": 1, "description": "标签列表"},
+                    "ChunkSize": {"type": "integer", "minimum": 1, "description": f"每个请求的标签数，默认 {CREATE_TAGS_CHUNK}"},
+                    **_BULK_PROPERTIES,
+                },
+                "required": ["Tags"],
+            },
+        ),
+        handler=bulk_create_tags,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='BulkGetResources',
+            description="批量查询资源及其绑定的标签：资源 Trn 列表不限长度，自动分块并发查询并翻页合并，"
+                        "返回未找到的资源；不指定资源时按资源类型并发查询全部资源。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "ResourceTrnList": {"type": "array", "items": {"type": "string"}, "description": "资源 Trn 列表"},
+                    "ResourceTypeFilters": {"type": "array", "items": {"type": "string"},
+                                            "description": "资源类型，如 [\"ecs:instance\"]"},
+                    "TagFilters": {"type": "array", "items": {
+                        "type": "object",
+                        "properties": {"Key": {"type": "string"}, "Values": {"type": "array", "items": {"type": "string"}}},
+                    }, "description": "标签过滤条件"},
+                    "ChunkSize": {"type": "integer", "minimum": 1,
+                                  "description": f"每个请求的资源 Trn 数，默认 {RESOURCE_TRN_CHUNK}"},
+                    **_BULK_PROPERTIES,
+                },
+            },
+        ),
+        handler=bulk_get_resources,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='BulkGetTagKeys',
+            description="按标签类型并发拉取全部标签键并翻页合并。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "TagTypes": {"type": "array", "items": {"type": "string"},
+                                 "description": "标签类型，如 [\"custom\", \"system\"]，默认不区分类型"},
+                    **_BULK_PROPERTIES,
+                },
+            },
+        ),
+        handler=bulk_get_tag_keys,
+    ),
+    LocalTool(
+        tool=Tool(
+            name='BulkGetTagValues',
+            description="批量查询标签值：标签键列表不限长度，自动按 GetTagValues 每次 20 个标签键分块并发查询并翻页合并，"
+                        "返回每个标签键的标签值。",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "TagKeys": {"type": "array", "items": {"type": "string"}, "minItems": 1, "description": "标签键列表"},
+                    **_BULK_PROPERTIES,
+                },
+                "required": ["TagKeys"],
+            },
+        ),
+        handler=bulk_get_tag_values,
+    ),
+]
@@ -0,0 +1,112 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+class TokenStore:
+    """OAuth 访问令牌存储接口"""
+
+    def get(self, token: str) -> Optional[str]:
+        """返回未过期令牌对应的值，不存在或已过期时返回 None"""
+        raise NotImplementedError
+
+    def set(self, token: str, value: str, expires_in: Optional[int] = None) -> None:
+        """保存令牌，expires_in 为空或非正数时使用默认有效期"""
+        raise NotImplementedError
+
+    def delete(self, token: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryTokenStore(TokenStore):
+    """进程内令牌存储：按 expires_in 过期，超过 max_size 时淘汰最久未使用的令牌"""
+
+    def __init__(self, max_size: int = 10000, default_ttl: int = 86400):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._tokens: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[str]:
+        with self._lock:
+            entry = self._tokens.get(token)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._tokens[token]
+                return None
+            self._tokens.move_to_end(token)
+            return entry[0]
+
+    def set(self, token: str, value: str, expires_in: Optional[int] = None) -> None:
+        ttl = expires_in if expires_in and expires_in > 0 else self.default_ttl
+        with self._lock:
+            self._tokens[token] = (value, time.time() + ttl)
+            self._tokens.move_to_end(token)
+            while len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+
+    def delete(self, token: str) -> None:
+        with self._lock:
+            self._tokens.pop(token, None)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+class SqliteTokenStore(TokenStore):
+    """
+    基于 SQLite 文件的令牌存储，同一主机上的多个 uvicorn worker 共享已校验的令牌
+
+    令牌以 sha256 摘要作为主键保存，查询为主键查找；写入时顺带清理已过期的令牌。
+    """
+
+    def __init__(self, path: Union[str, Path], max_size: int = 10000, default_ttl: int = 86400):
+        self.path = str(path)
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS oauth_tokens ('
+                           'token_hash TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                           'expires_at REAL NOT NULL, updated_at REAL NOT NULL)')
+
+    @staticmethod
+    def _hash(token: str) -> str:
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    def get(self, token: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM oauth_tokens WHERE token_hash = ? AND expires_at > ?',
+                                     (self._hash(token), time.time())).fetchone()
+        return row[0] if row else None
+
+    def set(self, token: str, value: str, expires_in: Optional[int] = None) -> None:
+        ttl = expires_in if expires_in and expires_in > 0 else self.default_ttl
+        now = time.time()
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO oauth_tokens VALUES (?, ?, ?, ?)',
+                               (self._hash(token), value, now + ttl, now))
+            self._conn.execute('DELETE FROM oauth_tokens WHERE expires_at <= ?', (now,))
+            self._conn.execute('DELETE FROM oauth_tokens WHERE token_hash IN ('
+                               'SELECT token_hash FROM oauth_tokens ORDER BY updated_at DESC LIMIT -1 OFFSET ?)',
+                               (self.max_size,))
+
+    def delete(self, token: str) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM oauth_tokens WHERE token_hash = ?', (self._hash(token),))
+
+
+def create_token_store(backend: str = 'memory', path: Optional[str] = None, max_size: int = 10000,
+                       default_ttl: int = 86400) -> TokenStore:
+    if backend == 'sqlite':
+        if not path:
+            raise ValueError("token_store_path must be set when token_store is sqlite")
+        return SqliteTokenStore(path, max_size=max_size, default_ttl=default_ttl)
+    return MemoryTokenStore(max_size=max_size, default_ttl=default_ttl)
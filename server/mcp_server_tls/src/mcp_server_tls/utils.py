@@ -1,6 +1,4 @@
 import base64
-import hashlib
-import hmac
 import json
 import logging
 import os
@@ -8,36 +6,11 @@ from mcp.server.session import ServerSession
 from mcp.server.fastmcp import Context
 from starlette.requests import Request
 
-from urllib.parse import quote
-
 from mcp_server_tls.config import TLS_CONFIG
 from mcp_server_tls.consts import *
 
 logger = logging.getLogger(__name__)
 
-def norm_query(params):
-    query = ""
-    for key in sorted(params.keys()):
-        if type(params[key]) == list:
-            for k in params[key]:
-                query = (
-                        query + quote(key, safe="-_.~") + "=" + quote(k, safe="-_.~") + "&"
-                )
-        else:
-            query = (query + quote(key, safe="-_.~") + "=" + quote(params[key], safe="-_.~") + "&")
-    query = query[:-1]
-    return query.replace("+", "%20")
-
-def hmac_sha256(key: bytes, content: str):
-    """sha256 非对称加密
-    """
-    return hmac.new(key, content.encode("utf-8"), hashlib.sha256).digest()
-
-def hash_sha256(content: str):
-    """sha256 hash算法
-    """
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
-
 def get_context_from_tools(ctx: Context[ServerSession, object, any]) -> dict:
     """get context in tool, this function should be called in tool
     """
@@ -1,8 +1,8 @@
 # coding:utf-8
-from vcloud.base.base_trait import BaseTrait  # Modify it if necessary
+from vcloud.base.async_trait import AsyncBaseTrait  # Modify it if necessary
 
 
-class BaseService(BaseTrait):
+class BaseService(AsyncBaseTrait):
     def __init__(self, region='cn-north-1', ak=None, sk=None, service_info_map=None,):
         super().__init__({
             'ak': ak,
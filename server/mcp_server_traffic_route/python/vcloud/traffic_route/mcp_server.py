@@ -11,6 +11,8 @@ def create_mcp_server():
         "TrafficRoute MCP",
         instructions="The DNS routing service that allows users to configure DNS routing rules to ensure that requests from clients reach the desired service nodes.",
     )
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    service.offload_sync_tools(mcp)
 
     @mcp.tool()
     def guide():
@@ -0,0 +1,129 @@
+"""
+工具注册范围
+
+工具按资源分组，启动时根据环境变量只注册选中的工具，未注册的工具不会出现在 list_tools 的结果中。
+
+环境变量：
+- MCP_TR_PROFILE: all 注册全部工具（默认）；readonly 只注册 describe_* 查询类工具
+- MCP_TR_TOOLS: 逗号分隔的分组名或工具名，为空时不限制；与 MCP_TR_PROFILE 同时设置时取交集
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+PROFILES = ("all", "readonly")
+
+TOOL_GROUPS: Dict[str, List[str]] = {
+    "router": [
+        "create_transit_router",
+        "describe_transit_routers",
+        "describe_transit_router_regions",
+    ],
+    "attachment": [
+        "describe_transit_router_attachments",
+        "create_transit_router_vpc_attachment",
+        "describe_transit_router_vpc_attachments",
+        "create_transit_router_vpn_attachment",
+        "describe_transit_router_vpn_attachments",
+        "create_transit_router_direct_connect_gateway_attachment",
+        "describe_transit_router_direct_connect_gateway_attachments",
+        "create_transit_router_peer_attachment",
+        "describe_transit_router_peer_attachments",
+    ],
+    "route_table": [
+        "create_transit_router_route_table",
+        "describe_transit_router_route_tables",
+        "create_transit_router_route_entry",
+        "describe_transit_router_route_entries",
+        "associate_transit_router_attachment_to_route_table",
+        "describe_transit_router_route_table_associations",
+        "enable_transit_router_route_table_propagation",
+        "describe_transit_router_route_table_propagations",
+    ],
+    "route_policy": [
+        "create_transit_router_route_policy_table",
+        "associate_transit_router_route_policy_to_route_table",
+        "describe_transit_router_route_policy_tables",
+        "create_transit_router_route_policy_entry",
+        "describe_transit_router_route_policy_entries",
+    ],
+    "forward_policy": [
+        "create_transit_router_forward_policy_table",
+        "describe_transit_router_forward_policy_tables",
+        "associate_transit_router_forward_policy_table_to_attachment",
+        "create_transit_router_forward_policy_entry",
+        "describe_transit_router_forward_policy_entries",
+    ],
+    "flow_log": [
+        "create_transit_router_flow_log",
+        "start_transit_router_flow_log",
+        "stop_transit_router_flow_log",
+        "describe_transit_router_flow_logs",
+    ],
+    "qos": [
+        "create_transit_router_traffic_qos_marking_policy",
+        "associate_transit_router_traffic_qos_marking_policy_to_attachment",
+        "describe_transit_router_traffic_qos_marking_policies",
+        "create_transit_router_traffic_qos_marking_entry",
+        "describe_transit_router_traffic_qos_marking_entries",
+        "create_transit_router_traffic_qos_queue_policy",
+        "associate_transit_router_traffic_qos_queue_policy_to_attachment",
+        "describe_transit_router_traffic_qos_queue_policies",
+        "create_transit_router_traffic_qos_queue_entry",
+        "describe_transit_router_traffic_qos_queue_entries",
+    ],
+    "multicast": [
+        "create_transit_router_multicast_domain",
+        "describe_transit_router_multicast_domains",
+        "associate_transit_router_multicast_domain",
+        "describe_transit_router_multicast_domain_associations",
+        "create_transit_router_multicast_group_member",
+        "create_transit_router_multicast_group_source",
+        "describe_transit_router_multicast_groups",
+    ],
+    "bandwidth_package": [
+        "create_transit_router_bandwidth_package",
+        "renew_transit_router_bandwidth_package",
+        "set_transit_router_bandwidth_package_renewal",
+        "describe_transit_router_bandwidth_packages",
+        "describe_transit_router_bandwidth_packages_billing",
+    ],
+}
+
+ALL_TOOLS = {name for names in TOOL_GROUPS.values() for name in names}
+
+
+def load_enabled_tools() -> Optional[Set[str]]:
+    """
+    解析 MCP_TR_PROFILE 与 MCP_TR_TOOLS，返回需要注册的工具名集合，None 表示全部注册。
+
+    Raises:
+    ValueError: 取值不是已知的 profile、分组名或工具名。
+    """
+    profile = os.getenv("MCP_TR_PROFILE", "all").strip().lower() or "all"
+    if profile not in PROFILES:
+        raise ValueError(f"Invalid MCP_TR_PROFILE: {profile}, expected one of {', '.join(PROFILES)}")
+    selected = [item.strip() for item in os.getenv("MCP_TR_TOOLS", "").split(",") if item.strip()]
+    if profile == "all" and not selected:
+        return None
+
+    enabled = set(ALL_TOOLS)
+    if selected:
+        unknown = [item for item in selected if item not in TOOL_GROUPS and item not in ALL_TOOLS]
+        if unknown:
+            raise ValueError(f"Unknown tool groups or tools in MCP_TR_TOOLS: {', '.join(unknown)}")
+        enabled = {name for item in selected for name in TOOL_GROUPS.get(item, [item])}
+    if profile == "readonly":
+        enabled = {name for name in enabled if name.startswith("describe_")}
+    logger.info(f"Registering {len(enabled)} of {len(ALL_TOOLS)} TR tools")
+    return enabled
+
+
+ENABLED_TOOLS = load_enabled_tools()
+
+
+def is_enabled(name: str) -> bool:
+    return ENABLED_TOOLS is None or name in ENABLED_TOOLS
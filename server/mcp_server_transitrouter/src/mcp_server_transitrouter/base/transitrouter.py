@@ -1,243 +1,247 @@
-import volcenginesdkcore
+import importlib
+import threading
+from typing import TYPE_CHECKING
 
 from mcp_server_transitrouter.base.config import TR_CONFIG
-from volcenginesdktransitrouter.api.transitrouter_api import TRANSITROUTERApi
-
-from volcenginesdktransitrouter.models import \
-    CreateTransitRouterRequest, CreateTransitRouterResponse, \
-    DescribeTransitRoutersRequest, DescribeTransitRoutersResponse, \
-    DescribeTransitRouterAttachmentsRequest, DescribeTransitRouterAttachmentsResponse, \
-    CreateTransitRouterVpcAttachmentRequest, CreateTransitRouterVpcAttachmentResponse, \
-    DescribeTransitRouterVpcAttachmentsRequest, DescribeTransitRouterVpcAttachmentsResponse, \
-    CreateTransitRouterVpnAttachmentRequest, CreateTransitRouterVpnAttachmentResponse, \
-    DescribeTransitRouterVpnAttachmentsRequest, DescribeTransitRouterVpnAttachmentsResponse, \
-    CreateTransitRouterDirectConnectGatewayAttachmentRequest, CreateTransitRouterDirectConnectGatewayAttachmentResponse, \
-    DescribeTransitRouterDirectConnectGatewayAttachmentsRequest, DescribeTransitRouterDirectConnectGatewayAttachmentsResponse, \
-    CreateTransitRouterPeerAttachmentRequest, CreateTransitRouterPeerAttachmentResponse, \
-    DescribeTransitRouterPeerAttachmentsRequest, DescribeTransitRouterPeerAttachmentsResponse, \
-    CreateTransitRouterRouteTableRequest, CreateTransitRouterRouteTableResponse, \
-    DescribeTransitRouterRouteTablesRequest, DescribeTransitRouterRouteTablesResponse, \
-    CreateTransitRouterRouteEntryRequest, CreateTransitRouterRouteEntryResponse, \
-    DescribeTransitRouterRouteEntriesRequest, DescribeTransitRouterRouteEntriesResponse, \
-    AssociateTransitRouterAttachmentToRouteTableRequest, AssociateTransitRouterAttachmentToRouteTableResponse, \
-    DescribeTransitRouterRouteTableAssociationsRequest, DescribeTransitRouterRouteTableAssociationsResponse, \
-    EnableTransitRouterRouteTablePropagationRequest, EnableTransitRouterRouteTablePropagationResponse, \
-    DescribeTransitRouterRouteTablePropagationsRequest, DescribeTransitRouterRouteTablePropagationsResponse, \
-    CreateTransitRouterRoutePolicyTableRequest, CreateTransitRouterRoutePolicyTableResponse, \
-    AssociateTransitRouterRoutePolicyToRouteTableRequest, AssociateTransitRouterRoutePolicyToRouteTableResponse, \
-    DescribeTransitRouterRoutePolicyTablesRequest, DescribeTransitRouterRoutePolicyTablesResponse, \
-    CreateTransitRouterRoutePolicyEntryRequest, CreateTransitRouterRoutePolicyEntryResponse, \
-    DescribeTransitRouterRoutePolicyEntriesRequest, DescribeTransitRouterRoutePolicyEntriesResponse, \
-    CreateTransitRouterForwardPolicyTableRequest, CreateTransitRouterForwardPolicyTableResponse, \
-    AssociateTransitRouterForwardPolicyTableToAttachmentRequest, AssociateTransitRouterForwardPolicyTableToAttachmentResponse, \
-    DescribeTransitRouterForwardPolicyTablesRequest, DescribeTransitRouterForwardPolicyTablesResponse, \
-    CreateTransitRouterForwardPolicyEntryRequest, CreateTransitRouterForwardPolicyEntryResponse, \
-    DescribeTransitRouterForwardPolicyEntriesRequest, DescribeTransitRouterForwardPolicyEntriesResponse, \
-    CreateTransitRouterFlowLogRequest, CreateTransitRouterFlowLogResponse, \
-    StartTransitRouterFlowLogRequest, StartTransitRouterFlowLogResponse, \
-    StopTransitRouterFlowLogRequest, StopTransitRouterFlowLogResponse, \
-    DescribeTransitRouterFlowLogsRequest, DescribeTransitRouterFlowLogsResponse, \
-    CreateTransitRouterTrafficQosMarkingPolicyRequest, CreateTransitRouterTrafficQosMarkingPolicyResponse, \
-    AssociateTransitRouterTrafficQosMarkingPolicyToAttachmentRequest, AssociateTransitRouterTrafficQosMarkingPolicyToAttachmentResponse, \
-    DescribeTransitRouterTrafficQosMarkingPoliciesRequest, DescribeTransitRouterTrafficQosMarkingPoliciesResponse, \
-    CreateTransitRouterTrafficQosMarkingEntryRequest, CreateTransitRouterTrafficQosMarkingEntryResponse, \
-    DescribeTransitRouterTrafficQosMarkingEntriesRequest, DescribeTransitRouterTrafficQosMarkingEntriesResponse, \
-    CreateTransitRouterTrafficQosQueuePolicyRequest, CreateTransitRouterTrafficQosQueuePolicyResponse, \
-    AssociateTransitRouterTrafficQosQueuePolicyToAttachmentRequest, AssociateTransitRouterTrafficQosQueuePolicyToAttachmentResponse, \
-    DescribeTransitRouterTrafficQosQueuePoliciesRequest, DescribeTransitRouterTrafficQosQueuePoliciesResponse, \
-    CreateTransitRouterTrafficQosQueueEntryRequest, CreateTransitRouterTrafficQosQueueEntryResponse, \
-    DescribeTransitRouterTrafficQosQueueEntriesRequest, DescribeTransitRouterTrafficQosQueueEntriesResponse, \
-    CreateTransitRouterMulticastDomainRequest, CreateTransitRouterMulticastDomainResponse, \
-    DescribeTransitRouterMulticastDomainsRequest, DescribeTransitRouterMulticastDomainsResponse, \
-    AssociateTransitRouterMulticastDomainRequest, AssociateTransitRouterMulticastDomainResponse, \
-    DescribeTransitRouterMulticastDomainAssociationsRequest, DescribeTransitRouterMulticastDomainAssociationsResponse, \
-    CreateTransitRouterMulticastGroupMemberRequest, CreateTransitRouterMulticastGroupMemberResponse, \
-    CreateTransitRouterMulticastGroupSourceRequest, CreateTransitRouterMulticastGroupSourceResponse, \
-    DescribeTransitRouterMulticastGroupsRequest, DescribeTransitRouterMulticastGroupsResponse, \
-    DescribeTransitRouterRegionsRequest, DescribeTransitRouterRegionsResponse, \
-    CreateTransitRouterBandwidthPackageRequest, CreateTransitRouterBandwidthPackageResponse, \
-    RenewTransitRouterBandwidthPackageRequest, RenewTransitRouterBandwidthPackageResponse, \
-    SetTransitRouterBandwidthPackageRenewalRequest, SetTransitRouterBandwidthPackageRenewalResponse, \
-    DescribeTransitRouterBandwidthPackagesRequest, DescribeTransitRouterBandwidthPackagesResponse, \
-    DescribeTransitRouterBandwidthPackagesBillingRequest, DescribeTransitRouterBandwidthPackagesBillingResponse
+
+if TYPE_CHECKING:
+    from volcenginesdktransitrouter.models import \
+        CreateTransitRouterResponse, DescribeTransitRoutersResponse, \
+        DescribeTransitRouterAttachmentsResponse, CreateTransitRouterVpcAttachmentResponse, \
+        DescribeTransitRouterVpcAttachmentsResponse, CreateTransitRouterVpnAttachmentResponse, \
+        DescribeTransitRouterVpnAttachmentsResponse, CreateTransitRouterDirectConnectGatewayAttachmentResponse, \
+        DescribeTransitRouterDirectConnectGatewayAttachmentsResponse, CreateTransitRouterPeerAttachmentResponse, \
+        DescribeTransitRouterPeerAttachmentsResponse, CreateTransitRouterRouteTableResponse, \
+        DescribeTransitRouterRouteTablesResponse, CreateTransitRouterRouteEntryResponse, \
+        DescribeTransitRouterRouteEntriesResponse, AssociateTransitRouterAttachmentToRouteTableResponse, \
+        DescribeTransitRouterRouteTableAssociationsResponse, EnableTransitRouterRouteTablePropagationResponse, \
+        DescribeTransitRouterRouteTablePropagationsResponse, CreateTransitRouterRoutePolicyTableResponse, \
+        AssociateTransitRouterRoutePolicyToRouteTableResponse, DescribeTransitRouterRoutePolicyTablesResponse, \
+        CreateTransitRouterRoutePolicyEntryResponse, DescribeTransitRouterRoutePolicyEntriesResponse, \
+        CreateTransitRouterForwardPolicyTableResponse, AssociateTransitRouterForwardPolicyTableToAttachmentResponse, \
+        DescribeTransitRouterForwardPolicyTablesResponse, CreateTransitRouterForwardPolicyEntryResponse, \
+        DescribeTransitRouterForwardPolicyEntriesResponse, CreateTransitRouterFlowLogResponse, \
+        StartTransitRouterFlowLogResponse, StopTransitRouterFlowLogResponse, \
+        DescribeTransitRouterFlowLogsResponse, CreateTransitRouterTrafficQosMarkingPolicyResponse, \
+        AssociateTransitRouterTrafficQosMarkingPolicyToAttachmentResponse, DescribeTransitRouterTrafficQosMarkingPoliciesResponse, \
+        CreateTransitRouterTrafficQosMarkingEntryResponse, DescribeTransitRouterTrafficQosMarkingEntriesResponse, \
+        CreateTransitRouterTrafficQosQueuePolicyResponse, AssociateTransitRouterTrafficQosQueuePolicyToAttachmentResponse, \
+        DescribeTransitRouterTrafficQosQueuePoliciesResponse, CreateTransitRouterTrafficQosQueueEntryResponse, \
+        DescribeTransitRouterTrafficQosQueueEntriesResponse, CreateTransitRouterMulticastDomainResponse, \
+        DescribeTransitRouterMulticastDomainsResponse, AssociateTransitRouterMulticastDomainResponse, \
+        DescribeTransitRouterMulticastDomainAssociationsResponse, CreateTransitRouterMulticastGroupMemberResponse, \
+        CreateTransitRouterMulticastGroupSourceResponse, DescribeTransitRouterMulticastGroupsResponse, \
+        DescribeTransitRouterRegionsResponse, CreateTransitRouterBandwidthPackageResponse, \
+        RenewTransitRouterBandwidthPackageResponse, SetTransitRouterBandwidthPackageRenewalResponse, \
+        DescribeTransitRouterBandwidthPackagesResponse, DescribeTransitRouterBandwidthPackagesBillingResponse
+
+
+class _LazyModels:
+    """
+    按需解析 volcenginesdktransitrouter.models 中的请求类
+
+    导入 volcenginesdktransitrouter 会一次性加载包内全部模型类，这里推迟到第一次调用工具时才导入，解析出的类缓存在实例属性上。
+    """
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        model = getattr(importlib.import_module("volcenginesdktransitrouter.models"), name)
+        setattr(self, name, model)
+        return model
+
+
+models = _LazyModels()
 
 
 class TRSDK:
-    """初始化 Volc TR SDK client"""
+    """初始化 Volc TR SDK client，client 在第一次调用接口时创建"""
 
     def __init__(self):
-        configuration = volcenginesdkcore.Configuration()
-        configuration.ak = TR_CONFIG.access_key
-        configuration.sk = TR_CONFIG.secret_key
-        configuration.region = TR_CONFIG.region
-        if TR_CONFIG.host is not None:
-            configuration.host = TR_CONFIG.host
-        self.client = TRANSITROUTERApi(volcenginesdkcore.ApiClient(configuration))
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import volcenginesdkcore
+                    from volcenginesdktransitrouter.api.transitrouter_api import TRANSITROUTERApi
+
+                    configuration = volcenginesdkcore.Configuration()
+                    configuration.ak = TR_CONFIG.access_key
+                    configuration.sk = TR_CONFIG.secret_key
+                    configuration.region = TR_CONFIG.region
+                    if TR_CONFIG.host is not None:
+                        configuration.host = TR_CONFIG.host
+                    self._client = TRANSITROUTERApi(volcenginesdkcore.ApiClient(configuration))
+        return self._client
 
-    def create_transit_router(self, args: dict) -> CreateTransitRouterResponse:
-        return self.client.create_transit_router(CreateTransitRouterRequest(**args))
+    def create_transit_router(self, args: dict) -> "CreateTransitRouterResponse":
+        return self.client.create_transit_router(models.CreateTransitRouterRequest(**args))
 
-    def describe_transit_routers(self, args: dict) -> DescribeTransitRoutersResponse:
-        return self.client.describe_transit_routers(DescribeTransitRoutersRequest(**args))
+    def describe_transit_routers(self, args: dict) -> "DescribeTransitRoutersResponse":
+        return self.client.describe_transit_routers(models.DescribeTransitRoutersRequest(**args))
 
-    def describe_transit_router_attachments(self, args: dict) -> DescribeTransitRouterAttachmentsResponse:
-        return self.client.describe_transit_router_attachments(DescribeTransitRouterAttachmentsRequest(**args))
+    def describe_transit_router_attachments(self, args: dict) -> "DescribeTransitRouterAttachmentsResponse":
+        return self.client.describe_transit_router_attachments(models.DescribeTransitRouterAttachmentsRequest(**args))
 
-    def create_transit_router_vpc_attachment(self, args: dict) -> CreateTransitRouterVpcAttachmentResponse:
-        return self.client.create_transit_router_vpc_attachment(CreateTransitRouterVpcAttachmentRequest(**args))
+    def create_transit_router_vpc_attachment(self, args: dict) -> "CreateTransitRouterVpcAttachmentResponse":
+        return self.client.create_transit_router_vpc_attachment(models.CreateTransitRouterVpcAttachmentRequest(**args))
 
-    def describe_transit_router_vpc_attachments(self, args: dict) -> DescribeTransitRouterVpcAttachmentsResponse:
-        return self.client.describe_transit_router_vpc_attachments(DescribeTransitRouterVpcAttachmentsRequest(**args))
+    def describe_transit_router_vpc_attachments(self, args: dict) -> "DescribeTransitRouterVpcAttachmentsResponse":
+        return self.client.describe_transit_router_vpc_attachments(models.DescribeTransitRouterVpcAttachmentsRequest(**args))
 
-    def create_transit_router_vpn_attachment(self, args: dict) -> CreateTransitRouterVpnAttachmentResponse:
-        return self.client.create_transit_router_vpn_attachment(CreateTransitRouterVpnAttachmentRequest(**args))
+    def create_transit_router_vpn_attachment(self, args: dict) -> "CreateTransitRouterVpnAttachmentResponse":
+        return self.client.create_transit_router_vpn_attachment(models.CreateTransitRouterVpnAttachmentRequest(**args))
 
-    def describe_transit_router_vpn_attachments(self, args: dict) -> DescribeTransitRouterVpnAttachmentsResponse:
-        return self.client.describe_transit_router_vpn_attachments(DescribeTransitRouterVpnAttachmentsRequest(**args))
+    def describe_transit_router_vpn_attachments(self, args: dict) -> "DescribeTransitRouterVpnAttachmentsResponse":
+        return self.client.describe_transit_router_vpn_attachments(models.DescribeTransitRouterVpnAttachmentsRequest(**args))
 
-    def create_transit_router_direct_connect_gateway_attachment(self, args: dict) -> CreateTransitRouterDirectConnectGatewayAttachmentResponse:
-        return self.client.create_transit_router_direct_connect_gateway_attachment(CreateTransitRouterDirectConnectGatewayAttachmentRequest(**args))
+    def create_transit_router_direct_connect_gateway_attachment(self, args: dict) -> "CreateTransitRouterDirectConnectGatewayAttachmentResponse":
+        return self.client.create_transit_router_direct_connect_gateway_attachment(models.CreateTransitRouterDirectConnectGatewayAttachmentRequest(**args))
 
-    def describe_transit_router_direct_connect_gateway_attachments(self, args: dict) -> DescribeTransitRouterDirectConnectGatewayAttachmentsResponse:
-        return self.client.describe_transit_router_direct_connect_gateway_attachments(DescribeTransitRouterDirectConnectGatewayAttachmentsRequest(**args))
+    def describe_transit_router_direct_connect_gateway_attachments(self, args: dict) -> "DescribeTransitRouterDirectConnectGatewayAttachmentsResponse":
+        return self.client.describe_transit_router_direct_connect_gateway_attachments(models.DescribeTransitRouterDirectConnectGatewayAttachmentsRequest(**args))
 
-    def create_transit_router_peer_attachment(self, args: dict) -> CreateTransitRouterPeerAttachmentResponse:
-        return self.client.create_transit_router_peer_attachment(CreateTransitRouterPeerAttachmentRequest(**args))
+    def create_transit_router_peer_attachment(self, args: dict) -> "CreateTransitRouterPeerAttachmentResponse":
+        return self.client.create_transit_router_peer_attachment(models.CreateTransitRouterPeerAttachmentRequest(**args))
 
-    def describe_transit_router_peer_attachments(self, args: dict) -> DescribeTransitRouterPeerAttachmentsResponse:
-        return self.client.describe_transit_router_peer_attachments(DescribeTransitRouterPeerAttachmentsRequest(**args))
+    def describe_transit_router_peer_attachments(self, args: dict) -> "DescribeTransitRouterPeerAttachmentsResponse":
+        return self.client.describe_transit_router_peer_attachments(models.DescribeTransitRouterPeerAttachmentsRequest(**args))
 
-    def create_transit_router_route_table(self, args: dict) -> CreateTransitRouterRouteTableResponse:
-        return self.client.create_transit_router_route_table(CreateTransitRouterRouteTableRequest(**args))
+    def create_transit_router_route_table(self, args: dict) -> "CreateTransitRouterRouteTableResponse":
+        return self.client.create_transit_router_route_table(models.CreateTransitRouterRouteTableRequest(**args))
 
-    def describe_transit_router_route_tables(self, args: dict) -> DescribeTransitRouterRouteTablesResponse:
-        return self.client.describe_transit_router_route_tables(DescribeTransitRouterRouteTablesRequest(**args))
+    def describe_transit_router_route_tables(self, args: dict) -> "DescribeTransitRouterRouteTablesResponse":
+        return self.client.describe_transit_router_route_tables(models.DescribeTransitRouterRouteTablesRequest(**args))
 
-    def create_transit_router_route_entry(self, args: dict) -> CreateTransitRouterRouteEntryResponse:
-        return self.client.create_transit_router_route_entry(CreateTransitRouterRouteEntryRequest(**args))
+    def create_transit_router_route_entry(self, args: dict) -> "CreateTransitRouterRouteEntryResponse":
+        return self.client.create_transit_router_route_entry(models.CreateTransitRouterRouteEntryRequest(**args))
 
-    def describe_transit_router_route_entries(self, args: dict) -> DescribeTransitRouterRouteEntriesResponse:
-        return self.client.describe_transit_router_route_entries(DescribeTransitRouterRouteEntriesRequest(**args))
+    def describe_transit_router_route_entries(self, args: dict) -> "DescribeTransitRouterRouteEntriesResponse":
+        return self.client.describe_transit_router_route_entries(models.DescribeTransitRouterRouteEntriesRequest(**args))
 
-    def associate_transit_router_attachment_to_route_table(self, args: dict) -> AssociateTransitRouterAttachmentToRouteTableResponse:
-        return self.client.associate_transit_router_attachment_to_route_table(AssociateTransitRouterAttachmentToRouteTableRequest(**args))
+    def associate_transit_router_attachment_to_route_table(self, args: dict) -> "AssociateTransitRouterAttachmentToRouteTableResponse":
+        return self.client.associate_transit_router_attachment_to_route_table(models.AssociateTransitRouterAttachmentToRouteTableRequest(**args))
 
-    def describe_transit_router_route_table_associations(self, args: dict) -> DescribeTransitRouterRouteTableAssociationsResponse:
-        return self.client.describe_transit_router_route_table_associations(DescribeTransitRouterRouteTableAssociationsRequest(**args))
+    def describe_transit_router_route_table_associations(self, args: dict) -> "DescribeTransitRouterRouteTableAssociationsResponse":
+        return self.client.describe_transit_router_route_table_associations(models.DescribeTransitRouterRouteTableAssociationsRequest(**args))
 
-    def enable_transit_router_route_table_propagation(self, args: dict) -> EnableTransitRouterRouteTablePropagationResponse:
-        return self.client.enable_transit_router_route_table_propagation(EnableTransitRouterRouteTablePropagationRequest(**args))
+    def enable_transit_router_route_table_propagation(self, args: dict) -> "EnableTransitRouterRouteTablePropagationResponse":
+        return self.client.enable_transit_router_route_table_propagation(models.EnableTransitRouterRouteTablePropagationRequest(**args))
 
-    def describe_transit_router_route_table_propagations(self, args: dict) -> DescribeTransitRouterRouteTablePropagationsResponse:
-        return self.client.describe_transit_router_route_table_propagations(DescribeTransitRouterRouteTablePropagationsRequest(**args))
+    def describe_transit_router_route_table_propagations(self, args: dict) -> "DescribeTransitRouterRouteTablePropagationsResponse":
+        return self.client.describe_transit_router_route_table_propagations(models.DescribeTransitRouterRouteTablePropagationsRequest(**args))
 
-    def create_transit_router_route_policy_table(self, args: dict) -> CreateTransitRouterRoutePolicyTableResponse:
-        return self.client.create_transit_router_route_policy_table(CreateTransitRouterRoutePolicyTableRequest(**args))
+    def create_transit_router_route_policy_table(self, args: dict) -> "CreateTransitRouterRoutePolicyTableResponse":
+        return self.client.create_transit_router_route_policy_table(models.CreateTransitRouterRoutePolicyTableRequest(**args))
 
-    def associate_transit_router_route_policy_to_route_table(self, args: dict) -> AssociateTransitRouterRoutePolicyToRouteTableResponse:
-        return self.client.associate_transit_router_route_policy_to_route_table(AssociateTransitRouterRoutePolicyToRouteTableRequest(**args))
+    def associate_transit_router_route_policy_to_route_table(self, args: dict) -> "AssociateTransitRouterRoutePolicyToRouteTableResponse":
+        return self.client.associate_transit_router_route_policy_to_route_table(models.AssociateTransitRouterRoutePolicyToRouteTableRequest(**args))
 
-    def describe_transit_router_route_policy_tables(self, args: dict) -> DescribeTransitRouterRoutePolicyTablesResponse:
-        return self.client.describe_transit_router_route_policy_tables(DescribeTransitRouterRoutePolicyTablesRequest(**args))
+    def describe_transit_router_route_policy_tables(self, args: dict) -> "DescribeTransitRouterRoutePolicyTablesResponse":
+        return self.client.describe_transit_router_route_policy_tables(models.DescribeTransitRouterRoutePolicyTablesRequest(**args))
 
-    def create_transit_router_route_policy_entry(self, args: dict) -> CreateTransitRouterRoutePolicyEntryResponse:
-        return self.client.create_transit_router_route_policy_entry(CreateTransitRouterRoutePolicyEntryRequest(**args))
+    def create_transit_router_route_policy_entry(self, args: dict) -> "CreateTransitRouterRoutePolicyEntryResponse":
+        return self.client.create_transit_router_route_policy_entry(models.CreateTransitRouterRoutePolicyEntryRequest(**args))
 
-    def describe_transit_router_route_policy_entries(self, args: dict) -> DescribeTransitRouterRoutePolicyEntriesResponse:
-        return self.client.describe_transit_router_route_policy_entries(DescribeTransitRouterRoutePolicyEntriesRequest(**args))
+    def describe_transit_router_route_policy_entries(self, args: dict) -> "DescribeTransitRouterRoutePolicyEntriesResponse":
+        return self.client.describe_transit_router_route_policy_entries(models.DescribeTransitRouterRoutePolicyEntriesRequest(**args))
 
-    def create_transit_router_forward_policy_table(self, args: dict) -> CreateTransitRouterForwardPolicyTableResponse:
-        return self.client.create_transit_router_forward_policy_table(CreateTransitRouterForwardPolicyTableRequest(**args))
+    def create_transit_router_forward_policy_table(self, args: dict) -> "CreateTransitRouterForwardPolicyTableResponse":
+        return self.client.create_transit_router_forward_policy_table(models.CreateTransitRouterForwardPolicyTableRequest(**args))
 
-    def associate_transit_router_forward_policy_table_to_attachment(self, args: dict) -> AssociateTransitRouterForwardPolicyTableToAttachmentResponse:
-        return self.client.associate_transit_router_forward_policy_table_to_attachment(AssociateTransitRouterForwardPolicyTableToAttachmentRequest(**args))
+    def associate_transit_router_forward_policy_table_to_attachment(self, args: dict) -> "AssociateTransitRouterForwardPolicyTableToAttachmentResponse":
+        return self.client.associate_transit_router_forward_policy_table_to_attachment(models.AssociateTransitRouterForwardPolicyTableToAttachmentRequest(**args))
 
-    def describe_transit_router_forward_policy_tables(self, args: dict) -> DescribeTransitRouterForwardPolicyTablesResponse:
-        return self.client.describe_transit_router_forward_policy_tables(DescribeTransitRouterForwardPolicyTablesRequest(**args))
+    def describe_transit_router_forward_policy_tables(self, args: dict) -> "DescribeTransitRouterForwardPolicyTablesResponse":
+        return self.client.describe_transit_router_forward_policy_tables(models.DescribeTransitRouterForwardPolicyTablesRequest(**args))
 
-    def create_transit_router_forward_policy_entry(self, args: dict) -> CreateTransitRouterForwardPolicyEntryResponse:
-        return self.client.create_transit_router_forward_policy_entry(CreateTransitRouterForwardPolicyEntryRequest(**args))
+    def create_transit_router_forward_policy_entry(self, args: dict) -> "CreateTransitRouterForwardPolicyEntryResponse":
+        return self.client.create_transit_router_forward_policy_entry(models.CreateTransitRouterForwardPolicyEntryRequest(**args))
 
-    def describe_transit_router_forward_policy_entries(self, args: dict) -> DescribeTransitRouterForwardPolicyEntriesResponse:
-        return self.client.describe_transit_router_forward_policy_entries(DescribeTransitRouterForwardPolicyEntriesRequest(**args))
+    def describe_transit_router_forward_policy_entries(self, args: dict) -> "DescribeTransitRouterForwardPolicyEntriesResponse":
+        return self.client.describe_transit_router_forward_policy_entries(models.DescribeTransitRouterForwardPolicyEntriesRequest(**args))
 
-    def create_transit_router_flow_log(self, args: dict) -> CreateTransitRouterFlowLogResponse:
-        return self.client.create_transit_router_flow_log(CreateTransitRouterFlowLogRequest(**args))
+    def create_transit_router_flow_log(self, args: dict) -> "CreateTransitRouterFlowLogResponse":
+        return self.client.create_transit_router_flow_log(models.CreateTransitRouterFlowLogRequest(**args))
 
-    def start_transit_router_flow_log(self, args: dict) -> StartTransitRouterFlowLogResponse:
-        return self.client.start_transit_router_flow_log(StartTransitRouterFlowLogRequest(**args))
+    def start_transit_router_flow_log(self, args: dict) -> "StartTransitRouterFlowLogResponse":
+        return self.client.start_transit_router_flow_log(models.StartTransitRouterFlowLogRequest(**args))
 
-    def stop_transit_router_flow_log(self, args: dict) -> StopTransitRouterFlowLogResponse:
-        return self.client.stop_transit_router_flow_log(StopTransitRouterFlowLogRequest(**args))
+    def stop_transit_router_flow_log(self, args: dict) -> "StopTransitRouterFlowLogResponse":
+        return self.client.stop_transit_router_flow_log(models.StopTransitRouterFlowLogRequest(**args))
 
-    def describe_transit_router_flow_logs(self, args: dict) -> DescribeTransitRouterFlowLogsResponse:
-        return self.client.describe_transit_router_flow_logs(DescribeTransitRouterFlowLogsRequest(**args))
+    def describe_transit_router_flow_logs(self, args: dict) -> "DescribeTransitRouterFlowLogsResponse":
+        return self.client.describe_transit_router_flow_logs(models.DescribeTransitRouterFlowLogsRequest(**args))
 
-    def create_transit_router_traffic_qos_marking_policy(self, args: dict) -> CreateTransitRouterTrafficQosMarkingPolicyResponse:
-        return self.client.create_transit_router_traffic_qos_marking_policy(CreateTransitRouterTrafficQosMarkingPolicyRequest(**args))
+    def create_transit_router_traffic_qos_marking_policy(self, args: dict) -> "CreateTransitRouterTrafficQosMarkingPolicyResponse":
+        return self.client.create_transit_router_traffic_qos_marking_policy(models.CreateTransitRouterTrafficQosMarkingPolicyRequest(**args))
 
-    def associate_transit_router_traffic_qos_marking_policy_to_attachment(self, args: dict) -> AssociateTransitRouterTrafficQosMarkingPolicyToAttachmentResponse:
-        return self.client.associate_transit_router_traffic_qos_marking_policy_to_attachment(AssociateTransitRouterTrafficQosMarkingPolicyToAttachmentRequest(**args))
+    def associate_transit_router_traffic_qos_marking_policy_to_attachment(self, args: dict) -> "AssociateTransitRouterTrafficQosMarkingPolicyToAttachmentResponse":
+        return self.client.associate_transit_router_traffic_qos_marking_policy_to_attachment(models.AssociateTransitRouterTrafficQosMarkingPolicyToAttachmentRequest(**args))
 
-    def describe_transit_router_traffic_qos_marking_policies(self, args: dict) -> DescribeTransitRouterTrafficQosMarkingPoliciesResponse:
-        return self.client.describe_transit_router_traffic_qos_marking_policies(DescribeTransitRouterTrafficQosMarkingPoliciesRequest(**args))
+    def describe_transit_router_traffic_qos_marking_policies(self, args: dict) -> "DescribeTransitRouterTrafficQosMarkingPoliciesResponse":
+        return self.client.describe_transit_router_traffic_qos_marking_policies(models.DescribeTransitRouterTrafficQosMarkingPoliciesRequest(**args))
 
-    def create_transit_router_traffic_qos_marking_entry(self, args: dict) -> CreateTransitRouterTrafficQosMarkingEntryResponse:
-        return self.client.create_transit_router_traffic_qos_marking_entry(CreateTransitRouterTrafficQosMarkingEntryRequest(**args))
+    def create_transit_router_traffic_qos_marking_entry(self, args: dict) -> "CreateTransitRouterTrafficQosMarkingEntryResponse":
+        return self.client.create_transit_router_traffic_qos_marking_entry(models.CreateTransitRouterTrafficQosMarkingEntryRequest(**args))
 
-    def describe_transit_router_traffic_qos_marking_entries(self, args: dict) -> DescribeTransitRouterTrafficQosMarkingEntriesResponse:
-        return self.client.describe_transit_router_traffic_qos_marking_entries(DescribeTransitRouterTrafficQosMarkingEntriesRequest(**args))
+    def describe_transit_router_traffic_qos_marking_entries(self, args: dict) -> "DescribeTransitRouterTrafficQosMarkingEntriesResponse":
+        return self.client.describe_transit_router_traffic_qos_marking_entries(models.DescribeTransitRouterTrafficQosMarkingEntriesRequest(**args))
 
-    def create_transit_router_traffic_qos_queue_policy(self, args: dict) -> CreateTransitRouterTrafficQosQueuePolicyResponse:
-        return self.client.create_transit_router_traffic_qos_queue_policy(CreateTransitRouterTrafficQosQueuePolicyRequest(**args))
+    def create_transit_router_traffic_qos_queue_policy(self, args: dict) -> "CreateTransitRouterTrafficQosQueuePolicyResponse":
+        return self.client.create_transit_router_traffic_qos_queue_policy(models.CreateTransitRouterTrafficQosQueuePolicyRequest(**args))
 
-    def associate_transit_router_traffic_qos_queue_policy_to_attachment(self, args: dict) -> AssociateTransitRouterTrafficQosQueuePolicyToAttachmentResponse:
-        return self.client.associate_transit_router_traffic_qos_queue_policy_to_attachment(AssociateTransitRouterTrafficQosQueuePolicyToAttachmentRequest(**args))
+    def associate_transit_router_traffic_qos_queue_policy_to_attachment(self, args: dict) -> "AssociateTransitRouterTrafficQosQueuePolicyToAttachmentResponse":
+        return self.client.associate_transit_router_traffic_qos_queue_policy_to_attachment(models.AssociateTransitRouterTrafficQosQueuePolicyToAttachmentRequest(**args))
 
-    def describe_transit_router_traffic_qos_queue_policies(self, args: dict) -> DescribeTransitRouterTrafficQosQueuePoliciesResponse:
-        return self.client.describe_transit_router_traffic_qos_queue_policies(DescribeTransitRouterTrafficQosQueuePoliciesRequest(**args))
+    def describe_transit_router_traffic_qos_queue_policies(self, args: dict) -> "DescribeTransitRouterTrafficQosQueuePoliciesResponse":
+        return self.client.describe_transit_router_traffic_qos_queue_policies(models.DescribeTransitRouterTrafficQosQueuePoliciesRequest(**args))
 
-    def create_transit_router_traffic_qos_queue_entry(self, args: dict) -> CreateTransitRouterTrafficQosQueueEntryResponse:
-        return self.client.create_transit_router_traffic_qos_queue_entry(CreateTransitRouterTrafficQosQueueEntryRequest(**args))
+    def create_transit_router_traffic_qos_queue_entry(self, args: dict) -> "CreateTransitRouterTrafficQosQueueEntryResponse":
+        return self.client.create_transit_router_traffic_qos_queue_entry(models.CreateTransitRouterTrafficQosQueueEntryRequest(**args))
 
-    def describe_transit_router_traffic_qos_queue_entries(self, args: dict) -> DescribeTransitRouterTrafficQosQueueEntriesResponse:
-        return self.client.describe_transit_router_traffic_qos_queue_entries(DescribeTransitRouterTrafficQosQueueEntriesRequest(**args))
+    def describe_transit_router_traffic_qos_queue_entries(self, args: dict) -> "DescribeTransitRouterTrafficQosQueueEntriesResponse":
+        return self.client.describe_transit_router_traffic_qos_queue_entries(models.DescribeTransitRouterTrafficQosQueueEntriesRequest(**args))
 
-    def create_transit_router_multicast_domain(self, args: dict) -> CreateTransitRouterMulticastDomainResponse:
-        return self.client.create_transit_router_multicast_domain(CreateTransitRouterMulticastDomainRequest(**args))
+    def create_transit_router_multicast_domain(self, args: dict) -> "CreateTransitRouterMulticastDomainResponse":
+        return self.client.create_transit_router_multicast_domain(models.CreateTransitRouterMulticastDomainRequest(**args))
 
-    def describe_transit_router_multicast_domains(self, args: dict) -> DescribeTransitRouterMulticastDomainsResponse:
-        return self.client.describe_transit_router_multicast_domains(DescribeTransitRouterMulticastDomainsRequest(**args))
+    def describe_transit_router_multicast_domains(self, args: dict) -> "DescribeTransitRouterMulticastDomainsResponse":
+        return self.client.describe_transit_router_multicast_domains(models.DescribeTransitRouterMulticastDomainsRequest(**args))
 
-    def associate_transit_router_multicast_domain(self, args: dict) -> AssociateTransitRouterMulticastDomainResponse:
-        return self.client.associate_transit_router_multicast_domain(AssociateTransitRouterMulticastDomainRequest(**args))
+    def associate_transit_router_multicast_domain(self, args: dict) -> "AssociateTransitRouterMulticastDomainResponse":
+        return self.client.associate_transit_router_multicast_domain(models.AssociateTransitRouterMulticastDomainRequest(**args))
 
-    def describe_transit_router_multicast_domain_associations(self, args: dict) -> DescribeTransitRouterMulticastDomainAssociationsResponse:
-        return self.client.describe_transit_router_multicast_domain_associations(DescribeTransitRouterMulticastDomainAssociationsRequest(**args))
+    def describe_transit_router_multicast_domain_associations(self, args: dict) -> "DescribeTransitRouterMulticastDomainAssociationsResponse":
+        return self.client.describe_transit_router_multicast_domain_associations(models.DescribeTransitRouterMulticastDomainAssociationsRequest(**args))
 
-    def create_transit_router_multicast_group_member(self, args: dict) -> CreateTransitRouterMulticastGroupMemberResponse:
-        return self.client.create_transit_router_multicast_group_member(CreateTransitRouterMulticastGroupMemberRequest(**args))
+    def create_transit_router_multicast_group_member(self, args: dict) -> "CreateTransitRouterMulticastGroupMemberResponse":
+        return self.client.create_transit_router_multicast_group_member(models.CreateTransitRouterMulticastGroupMemberRequest(**args))
 
-    def create_transit_router_multicast_group_source(self, args: dict) -> CreateTransitRouterMulticastGroupSourceResponse:
-        return self.client.create_transit_router_multicast_group_source(CreateTransitRouterMulticastGroupSourceRequest(**args))
+    def create_transit_router_multicast_group_source(self, args: dict) -> "CreateTransitRouterMulticastGroupSourceResponse":
+        return self.client.create_transit_router_multicast_group_source(models.CreateTransitRouterMulticastGroupSourceRequest(**args))
 
-    def describe_transit_router_multicast_groups(self, args: dict) -> DescribeTransitRouterMulticastGroupsResponse:
-        return self.client.describe_transit_router_multicast_groups(DescribeTransitRouterMulticastGroupsRequest(**args))
+    def describe_transit_router_multicast_groups(self, args: dict) -> "DescribeTransitRouterMulticastGroupsResponse":
+        return self.client.describe_transit_router_multicast_groups(models.DescribeTransitRouterMulticastGroupsRequest(**args))
 
-    def describe_transit_router_regions(self, args: dict) -> DescribeTransitRouterRegionsResponse:
-        return self.client.describe_transit_router_regions(DescribeTransitRouterRegionsRequest(**args))
+    def describe_transit_router_regions(self, args: dict) -> "DescribeTransitRouterRegionsResponse":
+        return self.client.describe_transit_router_regions(models.DescribeTransitRouterRegionsRequest(**args))
 
-    def create_transit_router_bandwidth_package(self, args: dict) -> CreateTransitRouterBandwidthPackageResponse:
-        return self.client.create_transit_router_bandwidth_package(CreateTransitRouterBandwidthPackageRequest(**args))
+    def create_transit_router_bandwidth_package(self, args: dict) -> "CreateTransitRouterBandwidthPackageResponse":
+        return self.client.create_transit_router_bandwidth_package(models.CreateTransitRouterBandwidthPackageRequest(**args))
 
-    def renew_transit_router_bandwidth_package(self, args: dict) -> RenewTransitRouterBandwidthPackageResponse:
-        return self.client.renew_transit_router_bandwidth_package(RenewTransitRouterBandwidthPackageRequest(**args))
+    def renew_transit_router_bandwidth_package(self, args: dict) -> "RenewTransitRouterBandwidthPackageResponse":
+        return self.client.renew_transit_router_bandwidth_package(models.RenewTransitRouterBandwidthPackageRequest(**args))
 
-    def set_transit_router_bandwidth_package_renewal(self, args: dict) -> SetTransitRouterBandwidthPackageRenewalResponse:
-        return self.client.set_transit_router_bandwidth_package_renewal(SetTransitRouterBandwidthPackageRenewalRequest(**args))
+    def set_transit_router_bandwidth_package_renewal(self, args: dict) -> "SetTransitRouterBandwidthPackageRenewalResponse":
+        return self.client.set_transit_router_bandwidth_package_renewal(models.SetTransitRouterBandwidthPackageRenewalRequest(**args))
 
-    def describe_transit_router_bandwidth_packages(self, args: dict) -> DescribeTransitRouterBandwidthPackagesResponse:
-        return self.client.describe_transit_router_bandwidth_packages(DescribeTransitRouterBandwidthPackagesRequest(**args))
+    def describe_transit_router_bandwidth_packages(self, args: dict) -> "DescribeTransitRouterBandwidthPackagesResponse":
+        return self.client.describe_transit_router_bandwidth_packages(models.DescribeTransitRouterBandwidthPackagesRequest(**args))
 
-    def describe_transit_router_bandwidth_packages_billing(self, args: dict) -> DescribeTransitRouterBandwidthPackagesBillingResponse:
-        return self.client.describe_transit_router_bandwidth_packages_billing(DescribeTransitRouterBandwidthPackagesBillingRequest(**args))
+    def describe_transit_router_bandwidth_packages_billing(self, args: dict) -> "DescribeTransitRouterBandwidthPackagesBillingResponse":
+        return self.client.describe_transit_router_bandwidth_packages_billing(models.DescribeTransitRouterBandwidthPackagesBillingRequest(**args))
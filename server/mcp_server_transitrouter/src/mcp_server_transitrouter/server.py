@@ -3,6 +3,7 @@ import os
 
 from typing import Any, List, Optional, Dict
 from mcp.server.fastmcp import FastMCP
+from mcp_server_transitrouter.base.profile import is_enabled
 from mcp_server_transitrouter.base.transitrouter import TRSDK
 
 logger = logging.getLogger(__name__)
@@ -13,7 +14,14 @@ mcp = FastMCP("TR MCP Server", port=int(os.getenv("PORT", "8008")))
 tr_resource = TRSDK()
 
 
-@mcp.tool(
+def tool(name: str, description: str):
+    """注册工具，未被 MCP_TR_PROFILE / MCP_TR_TOOLS 选中的工具不注册"""
+    if is_enabled(name):
+        return mcp.tool(name=name, description=description)
+    return lambda fn: fn
+
+
+@tool(
     name="create_transit_router",
     description="创建一个中转路由器实例"
 )
@@ -53,7 +61,7 @@ def create_transit_router(
     resp = tr_resource.create_transit_router(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_routers",
     description="查询满足指定条件的中转路由器实例"
 )
@@ -80,7 +88,7 @@ def describe_transit_routers(
     resp = tr_resource.describe_transit_routers(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_attachments",
     description="查询满足指定条件的网络实例连接"
 )
@@ -119,7 +127,7 @@ def describe_transit_router_attachments(
     resp = tr_resource.describe_transit_router_attachments(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_vpc_attachment",
     description="创建一个VPC类型的网络实例连接"
 )
@@ -170,7 +178,7 @@ def create_transit_router_vpc_attachment(
     resp = tr_resource.create_transit_router_vpc_attachment(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_vpc_attachments",
     description="查询满足指定条件的VPC类型网络实例连接"
 )
@@ -197,7 +205,7 @@ def describe_transit_router_vpc_attachments(
     resp = tr_resource.describe_transit_router_vpc_attachments(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_vpn_attachment",
     description="创建一个VPN类型的网络实例连接"
 )
@@ -233,7 +241,7 @@ def create_transit_router_vpn_attachment(
     resp = tr_resource.create_transit_router_vpn_attachment(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_vpn_attachments",
     description="查询满足指定条件的VPN类型网络实例连接"
 )
@@ -260,7 +268,7 @@ def describe_transit_router_vpn_attachments(
     resp = tr_resource.describe_transit_router_vpn_attachments(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_direct_connect_gateway_attachment",
     description="创建一个专线网关类型的网络实例连接"
 )
@@ -296,7 +304,7 @@ def create_transit_router_direct_connect_gateway_attachment(
     resp = tr_resource.create_transit_router_direct_connect_gateway_attachment(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_direct_connect_gateway_attachments",
     description="查询满足指定条件的专线网关类型网络实例连接"
 )
@@ -323,7 +331,7 @@ def describe_transit_router_direct_connect_gateway_attachments(
     resp = tr_resource.describe_transit_router_direct_connect_gateway_attachments(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_peer_attachment",
     description="创建一个跨地域连接"
 )
@@ -368,7 +376,7 @@ def create_transit_router_peer_attachment(
     resp = tr_resource.create_transit_router_peer_attachment(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_peer_attachments",
     description="查询满足指定条件的跨地域连接"
 )
@@ -397,7 +405,7 @@ def describe_transit_router_peer_attachments(
     resp = tr_resource.describe_transit_router_peer_attachments(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_route_table",
     description="创建一个路由表"
 )
@@ -427,7 +435,7 @@ def create_transit_router_route_table(
     resp = tr_resource.create_transit_router_route_table(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_route_tables",
     description="查询满足指定条件的路由表"
 )
@@ -453,7 +461,7 @@ def describe_transit_router_route_tables(
     resp = tr_resource.describe_transit_router_route_tables(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_route_entry",
     description="创建一条静态路由条目"
 )
@@ -489,7 +497,7 @@ def create_transit_router_route_entry(
     resp = tr_resource.create_transit_router_route_entry(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_route_entries",
     description="查询满足指定条件的路由条目"
 )
@@ -530,7 +538,7 @@ def describe_transit_router_route_entries(
     resp = tr_resource.describe_transit_router_route_entries(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="associate_transit_router_attachment_to_route_table",
     description="为指定的网络实例连接关联路由表"
 )
@@ -554,7 +562,7 @@ def associate_transit_router_attachment_to_route_table(
     resp = tr_resource.associate_transit_router_attachment_to_route_table(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_route_table_associations",
     description="查询满足指定条件的关联转发"
 )
@@ -577,7 +585,7 @@ def describe_transit_router_route_table_associations(
     resp = tr_resource.describe_transit_router_route_table_associations(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="enable_transit_router_route_table_propagation",
     description="为指定的网络实例连接启用路由传播"
 )
@@ -601,7 +609,7 @@ def enable_transit_router_route_table_propagation(
     resp = tr_resource.enable_transit_router_route_table_propagation(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_route_table_propagations",
     description="查询满足指定条件的路由表传播"
 )
@@ -624,7 +632,7 @@ def describe_transit_router_route_table_propagations(
     resp = tr_resource.describe_transit_router_route_table_propagations(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_route_policy_table",
     description="创建路由策略"
 )
@@ -656,7 +664,7 @@ def create_transit_router_route_policy_table(
     resp = tr_resource.create_transit_router_route_policy_table(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="associate_transit_router_route_policy_to_route_table",
     description="关联路由策略到路由表"
 )
@@ -679,7 +687,7 @@ def associate_transit_router_route_policy_to_route_table(
     resp = tr_resource.associate_transit_router_route_policy_to_route_table(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_route_policy_tables",
     description="查询满足指定条件的路由策略。"
 )
@@ -708,7 +716,7 @@ def describe_transit_router_route_policy_tables(
     resp = tr_resource.describe_transit_router_route_policy_tables(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_route_policy_entry",
     description="创建路由策略条目"
 )
@@ -761,7 +769,7 @@ def create_transit_router_route_policy_entry(
     resp = tr_resource.create_transit_router_route_policy_entry(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_route_policy_entries",
     description="查询满足指定条件的路由策略条目"
 )
@@ -784,7 +792,7 @@ def describe_transit_router_route_policy_entries(
     resp = tr_resource.describe_transit_router_route_policy_entries(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_forward_policy_table",
     description="为指定中转路由器创建一个转发策略"
 )
@@ -813,7 +821,7 @@ def create_transit_router_forward_policy_table(
     resp = tr_resource.create_transit_router_forward_policy_table(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_forward_policy_tables",
     description="查询满足指定条件的转发策略表"
 )
@@ -839,7 +847,7 @@ def describe_transit_router_forward_policy_tables(
     resp = tr_resource.describe_transit_router_forward_policy_tables(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="associate_transit_router_forward_policy_table_to_attachment",
     description="转发策略表关联网络实例连接"
 )
@@ -862,7 +870,7 @@ def associate_transit_router_forward_policy_table_to_attachment(
     resp = tr_resource.associate_transit_router_forward_policy_table_to_attachment(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_forward_policy_entry",
     description="创建转发策略规则"
 )
@@ -915,7 +923,7 @@ def create_transit_router_forward_policy_entry(
     resp = tr_resource.create_transit_router_forward_policy_entry(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_forward_policy_entries",
     description="查询满足指定条件的转发策略规则"
 )
@@ -944,7 +952,7 @@ def describe_transit_router_forward_policy_entries(
     resp = tr_resource.describe_transit_router_forward_policy_entries(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_flow_log",
     description="创建流日志"
 )
@@ -994,7 +1002,7 @@ def create_transit_router_flow_log(
     resp = tr_resource.create_transit_router_flow_log(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="start_transit_router_flow_log",
     description="启动流日志"
 )
@@ -1014,7 +1022,7 @@ def start_transit_router_flow_log(
     resp = tr_resource.start_transit_router_flow_log(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="stop_transit_router_flow_log",
     description="停止流日志采集"
 )
@@ -1035,7 +1043,7 @@ def stop_transit_router_flow_log(
     resp = tr_resource.stop_transit_router_flow_log(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_flow_logs",
     description="查询流日志"
 )
@@ -1085,7 +1093,7 @@ def describe_transit_router_flow_logs(
     resp = tr_resource.describe_transit_router_flow_logs(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_traffic_qos_marking_policy",
     description="创建流标记策略"
 )
@@ -1114,7 +1122,7 @@ def create_transit_router_traffic_qos_marking_policy(
     resp = tr_resource.create_transit_router_traffic_qos_marking_policy(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="associate_transit_router_traffic_qos_marking_policy_to_attachment",
     description="绑定流标记策略至TR连接"
 )
@@ -1137,7 +1145,7 @@ def associate_transit_router_traffic_qos_marking_policy_to_attachment(
     resp = tr_resource.associate_transit_router_traffic_qos_marking_policy_to_attachment(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_traffic_qos_marking_policies",
     description="查询满足指定条件的流量调度策略。"
 )
@@ -1163,7 +1171,7 @@ def describe_transit_router_traffic_qos_marking_policies(
     resp = tr_resource.describe_transit_router_traffic_qos_marking_policies(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_traffic_qos_marking_entry",
     description="添加流标记规则"
 )
@@ -1222,7 +1230,7 @@ def create_transit_router_traffic_qos_marking_entry(
     resp = tr_resource.create_transit_router_traffic_qos_marking_entry(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_traffic_qos_marking_entries",
     description="查询满足指定条件的流标记规则。"
 )
@@ -1248,7 +1256,7 @@ def describe_transit_router_traffic_qos_marking_entries(
     resp = tr_resource.describe_transit_router_traffic_qos_marking_entries(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_traffic_qos_queue_policy",
     description="创建流队列策略"
 )
@@ -1277,7 +1285,7 @@ def create_transit_router_traffic_qos_queue_policy(
     resp = tr_resource.create_transit_router_traffic_qos_queue_policy(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="associate_transit_router_traffic_qos_queue_policy_to_attachment",
     description="绑定流队列策略至TR连接"
 )
@@ -1300,7 +1308,7 @@ def associate_transit_router_traffic_qos_queue_policy_to_attachment(
     resp = tr_resource.associate_transit_router_traffic_qos_queue_policy_to_attachment(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_traffic_qos_queue_policies",
     description="查询满足指定条件的流量调度策略。"
 )
@@ -1326,7 +1334,7 @@ def describe_transit_router_traffic_qos_queue_policies(
     resp = tr_resource.describe_transit_router_traffic_qos_queue_policies(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_traffic_qos_queue_entry",
     description="添加流队列"
 )
@@ -1361,7 +1369,7 @@ def create_transit_router_traffic_qos_queue_entry(
     resp = tr_resource.create_transit_router_traffic_qos_queue_entry(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_traffic_qos_queue_entries",
     description="查询满足指定条件的流队列。"
 )
@@ -1387,7 +1395,7 @@ def describe_transit_router_traffic_qos_queue_entries(
     resp = tr_resource.describe_transit_router_traffic_qos_queue_entries(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_multicast_domain",
     description="创建组播域"
 )
@@ -1419,7 +1427,7 @@ def create_transit_router_multicast_domain(
     resp = tr_resource.create_transit_router_multicast_domain(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_multicast_domains",
     description="查询组播域列表"
 )
@@ -1454,7 +1462,7 @@ def describe_transit_router_multicast_domains(
     resp = tr_resource.describe_transit_router_multicast_domains(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="associate_transit_router_multicast_domain",
     description="组播域关联子网"
 )
@@ -1480,7 +1488,7 @@ def associate_transit_router_multicast_domain(
     resp = tr_resource.associate_transit_router_multicast_domain(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_multicast_domain_associations",
     description="查询组播域关联关系"
 )
@@ -1518,7 +1526,7 @@ def describe_transit_router_multicast_domain_associations(
     resp = tr_resource.describe_transit_router_multicast_domain_associations(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_multicast_group_member",
     description="创建组播组成员"
 )
@@ -1547,7 +1555,7 @@ def create_transit_router_multicast_group_member(
     resp = tr_resource.create_transit_router_multicast_group_member(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_multicast_group_source",
     description="创建组播组源"
 )
@@ -1576,7 +1584,7 @@ def create_transit_router_multicast_group_source(
     resp = tr_resource.create_transit_router_multicast_group_source(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_multicast_groups",
     description="查询组播组列表"
 )
@@ -1632,7 +1640,7 @@ def describe_transit_router_multicast_groups(
     resp = tr_resource.describe_transit_router_multicast_groups(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_regions",
     description="查询中转路由器地域信息"
 )
@@ -1655,7 +1663,7 @@ def describe_transit_router_regions(
     resp = tr_resource.describe_transit_router_regions(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="create_transit_router_bandwidth_package",
     description="创建中转路由器带宽包"
 )
@@ -1708,7 +1716,7 @@ def create_transit_router_bandwidth_package(
     resp = tr_resource.create_transit_router_bandwidth_package(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="renew_transit_router_bandwidth_package",
     description="续费中转路由器带宽包"
 )
@@ -1734,7 +1742,7 @@ def renew_transit_router_bandwidth_package(
     resp = tr_resource.renew_transit_router_bandwidth_package(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="set_transit_router_bandwidth_package_renewal",
     description="设置中转路由器带宽包续费类型"
 )
@@ -1763,7 +1771,7 @@ def set_transit_router_bandwidth_package_renewal(
     resp = tr_resource.set_transit_router_bandwidth_package_renewal(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_bandwidth_packages",
     description="查询满足指定条件的中转路由器带宽包。"
 )
@@ -1795,7 +1803,7 @@ def describe_transit_router_bandwidth_packages(
     resp = tr_resource.describe_transit_router_bandwidth_packages(req)
     return resp.to_dict()
 
-@mcp.tool(
+@tool(
     name="describe_transit_router_bandwidth_packages_billing",
     description="查询中转路由器带宽包计费方式列表"
 )
@@ -16,13 +16,9 @@ limitations under the License.
 """
 
 import datetime
-import hashlib
-import hmac
 import json
 import os
-from urllib.parse import quote
 import base64
-import requests
 import datetime
 import os
 import base64
@@ -32,6 +28,9 @@ from mcp.server.session import ServerSession
 from mcp.server.fastmcp import Context
 from starlette.requests import Request
 
+from . import transport
+from .signer import sign_request
+
 logger = logging.getLogger(__name__)
 
 # 以下参数视服务不同而不同，一个服务内通常是一致的
@@ -56,34 +55,9 @@ SK = os.getenv(SK_KEY) or os.getenv(ALT_SK_KEY)
 # SessionToken = ""
 
 
-def norm_query(params):
-    query = ""
-    for key in sorted(params.keys()):
-        if type(params[key]) == list:
-            for k in params[key]:
-                query = (
-                        query + quote(key, safe="-_.~") + "=" + quote(k, safe="-_.~") + "&"
-                )
-        else:
-            query = (query + quote(key, safe="-_.~") + "=" + quote(params[key], safe="-_.~") + "&")
-    query = query[:-1]
-    return query.replace("+", "%20")
-
-
-# 第一步：准备辅助函数。
-# sha256 非对称加密
-def hmac_sha256(key: bytes, content: str):
-    return hmac.new(key, content.encode("utf-8"), hashlib.sha256).digest()
-
-
-# sha256 hash算法
-def hash_sha256(content: str):
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
-
-
-# 第二步：签名请求函数
+# 签名请求函数
 def request(method, date, query, header, ak, sk, token, action, body, region = None, timeout=None):
-    # 第三步：创建身份证明。其中的 Service 和 Region 字段是固定的。ak 和 sk 分别代表
+    # 第一步：创建身份证明。其中的 Service 和 Region 字段是固定的。ak 和 sk 分别代表
     # AccessKeyID 和 SecretAccessKey。同时需要初始化签名结构体。一些签名计算时需要的属性也在这里处理。
     # 初始化身份证明结构体
 
@@ -123,72 +97,21 @@ def request(method, date, query, header, ak, sk, token, action, body, region = N
     }
     if body is None:
         request_param["body"] = ""
-    # 第四步：接下来开始计算签名。在计算签名前，先准备好用于接收签算结果的 signResult 变量，并设置一些参数。
-    # 初始化签名结果的结构体
-    x_date = request_param["date"].strftime("%Y%m%dT%H%M%SZ")
-    short_x_date = x_date[:8]
-    x_content_sha256 = hash_sha256(request_param["body"])
-    sign_result = {
-        "Host": request_param["host"],
-        "X-Content-Sha256": x_content_sha256,
-        "X-Date": x_date,
-        "Content-Type": request_param["content_type"],
-    }
-    # 第五步：计算 Signature 签名。
-    signed_headers_str = ";".join(
-        ["content-type", "host", "x-content-sha256", "x-date"]
-    )
-    # signed_headers_str = signed_headers_str + ";x-security-token"
-    canonical_request_str = "\n".join(
-        [request_param["method"].upper(),
-         request_param["path"],
-         norm_query(request_param["query"]),
-         "\n".join(
-             [
-                 "content-type:" + request_param["content_type"],
-                 "host:" + request_param["host"],
-                 "x-content-sha256:" + x_content_sha256,
-                 "x-date:" + x_date,
-             ]
-         ),
-         "",
-         signed_headers_str,
-         x_content_sha256,
-         ]
-    )
-
-    # 打印正规化的请求用于调试比对
-    logger.debug("canonical_request=%s", canonical_request_str)
-    hashed_canonical_request = hash_sha256(canonical_request_str)
-
-    # 打印hash值用于调试比对
-    logger.debug("hashed_canonical_request=%s", hashed_canonical_request)
-    credential_scope = "/".join([short_x_date, credential["region"], credential["service"], "request"])
-    string_to_sign = "\n".join(["HMAC-SHA256", x_date, credential_scope, hashed_canonical_request])
-
-    # 打印最终计算的签名字符串用于调试比对
-    logger.debug("string_to_sign=%s", string_to_sign)
-    k_date = hmac_sha256(credential["secret_access_key"].encode("utf-8"), short_x_date)
-    k_region = hmac_sha256(k_date, credential["region"])
-    k_service = hmac_sha256(k_region, credential["service"])
-    k_signing = hmac_sha256(k_service, "request")
-    signature = hmac_sha256(k_signing, string_to_sign).hex()
-
-    sign_result["Authorization"] = "HMAC-SHA256 Credential={}, SignedHeaders={}, Signature={}".format(
-        credential["access_key_id"] + "/" + credential_scope,
-        signed_headers_str,
-        signature,
-    )
+    # 第二步：计算签名，签名密钥按 (SK, 日期, Region, Service) 缓存
+    sign_result = sign_request(request_param["method"], request_param["host"], request_param["path"],
+                               request_param["query"], request_param["body"], request_param["content_type"],
+                               credential["access_key_id"], credential["secret_access_key"],
+                               credential["region"], credential["service"], request_param["date"])
     header = {**header, **sign_result}
     header = {**header, **{"X-Security-Token": token}}
-    # 第六步：将 Signature 签名写入 HTTP Header 中，并发送 HTTP 请求。
-    r = requests.request(method=method,
-                         url="https://{}{}".format(request_param["host"], request_param["path"]),
-                         headers=header,
-                         params=request_param["query"],
-                         data=request_param["body"],
-                         timeout=request_param["timeout"],
-                         )
+    # 第三步：将 Signature 签名写入 HTTP Header 中，通过共享连接池发送 HTTP 请求。
+    r = transport.request(method=method,
+                          url="https://{}{}".format(request_param["host"], request_param["path"]),
+                          headers=header,
+                          params=request_param["query"],
+                          data=request_param["body"],
+                          timeout=request_param["timeout"],
+                          )
     return r.json()
 
 
@@ -1,10 +1,10 @@
 import os
 from volcengine.imagex.v2.imagex_service import ImagexService
+from base.async_trait import AsyncTraitMixin
 from .config import *
-import json
 
 
-class ImagexAPI(ImagexService):
+class ImagexAPI(AsyncTraitMixin, ImagexService):
     def __init__(self):
         if os.getenv("VOLCENGINE_REGION") is None:
             region = "cn-north-1"
@@ -19,17 +19,3 @@ class ImagexAPI(ImagexService):
         self.domain = os.getenv("DOMAIN_NAME")
         self.set_connection_timeout(100)
         self.set_socket_timeout(100)
-
-    def mcp_get(self, action, params={}, doseq=0):
-        res = self.get(action, params, doseq)
-        if res == "":
-            raise Exception("%s: empty response" % action)
-        res_json = json.loads(json.dumps(res))
-        return res_json
-
-    def mcp_post(self, action, params={}, body={}):
-        res = self.json(action, params, body)
-        if res == "":
-            raise Exception("%s: empty response" % action)
-        res_json = json.loads(json.dumps(res))
-        return res_json
@@ -1,11 +1,18 @@
 from .api.api import ImagexAPI
 from .note import note
+from .metric_cache import MetricSpec, cache
 from utils.response import HandlerVolcResponse
 import json
 
 
 def create_api_mcp_server(mcp):
     service = ImagexAPI()
+    account = service.service_info.credentials.ak
+    # 指定了 Interval 的用量查询中已结算的时间桶缓存在本地，只请求未缓存的尾部
+    series = MetricSpec()
+
+    def get(action):
+        return lambda sub: json.loads(service.mcp_get(action, sub, json.dumps({})))
     
     @mcp.tool()
     def get_note(func_name: str) -> str:
@@ -50,9 +57,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_domain_traffic_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_domain_traffic_data
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXDomainTrafficData", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXDomainTrafficData", params, series, get("McpDescribeImageXDomainTrafficData")
         )
 
         return HandlerVolcResponse(reqs)
@@ -64,9 +72,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_domain_bandwidth_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_domain_bandwidth_data
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXDomainBandwidthData", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXDomainBandwidthData", params, series, get("McpDescribeImageXDomainBandwidthData")
         )
 
         return HandlerVolcResponse(reqs)
@@ -78,9 +87,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_billing_request_cnt_usage" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_billing_request_cnt_usage
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXBillingRequestCntUsage", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXBillingRequestCntUsage", params, series, get("McpDescribeImageXBillingRequestCntUsage")
         )
 
         return HandlerVolcResponse(reqs)
@@ -92,9 +102,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_request_cnt_usage" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_request_cnt_usage
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXRequestCntUsage", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXRequestCntUsage", params, series, get("McpDescribeImageXRequestCntUsage")
         )
 
         return HandlerVolcResponse(reqs)
@@ -106,8 +117,11 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_base_op_usage" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_base_op_usage
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get("McpDescribeImageXBaseOpUsage", params, json.dumps({}))
+        reqs = cache.fetch(
+            account, "McpDescribeImageXBaseOpUsage", params, series, get("McpDescribeImageXBaseOpUsage")
+        )
 
         return HandlerVolcResponse(reqs)
 
@@ -118,8 +132,11 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_compress_usage" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_compress_usage
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get("McpDescribeImageXCompressUsage", params, json.dumps({}))
+        reqs = cache.fetch(
+            account, "McpDescribeImageXCompressUsage", params, series, get("McpDescribeImageXCompressUsage")
+        )
 
         return HandlerVolcResponse(reqs)
 
@@ -130,9 +147,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_screenshot_usage" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_screenshot_usage
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXScreenshotUsage", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXScreenshotUsage", params, series, get("McpDescribeImageXScreenshotUsage")
         )
 
         return HandlerVolcResponse(reqs)
@@ -144,9 +162,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_video_clip_duration_usage" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_video_clip_duration_usage
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXVideoClipDurationUsage", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXVideoClipDurationUsage", params, series, get("McpDescribeImageXVideoClipDurationUsage")
         )
 
         return HandlerVolcResponse(reqs)
@@ -158,9 +177,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_multi_compress_usage" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_multi_compress_usage
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXMultiCompressUsage", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXMultiCompressUsage", params, series, get("McpDescribeImageXMultiCompressUsage")
         )
 
         return HandlerVolcResponse(reqs)
@@ -172,8 +192,11 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_edge_request" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_edge_request
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get("McpDescribeImageXEdgeRequest", params, json.dumps({}))
+        reqs = cache.fetch(
+            account, "McpDescribeImageXEdgeRequest", params, series, get("McpDescribeImageXEdgeRequest")
+        )
 
         return HandlerVolcResponse(reqs)
 
@@ -184,9 +207,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_edge_request_bandwidth" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_edge_request_bandwidth
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXEdgeRequestBandwidth", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXEdgeRequestBandwidth", params, series, get("McpDescribeImageXEdgeRequestBandwidth")
         )
 
         return HandlerVolcResponse(reqs)
@@ -198,9 +222,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_edge_request_traffic" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_edge_request_traffic
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXEdgeRequestTraffic", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXEdgeRequestTraffic", params, series, get("McpDescribeImageXEdgeRequestTraffic")
         )
 
         return HandlerVolcResponse(reqs)
@@ -226,9 +251,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_server_qps_usage" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_server_qps_usage
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXServerQPSUsage", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXServerQPSUsage", params, series, get("McpDescribeImageXServerQPSUsage")
         )
 
         return HandlerVolcResponse(reqs)
@@ -240,9 +266,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_hit_rate_traffic_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_hit_rate_traffic_data
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXHitRateTrafficData", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXHitRateTrafficData", params, series, get("McpDescribeImageXHitRateTrafficData")
         )
 
         return HandlerVolcResponse(reqs)
@@ -254,9 +281,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_hit_rate_request_data" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_hit_rate_request_data
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXHitRateRequestData", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXHitRateRequestData", params, series, get("McpDescribeImageXHitRateRequestData")
         )
 
         return HandlerVolcResponse(reqs)
@@ -299,9 +327,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_bucket_retrieval_usage" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_bucket_retrieval_usage
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXBucketRetrievalUsage", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXBucketRetrievalUsage", params, series, get("McpDescribeImageXBucketRetrievalUsage")
         )
 
         return HandlerVolcResponse(reqs)
@@ -314,8 +343,11 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_source_request" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_source_request
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get("McpDescribeImageXSourceRequest", params, json.dumps({}))
+        reqs = cache.fetch(
+            account, "McpDescribeImageXSourceRequest", params, series, get("McpDescribeImageXSourceRequest")
+        )
 
         return HandlerVolcResponse(reqs)
 
@@ -326,9 +358,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_source_request_bandwidth" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_source_request_bandwidth
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXSourceRequestBandwidth", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXSourceRequestBandwidth", params, series, get("McpDescribeImageXSourceRequestBandwidth")
         )
 
         return HandlerVolcResponse(reqs)
@@ -340,9 +373,10 @@ def create_api_mcp_server(mcp):
         Call steps:
         1. Pass "describe_imagex_source_request_traffic" as an input parameter to invoke the `get_note` method to obtain the parameter description.
         2. After obtaining the parameter description, invoke  describe_imagex_source_request_traffic
+        已结算（默认 12 小时之前）的时间桶缓存在本地磁盘上，只请求未缓存的部分。
         """
-        reqs = service.mcp_get(
-            "McpDescribeImageXSourceRequestTraffic", params, json.dumps({})
+        reqs = cache.fetch(
+            account, "McpDescribeImageXSourceRequestTraffic", params, series, get("McpDescribeImageXSourceRequestTraffic")
         )
 
         return HandlerVolcResponse(reqs)
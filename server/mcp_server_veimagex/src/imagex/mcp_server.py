@@ -1,31 +1,18 @@
 from mcp.server.fastmcp import FastMCP
 from .api.api import ImagexAPI
+from utils.response import Error, HandlerVolcResponse
 import uuid
 import json
 
 
-def Error(message: str):
-    return "API Error: " + message
-
-
-def HandlerVolcResponse(response: dict):
-    if (
-        response
-        and hasattr(response, "ResponseMetadata")
-        and response.ResponseMetadata
-        and hasattr(response.ResponseMetadata, "Error")
-        and response.ResponseMetadata.Error
-    ):
-        return Error(response.ResponseMetadata.Error.Message)
-    return str(response)
-
-
 def create_mcp_server():
     mcp = FastMCP(
         "VeImageX MCP",
         instructions="Volcengine(火山引擎) ImageX(图片服务) MCP , 你的图片处理存储分发助手",
     )
     imagex_service = ImagexAPI()
+    # 同步工具在线程池中执行，请求经由事件循环上的异步连接池发送
+    imagex_service.offload_sync_tools(mcp)
     service_id = imagex_service.service_id
     domain = imagex_service.domain
 